@@ -0,0 +1,43 @@
+"""Add quota counters and case-insensitive project name index
+
+Revision ID: 8c4e1a6b2d90
+Revises: 3f2b7c9d1e4a
+Create Date: 2026-10-17 10:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e1a6b2d90'
+down_revision: Union[str, Sequence[str], None] = '3f2b7c9d1e4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('counters',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('value', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute("INSERT INTO counters (name, value) SELECT 'projects', count(*) FROM projects")
+
+    op.add_column('projects', sa.Column('task_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE projects SET task_count = "
+        "(SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id)"
+    )
+
+    op.create_index('ux_projects_lower_name', 'projects', [sa.text('lower(name)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_projects_lower_name', table_name='projects')
+    op.drop_column('projects', 'task_count')
+    op.drop_table('counters')
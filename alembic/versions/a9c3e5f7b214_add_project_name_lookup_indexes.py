@@ -0,0 +1,53 @@
+"""Add prefix and trigram indexes for project name lookup
+
+Revision ID: a9c3e5f7b214
+Revises: f4a1d9e7b352
+Create Date: 2026-10-17 16:31:05.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3e5f7b214'
+down_revision: Union[str, Sequence[str], None] = 'f4a1d9e7b352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm ships with PostgreSQL's contrib modules and is trusted, so
+    # the database owner may install it
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built without the SHARE lock of a plain CREATE INDEX, which would
+    # hold up project creates and renames for the length of the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_projects_lower_name_pattern', 'projects',
+            [sa.text('lower(name) text_pattern_ops')], unique=False,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_projects_lower_name_trgm', 'projects',
+            [sa.text('lower(name) gist_trgm_ops')], unique=False,
+            postgresql_using='gist',
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_projects_lower_name_trgm', table_name='projects',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_projects_lower_name_pattern', table_name='projects',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    # The extension is left installed; other objects may depend on it
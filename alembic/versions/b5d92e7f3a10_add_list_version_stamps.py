@@ -0,0 +1,30 @@
+"""Add version stamps for the project and task lists
+
+Revision ID: b5d92e7f3a10
+Revises: 8c4e1a6b2d90
+Create Date: 2026-10-17 12:41:08.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d92e7f3a10'
+down_revision: Union[str, Sequence[str], None] = '8c4e1a6b2d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+    op.execute("INSERT INTO counters (name, value) VALUES ('projects_version', 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM counters WHERE name = 'projects_version'")
+    op.drop_column('projects', 'version')
@@ -0,0 +1,39 @@
+"""Add partial index on the deadlines of open tasks
+
+Revision ID: d7a3c5e91f24
+Revises: b5d92e7f3a10
+Create Date: 2026-10-17 14:22:53.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c5e91f24'
+down_revision: Union[str, Sequence[str], None] = 'b5d92e7f3a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only open tasks are indexed, but the build still reads every task;
+    # CONCURRENTLY lets task writes and the autoclose job run meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_open_deadline', 'tasks', ['deadline'], unique=False,
+            postgresql_where=sa.text("closed_at IS NULL AND status <> 'done'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_open_deadline', table_name='tasks',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""Add per-status task counters to projects
+
+Revision ID: e2f8b4c6a913
+Revises: d7a3c5e91f24
+Create Date: 2026-10-17 15:02:44.530117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f8b4c6a913'
+down_revision: Union[str, Sequence[str], None] = 'd7a3c5e91f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('todo_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('projects', sa.Column('doing_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('projects', sa.Column('done_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE projects SET
+            todo_count = counts.todo,
+            doing_count = counts.doing,
+            done_count = counts.done
+        FROM (
+            SELECT project_id,
+                   count(*) FILTER (WHERE status = 'todo') AS todo,
+                   count(*) FILTER (WHERE status = 'doing') AS doing,
+                   count(*) FILTER (WHERE status = 'done') AS done
+            FROM tasks
+            GROUP BY project_id
+        ) AS counts
+        WHERE projects.id = counts.project_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'done_count')
+    op.drop_column('projects', 'doing_count')
+    op.drop_column('projects', 'todo_count')
@@ -0,0 +1,51 @@
+"""Add a full-text search vector to tasks
+
+Revision ID: f4a1d9e7b352
+Revises: e2f8b4c6a913
+Create Date: 2026-10-17 15:48:12.604381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a1d9e7b352'
+down_revision: Union[str, Sequence[str], None] = 'e2f8b4c6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites the table under an exclusive
+    # lock; on a large deployment run this in a maintenance window.
+    op.add_column('tasks', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', title), 'A') || "
+            "setweight(to_tsvector('simple', description), 'B')",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    # Built concurrently so writes resume as soon as the column exists
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector', 'tasks', ['search_vector'], unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_search_vector', table_name='tasks',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column('tasks', 'search_vector')
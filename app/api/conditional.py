@@ -0,0 +1,61 @@
+# app/api/conditional.py
+import hashlib
+import os
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.cache import TTLCache
+
+# Rendered JSON bodies of list endpoints, keyed by (scope, version, query).
+# A write bumps the version, so stale bodies are never served; they just
+# age out of the LRU.
+response_cache = TTLCache(
+    max_size=int(os.getenv("RESPONSE_CACHE_SIZE", 256)),
+    ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL", 300)),
+)
+
+def _normalized_query(request: Request) -> str:
+    return "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+
+def make_etag(scope: str, version: int, request: Request) -> str:
+    """
+    ETag of a list response: the data version plus a digest of the query,
+    since every page and filter combination is a different representation.
+    """
+    digest = hashlib.blake2b(_normalized_query(request).encode(), digest_size=8).hexdigest()
+    return f'"{scope}-{version}-{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether the request's If-None-Match already names `etag` (weak comparison).
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+async def conditional_json(
+    request: Request,
+    scope: str,
+    version: int,
+    render: Callable[[], Awaitable[bytes]],
+) -> Response:
+    """
+    Answers a list request for data at `version`: 304 if the client already
+    has it, the cached body if another client asked for it, otherwise the
+    body produced by `render`.
+    """
+    etag = make_etag(scope, version, request)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    key = (scope, version, _normalized_query(request))
+    body = response_cache.get(key)
+    if body is None:
+        body = await render()
+        response_cache.set(key, body)
+    return Response(content=body, media_type="application/json", headers=headers)
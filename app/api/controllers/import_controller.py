@@ -0,0 +1,52 @@
+# app/api/controllers/import_controller.py
+import io
+import tempfile
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.services import TaskImportService
+from app.api.deps import get_task_import_service
+from app.api.schemas.responses import TaskImportResponse, TaskImportRowError
+from app.exceptions.base import ValidationError
+
+# Request bodies up to this size are buffered in memory, larger ones on disk
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Define router
+router = APIRouter(prefix="/import", tags=["Import"])
+
+@router.post("/tasks", response_model=TaskImportResponse)
+async def import_tasks(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    service: TaskImportService = Depends(get_task_import_service)
+):
+    """
+    Import tasks, creating the projects they name, from an NDJSON or CSV
+    request body. Invalid records and records over the project or task
+    limits are reported by line; the rest are imported in one transaction.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+
+        stream = io.TextIOWrapper(body, encoding="utf-8", newline="")
+        try:
+            # The import is synchronous database work (psycopg2 COPY)
+            report = await run_in_threadpool(service.import_tasks, stream, format)
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be UTF-8 encoded.")
+        finally:
+            stream.detach()
+
+    return TaskImportResponse(
+        rows_read=report.rows_read,
+        projects_created=report.projects_created,
+        tasks_created=report.tasks_created,
+        failed=report.failed,
+        errors=[TaskImportRowError(line=line, error=error) for line, error in report.errors],
+    )
@@ -1,11 +1,32 @@
 # app/api/controllers/projects_controller.py
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, List, Optional, Sequence
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.services import ProjectService
-from app.api.deps import get_project_service
+from app.repositories import ProjectField
+from app.services import AsyncProjectService
+from app.api.deps import get_async_project_service
 from app.api.schemas.requests import ProjectCreateRequest, ProjectEditRequest
-from app.api.schemas.responses import ProjectResponse
+from app.api.schemas.requests.project_request import (
+    DEFAULT_EMBEDDED_TASKS,
+    DEFAULT_LOOKUP_RESULTS,
+    MAX_EMBEDDED_TASKS,
+    MAX_LOOKUP_RESULTS,
+    MIN_FUZZY_LOOKUP_LENGTH,
+    ProjectInclude,
+)
+from app.api.schemas.requests.task_request import StatusType
+from app.api.schemas.responses import (
+    Page,
+    ProjectDetailProjectionResponse,
+    ProjectDetailResponse,
+    ProjectResponse,
+    TaskCountsResponse,
+    TaskResponse,
+)
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_id_cursor, paginate
+from app.api.conditional import conditional_json
+from app.api.serialization import Record, dumps, record_encoder
+from app.metrics import query_budget
 from app.exceptions.service_exceptions import (
     ProjectNotFoundError,
     ProjectNameExistsError,
@@ -16,42 +37,163 @@ from app.exceptions.base import ValidationError
 # Define router
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
-@router.get("/", response_model=List[ProjectResponse])
-def get_all_projects(service: ProjectService = Depends(get_project_service)):
-    """List all projects."""
-    return service.get_all_projects()
+# Parts of ?include= are encoded straight from their rows, without validation
+task_counts_record = record_encoder(TaskCountsResponse)
+task_record = record_encoder(TaskResponse)
+
+async def _with_details(
+    service: AsyncProjectService,
+    projects: Sequence[Any],
+    include: List[ProjectInclude],
+    tasks_limit: int,
+    tasks_status: Optional[List[StatusType]],
+    fields: Optional[List[ProjectField]] = None,
+) -> List[Record]:
+    """
+    Builds the ProjectDetailResponse records of `projects` (entities or
+    rows) with their `fields` and the parts in `include`, each part read
+    for all projects at once. Parts not included are left out, as are
+    projects deleted meanwhile.
+    """
+    project_record = record_encoder(ProjectResponse, fields)
+    project_ids = [project.id for project in projects]
+    counts = await service.get_task_counts(project_ids) if "counts" in include else {}
+    tasks = (
+        await service.get_tasks_by_project(project_ids, tasks_limit, tasks_status)
+        if "tasks" in include
+        else {}
+    )
+
+    details = []
+    for project in projects:
+        record = project_record(project)
+        if "counts" in include:
+            if project.id not in counts:
+                continue
+            record["task_counts"] = task_counts_record(counts[project.id])
+        if "tasks" in include:
+            record["tasks"] = [task_record(task) for task in tasks[project.id]]
+        details.append(record)
+    return details
+
+@router.get("/", response_model=Page[ProjectDetailProjectionResponse], response_model_exclude_unset=True)
+@query_budget(3)
+async def get_all_projects(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include: List[ProjectInclude] = Query([], description="Optional parts to add: counts, tasks"),
+    tasks_limit: int = Query(DEFAULT_EMBEDDED_TASKS, ge=1, le=MAX_EMBEDDED_TASKS, description="Tasks embedded per project"),
+    tasks_status: Optional[List[StatusType]] = Query(None, description="Only embed tasks in these statuses"),
+    fields: Optional[List[ProjectField]] = Query(None, description="Only these fields of each project; all if omitted"),
+    service: AsyncProjectService = Depends(get_async_project_service)
+):
+    """
+    List projects, one page at a time.
+    Supports If-None-Match: unchanged pages are answered with 304.
+    With ?include=, a whole page of projects with their counts and first
+    tasks costs one request and one query per part.
+    """
+    try:
+        after_id = decode_id_cursor(after)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def render() -> bytes:
+        rows = await service.get_project_rows(after_id=after_id, limit=limit + 1, fields=fields)
+        page = paginate(rows, limit, lambda row: {"id": row.id})
+        if not include:
+            encode = record_encoder(ProjectResponse, fields)
+            page["items"] = [encode(row) for row in page["items"]]
+        else:
+            page["items"] = await _with_details(
+                service, page["items"], include, tasks_limit, tasks_status, fields
+            )
+        return dumps(page)
+
+    if include:
+        # Counts and tasks move with task writes (and counts with the
+        # clock), not with the project list's version, so pages including
+        # them are never served from cache
+        return Response(content=await render(), media_type="application/json")
+
+    version = await service.get_projects_version()
+    return await conditional_json(request, "projects", version, render)
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-def create_project(
+async def create_project(
     data: ProjectCreateRequest,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_async_project_service)
 ):
     """Create a new project."""
     try:
-        return service.create_project(data.name, data.description)
+        return await service.create_project(data.name, data.description)
     except (ProjectNameExistsError, ProjectLimitExceededError, ValidationError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(
+@router.get("/lookup", response_model=List[ProjectResponse])
+@query_budget(2)
+async def lookup_projects(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Start of the project name, as typed"),
+    fuzzy: bool = Query(True, description="Fill up with similarly named projects, to tolerate typos"),
+    limit: int = Query(DEFAULT_LOOKUP_RESULTS, ge=1, le=MAX_LOOKUP_RESULTS),
+    service: AsyncProjectService = Depends(get_async_project_service)
+):
+    """
+    Find projects by name as it is typed (case-insensitive): names starting
+    with `prefix` in name order, then similar names, most similar first.
+    """
+    try:
+        return await service.lookup_projects(prefix, limit, fuzzy, MIN_FUZZY_LOOKUP_LENGTH)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/{project_id}", response_model=ProjectDetailResponse, response_model_exclude_unset=True)
+@query_budget(3)
+async def get_project(
     project_id: int,
-    service: ProjectService = Depends(get_project_service)
+    include: List[ProjectInclude] = Query([], description="Optional parts to add: counts, tasks"),
+    tasks_limit: int = Query(DEFAULT_EMBEDDED_TASKS, ge=1, le=MAX_EMBEDDED_TASKS, description="Tasks embedded"),
+    tasks_status: Optional[List[StatusType]] = Query(None, description="Only embed tasks in these statuses"),
+    service: AsyncProjectService = Depends(get_async_project_service)
 ):
     """Get a specific project by ID."""
     try:
-        return service.find_project_by_id(project_id)
+        project = await service.find_project_by_id(project_id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if not include:
+        return ProjectResponse.model_validate(project)
+
+    details = await _with_details(service, [project], include, tasks_limit, tasks_status)
+    if not details:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project with ID '{project_id}' not found.",
+        )
+    return details[0]
+
+@router.get("/{project_id}/summary", response_model=TaskCountsResponse)
+@query_budget(1)
+async def get_project_summary(
+    project_id: int,
+    service: AsyncProjectService = Depends(get_async_project_service)
+):
+    """Get a project's task counts by status, and how many tasks are overdue."""
+    try:
+        return await service.get_project_summary(project_id)
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.put("/{project_id}", response_model=ProjectResponse)
-def update_project(
+async def update_project(
     project_id: int,
     data: ProjectEditRequest,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_async_project_service)
 ):
     """Update a project."""
     try:
-        return service.edit_project(
+        return await service.edit_project(
             project_id,
             new_name=data.name,
             new_description=data.description
@@ -62,12 +204,12 @@ def update_project(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(
+async def delete_project(
     project_id: int,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_async_project_service)
 ):
     """Delete a project."""
     try:
-        service.delete_project(project_id)
+        await service.delete_project(project_id)
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,47 @@
+# app/api/controllers/system_controller.py
+from typing import Any, Dict
+from fastapi import APIRouter, Request
+
+from app.cache import project_cache
+from app.api.conditional import response_cache
+from app.db.pool import pool_stats
+from app.db.session import async_engine, engine, replica_engines, replicas
+
+# Define router
+router = APIRouter(prefix="/system", tags=["System"])
+
+@router.get("/cache")
+async def get_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the in-process caches."""
+    return {
+        "project_cache": project_cache.stats() if project_cache is not None else None,
+        "response_cache": response_cache.stats(),
+    }
+
+@router.get("/scheduler")
+async def get_scheduler_stats(request: Request) -> Dict[str, Any]:
+    """Leadership and last-run statistics of the jobs scheduled in this process."""
+    scheduler = getattr(request.app.state, "scheduler", None)
+    deadline_engine = getattr(request.app.state, "deadline_engine", None)
+    return {
+        "enabled": scheduler is not None,
+        "jobs": scheduler.stats() if scheduler is not None else {},
+        "deadline_engine": deadline_engine.stats() if deadline_engine is not None else None,
+    }
+
+@router.get("/pool")
+async def get_pool_stats() -> Dict[str, Any]:
+    """Connections in use and checkout wait times of the database pools."""
+    return {
+        "async": pool_stats(async_engine),
+        "sync": pool_stats(engine),
+        **{name: pool_stats(replica_engine) for name, replica_engine in replica_engines.items()},
+    }
+
+@router.get("/replicas")
+async def get_replica_stats() -> Dict[str, Any]:
+    """Lag of the read replicas as of the last check, and whether they get reads."""
+    return {
+        "enabled": replicas is not None,
+        **(replicas.stats() if replicas is not None else {}),
+    }
@@ -1,11 +1,42 @@
 # app/api/controllers/tasks_controller.py
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import dataclasses
+from datetime import datetime
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
-from app.services import TaskService
-from app.api.deps import get_task_service
-from app.api.schemas.requests import TaskCreateRequest, TaskEditRequest
-from app.api.schemas.responses import TaskResponse
+from app.services import AsyncTaskService
+from app.repositories import TaskField, TaskFilter, TaskSortField
+from app.api.deps import get_async_task_service
+from app.api.schemas.requests import (
+    TaskCreateRequest,
+    TaskEditRequest,
+    TaskBulkFilter,
+    TaskBulkStatusRequest,
+    TaskBulkDeleteRequest,
+)
+from app.api.schemas.requests.task_request import MAX_BULK_TASKS, StatusType
+from app.api.schemas.responses import (
+    Page,
+    TaskBulkChangeResponse,
+    TaskBulkCreateResponse,
+    TaskBulkItemResult,
+    TaskProjectionResponse,
+    TaskResponse,
+    TaskSearchResponse,
+)
+from app.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_rank_cursor,
+    decode_sort_cursor,
+    paginate,
+    sort_cursor_values,
+)
+from app.api.conditional import conditional_json
+from app.api.serialization import FastJSONResponse, dumps, record_encoder
+from app.api.export import csv_lines, ndjson_lines
+from app.metrics import query_budget
 from app.exceptions.service_exceptions import (
     TaskNotFoundError,
     ProjectNotFoundError,
@@ -16,24 +47,94 @@ from app.exceptions.base import ValidationError, InvalidDeadlineError
 # We use two routers logically, but here we define endpoints explicitly
 router = APIRouter(tags=["Tasks"])
 
+def task_fields_param(
+    fields: Optional[List[TaskField]] = Query(None, description="Only these fields of each task; all if omitted"),
+) -> Optional[List[TaskField]]:
+    """The ?fields= projection shared by the task read endpoints."""
+    return fields
+
+def task_filter_params(
+    status: Optional[List[StatusType]] = Query(None, description="Only tasks in one of these statuses"),
+    deadline_before: Optional[datetime] = Query(None),
+    deadline_after: Optional[datetime] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    closed: Optional[bool] = Query(None, description="Closed (true) or still open (false) by the autoclose job"),
+) -> TaskFilter:
+    """Collects the task filter query parameters shared by the task list endpoints."""
+    return TaskFilter(
+        statuses=status,
+        deadline_before=deadline_before,
+        deadline_after=deadline_after,
+        created_after=created_after,
+        created_before=created_before,
+        closed=closed,
+    )
+
+def _to_task_filter(data: Optional[TaskBulkFilter]) -> Optional[TaskFilter]:
+    """Converts the body filter of a bulk request into a TaskFilter."""
+    if data is None:
+        return None
+    return TaskFilter(
+        project_id=data.project_id,
+        statuses=data.status,
+        deadline_before=data.deadline_before,
+        deadline_after=data.deadline_after,
+        created_after=data.created_after,
+        created_before=data.created_before,
+        closed=data.closed,
+    )
+
 # --- Nested Endpoints (Projects -> Tasks) ---
 
-@router.get("/projects/{project_id}/tasks", response_model=List[TaskResponse])
-def get_tasks_for_project(
+@router.get("/projects/{project_id}/tasks", response_model=Page[TaskProjectionResponse])
+@query_budget(3)
+async def get_tasks_for_project(
+    request: Request,
     project_id: int,
-    service: TaskService = Depends(get_task_service)
+    filters: TaskFilter = Depends(task_filter_params),
+    sort: TaskSortField = Query("id"),
+    order: Literal["asc", "desc"] = Query("asc"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    fields: Optional[List[TaskField]] = Depends(task_fields_param),
+    service: AsyncTaskService = Depends(get_async_task_service)
 ):
-    """Get all tasks for a specific project."""
+    """
+    Get the tasks of a specific project, filtered, sorted and one page at a time.
+    Supports If-None-Match: unchanged pages are answered with 304 without
+    reading any task rows.
+    """
+    async def render() -> bytes:
+        rows = await service.get_task_rows_for_project(
+            project_id,
+            filters=filters,
+            sort=sort,
+            descending=order == "desc",
+            after_id=after_id,
+            after_value=after_value,
+            limit=limit + 1,
+            fields=fields,
+        )
+        page = paginate(rows, limit, lambda row: sort_cursor_values(row, sort))
+        encode = record_encoder(TaskResponse, fields)
+        page["items"] = [encode(row) for row in page["items"]]
+        return dumps(page)
+
     try:
-        return service.get_tasks_for_project(project_id)
+        after_value, after_id = decode_sort_cursor(after, sort)
+        version = await service.get_tasks_version(project_id)
+        return await conditional_json(request, f"tasks-{project_id}", version, render)
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/projects/{project_id}/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     project_id: int,
     data: TaskCreateRequest,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_async_task_service)
 ):
     """Add a new task to a project."""
     try:
@@ -47,7 +148,7 @@ def create_task(
             import datetime as dt
             deadline_dt = dt.datetime.combine(data.deadline, dt.time.min)
 
-        return service.add_task_to_project(
+        return await service.add_task_to_project(
             project_id=project_id,
             task_title=data.title,
             task_description=data.description,
@@ -58,24 +159,166 @@ def create_task(
     except (TaskLimitExceededError, ValidationError, InvalidDeadlineError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+@router.post("/projects/{project_id}/tasks/bulk", response_model=TaskBulkCreateResponse)
+async def create_tasks_bulk(
+    project_id: int,
+    data: List[TaskCreateRequest] = Body(..., min_length=1, max_length=MAX_BULK_TASKS),
+    service: AsyncTaskService = Depends(get_async_task_service)
+):
+    """
+    Add many tasks to a project in one transaction.
+    Invalid items are reported per item; the valid ones are all created or,
+    if they would exceed the project's task limit, none of them is.
+    """
+    import datetime as dt
+    items = [
+        (
+            item.title,
+            item.description,
+            dt.datetime.combine(item.deadline, dt.time.min) if item.deadline else None,
+        )
+        for item in data
+    ]
+
+    try:
+        outcomes = await service.add_tasks_to_project(project_id, items)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except TaskLimitExceededError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    results = [
+        TaskBulkItemResult(index=index, error=outcome.message)
+        if isinstance(outcome, ValidationError)
+        else TaskBulkItemResult(index=index, task=TaskResponse.model_validate(outcome))
+        for index, outcome in enumerate(outcomes)
+    ]
+    failed = sum(1 for result in results if result.error is not None)
+    return TaskBulkCreateResponse(
+        created=len(results) - failed, failed=failed, results=results
+    )
+
+# --- Bulk Task Endpoints ---
+
+@router.post("/tasks/bulk/status", response_model=TaskBulkChangeResponse)
+async def update_tasks_status_bulk(
+    data: TaskBulkStatusRequest,
+    service: AsyncTaskService = Depends(get_async_task_service)
+):
+    """
+    Move every task selected by IDs and/or a filter to a new status in one statement.
+    Moving tasks to 'done' stamps their closed_at.
+    """
+    try:
+        task_ids = await service.update_tasks_status(
+            data.status, task_ids=data.ids, filters=_to_task_filter(data.filter)
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskBulkChangeResponse(count=len(task_ids), ids=task_ids)
+
+@router.post("/tasks/bulk/delete", response_model=TaskBulkChangeResponse)
+async def delete_tasks_bulk(
+    data: TaskBulkDeleteRequest,
+    service: AsyncTaskService = Depends(get_async_task_service)
+):
+    """Delete every task selected by IDs and/or a filter in one statement."""
+    try:
+        task_ids = await service.delete_tasks(
+            task_ids=data.ids, filters=_to_task_filter(data.filter)
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskBulkChangeResponse(count=len(task_ids), ids=task_ids)
+
+# --- Export ---
+
+@router.get("/tasks/export")
+@query_budget(2)
+async def export_tasks(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    project_id: Optional[int] = Query(None, description="Only the tasks of this project"),
+    filters: TaskFilter = Depends(task_filter_params),
+    service: AsyncTaskService = Depends(get_async_task_service)
+):
+    """
+    Export every task matching the filters, ordered by ID.
+    Rows are streamed from a server-side cursor as they are read, so the
+    export size is not limited by memory.
+    """
+    try:
+        batches = await service.export_tasks(dataclasses.replace(filters, project_id=project_id))
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if format == "csv":
+        body, media_type = csv_lines(batches), "text/csv"
+    else:
+        body, media_type = ndjson_lines(batches), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'},
+    )
+
+# --- Search ---
+
+@router.get("/tasks/search", response_model=Page[TaskSearchResponse])
+@query_budget(2)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find; supports \"phrases\", or, and -exclusions"),
+    project_id: Optional[int] = Query(None, description="Only the tasks of this project"),
+    statuses: Optional[List[StatusType]] = Query(None, alias="status", description="Only tasks in one of these statuses"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    fields: Optional[List[TaskField]] = Depends(task_fields_param),
+    service: AsyncTaskService = Depends(get_async_task_service)
+):
+    """
+    Search task titles and descriptions, best matches first.
+    Matches in the title rank above matches in the description.
+    """
+    try:
+        after_rank, after_id = decode_rank_cursor(after)
+        rows = await service.search_tasks(
+            q,
+            filters=TaskFilter(project_id=project_id, statuses=statuses),
+            after_rank=after_rank,
+            after_id=after_id,
+            limit=limit + 1,
+            fields=fields,
+        )
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    page = paginate(rows, limit, lambda row: {"rank": row.rank, "id": row.id})
+    encode = record_encoder(TaskResponse, fields)
+    page["items"] = [{**encode(row), "rank": row.rank} for row in page["items"]]
+    return FastJSONResponse(page)
+
 # --- Task Specific Endpoints ---
 
-@router.get("/tasks/{task_id}", response_model=TaskResponse)
-def get_task(
+@router.get("/tasks/{task_id}", response_model=TaskProjectionResponse)
+@query_budget(1)
+async def get_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service)
+    fields: Optional[List[TaskField]] = Depends(task_fields_param),
+    service: AsyncTaskService = Depends(get_async_task_service)
 ):
     """Get a specific task details."""
     try:
-        return service.find_task_by_id(task_id)
+        row = await service.find_task_row_by_id(task_id, fields)
     except TaskNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return FastJSONResponse(record_encoder(TaskResponse, fields)(row))
 
 @router.patch("/tasks/{task_id}", response_model=TaskResponse)
-def update_task(
+async def update_task(
     task_id: int,
     data: TaskEditRequest,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_async_task_service)
 ):
     """Update a task."""
     try:
@@ -85,7 +328,7 @@ def update_task(
             import datetime as dt
             deadline_dt = dt.datetime.combine(data.deadline, dt.time.min)
 
-        return service.edit_task(
+        return await service.edit_task(
             task_id,
             new_title=data.title,
             new_description=data.description,
@@ -98,12 +341,12 @@ def update_task(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_async_task_service)
 ):
     """Delete a task."""
     try:
-        service.delete_task(task_id)
+        await service.delete_task(task_id)
     except TaskNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,30 +1,126 @@
 # app/api/deps.py
 import os
-from typing import Generator
-from fastapi import Depends
+from typing import AsyncGenerator, Generator
+from fastapi import Depends, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_session
-from app.repositories import ProjectRepository, TaskRepository
-from app.services import ProjectService, TaskService
+from app.api.stickiness import read_after_lsn
+from app.cache import project_cache
+from app.db.replicas import CURRENT_WAL_LSN
+from app.db.session import get_session, get_async_session, replicas
+from app.db.unit_of_work import async_unit_of_work, unit_of_work
+from app.repositories import (
+    ProjectRepository,
+    TaskRepository,
+    AsyncProjectRepository,
+    AsyncTaskRepository,
+    TaskImportRepository,
+)
+from app.services import (
+    ProjectService,
+    TaskService,
+    AsyncProjectService,
+    AsyncTaskService,
+    TaskImportService,
+)
 
-def get_db() -> Generator[Session, None, None]:
+# Requests with these methods only read: their transaction runs READ ONLY
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Creates a new database session for each request and closes it afterwards.
     """
-    db = get_session()
+    db = get_session(read_only=request.method in READ_ONLY_METHODS)
     try:
         yield db
     finally:
         db.close()
 
-def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
-    repo = ProjectRepository(db)
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Creates a new async database session for each request and closes it afterwards.
+    Reads go to a replica if one is configured and has caught up with the
+    client's last write.
+    """
+    db = get_async_session(
+        read_only=request.method in READ_ONLY_METHODS,
+        after_lsn=read_after_lsn(request),
+    )
+    try:
+        yield db
+    finally:
+        await db.close()
+
+def get_unit_of_work(request: Request, db: Session = Depends(get_db)) -> Generator[Session, None, None]:
+    """
+    The request's session, with everything the request writes in one
+    transaction (see unit_of_work()). Depended on with scope="function",
+    so the commit happens after the endpoint returns and before the
+    response is sent; an error rolls everything back.
+
+    Reads have nothing to commit: their READ ONLY transaction ends when
+    the session closes, after the response, so streamed responses can
+    keep reading from it.
+    """
+    if request.method in READ_ONLY_METHODS:
+        yield db
+        return
+    with unit_of_work(db):
+        yield db
+    if replicas is not None:
+        # For ReadYourWritesMiddleware: the client's next reads must see this
+        request.state.write_lsn = db.scalar(CURRENT_WAL_LSN)
+
+async def get_async_unit_of_work(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async counterpart of get_unit_of_work().
+    """
+    if request.method in READ_ONLY_METHODS:
+        yield db
+        return
+    async with async_unit_of_work(db):
+        yield db
+    if replicas is not None:
+        request.state.write_lsn = await db.scalar(CURRENT_WAL_LSN)
+
+def get_project_service(
+    db: Session = Depends(get_unit_of_work, scope="function"),
+) -> ProjectService:
+    repo = ProjectRepository(db, project_cache)
     max_projects = int(os.getenv("MAX_PROJECTS", 10))
     return ProjectService(repo, max_projects)
 
-def get_task_service(db: Session = Depends(get_db)) -> TaskService:
-    project_repo = ProjectRepository(db)
+def get_task_service(
+    db: Session = Depends(get_unit_of_work, scope="function"),
+) -> TaskService:
+    project_repo = ProjectRepository(db, project_cache)
     task_repo = TaskRepository(db)
     max_tasks = int(os.getenv("MAX_TASKS_PER_PROJECT", 20))
     return TaskService(task_repo, project_repo, max_tasks)
+
+def get_async_project_service(
+    db: AsyncSession = Depends(get_async_unit_of_work, scope="function"),
+) -> AsyncProjectService:
+    repo = AsyncProjectRepository(db, project_cache)
+    max_projects = int(os.getenv("MAX_PROJECTS", 10))
+    return AsyncProjectService(repo, max_projects)
+
+def get_async_task_service(
+    db: AsyncSession = Depends(get_async_unit_of_work, scope="function"),
+) -> AsyncTaskService:
+    project_repo = AsyncProjectRepository(db, project_cache)
+    task_repo = AsyncTaskRepository(db)
+    max_tasks = int(os.getenv("MAX_TASKS_PER_PROJECT", 20))
+    return AsyncTaskService(task_repo, project_repo, max_tasks)
+
+def get_task_import_service(
+    db: Session = Depends(get_unit_of_work, scope="function"),
+) -> TaskImportService:
+    repo = TaskImportRepository(db)
+    max_projects = int(os.getenv("MAX_PROJECTS", 10))
+    max_tasks = int(os.getenv("MAX_TASKS_PER_PROJECT", 20))
+    return TaskImportService(repo, max_projects, max_tasks)
@@ -0,0 +1,47 @@
+# app/api/export.py
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row
+
+from app.repositories.task_repository import EXPORT_COLUMNS
+
+# Header of CSV exports; also the keys of NDJSON records
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+def _plain_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+async def ndjson_lines(batches: AsyncIterator[Sequence[Row]]) -> AsyncIterator[str]:
+    """
+    Encodes row batches as newline-delimited JSON, one chunk per batch.
+    """
+    async for batch in batches:
+        yield "".join(
+            json.dumps(
+                {field: _plain_value(value) for field, value in zip(EXPORT_FIELDS, row)},
+                ensure_ascii=False,
+            ) + "\n"
+            for row in batch
+        )
+
+async def csv_lines(batches: AsyncIterator[Sequence[Row]]) -> AsyncIterator[str]:
+    """
+    Encodes row batches as CSV with a header line, one chunk per batch.
+    The header goes out before the first row is read.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue()
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [_plain_value(value) for value in row] for row in batch
+        )
+        yield buffer.getvalue()
@@ -0,0 +1,100 @@
+# app/api/pagination.py
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from app.exceptions.base import ValidationError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    Encodes the sort key of the last row of a page into an opaque cursor.
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decodes a cursor produced by encode_cursor. Raises ValidationError if it was tampered with.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        raise ValidationError("Invalid pagination cursor.")
+    if not isinstance(values, dict):
+        raise ValidationError("Invalid pagination cursor.")
+    return values
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Returns the id stored in a cursor for lists ordered by id, or None for the first page.
+    """
+    if cursor is None:
+        return None
+    after_id = decode_cursor(cursor).get("id")
+    if not isinstance(after_id, int):
+        raise ValidationError("Invalid pagination cursor.")
+    return after_id
+
+def decode_sort_cursor(cursor: Optional[str], sort: str) -> Tuple[Any, Optional[int]]:
+    """
+    Returns the (sort value, id) stored in a cursor for lists ordered by (`sort`, id).
+    Datetime sort values are restored from their ISO form.
+    """
+    if cursor is None:
+        return None, None
+    values = decode_cursor(cursor)
+    after_id = values.get("id")
+    if values.get("sort") != sort or not isinstance(after_id, int):
+        raise ValidationError("Pagination cursor does not match the requested sort order.")
+
+    after_value = values.get("value")
+    if sort != "id" and after_value is not None:
+        try:
+            after_value = datetime.fromisoformat(after_value)
+        except (TypeError, ValueError):
+            raise ValidationError("Invalid pagination cursor.")
+    return after_value, after_id
+
+def decode_rank_cursor(cursor: Optional[str]) -> Tuple[Optional[float], Optional[int]]:
+    """
+    Returns the (rank, id) stored in a cursor for search results ordered by rank.
+    """
+    if cursor is None:
+        return None, None
+    values = decode_cursor(cursor)
+    rank, after_id = values.get("rank"), values.get("id")
+    if not isinstance(rank, (int, float)) or isinstance(rank, bool) or not isinstance(after_id, int):
+        raise ValidationError("Invalid pagination cursor.")
+    return float(rank), after_id
+
+def sort_cursor_values(row: Any, sort: str) -> Dict[str, Any]:
+    """
+    Cursor values for a row of a list ordered by (`sort`, id).
+    """
+    value = getattr(row, sort)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return {"sort": sort, "value": value, "id": row.id}
+
+def paginate(
+    rows: Sequence[Any],
+    limit: int,
+    cursor_values: Callable[[Any], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Builds a page from `limit + 1` fetched rows.
+
+    The extra row only tells us whether another page exists; the cursor
+    points at the last row that is actually returned.
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(cursor_values(items[-1]))
+    return {"items": items, "next_cursor": next_cursor}
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.controllers import projects_controller, tasks_controller
+from app.api.controllers import projects_controller, tasks_controller, import_controller, system_controller
 
 # Main API Router
 api_router = APIRouter()
@@ -7,3 +7,5 @@ api_router = APIRouter()
 # Include sub-routers
 api_router.include_router(projects_controller.router)
 api_router.include_router(tasks_controller.router)
+api_router.include_router(import_controller.router)
+api_router.include_router(system_controller.router)
@@ -1,2 +1,8 @@
 from .project_request import ProjectCreateRequest, ProjectEditRequest
-from .task_request import TaskCreateRequest, TaskEditRequest
+from .task_request import (
+    TaskCreateRequest,
+    TaskEditRequest,
+    TaskBulkFilter,
+    TaskBulkStatusRequest,
+    TaskBulkDeleteRequest,
+)
@@ -1,6 +1,20 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
+# Optional parts of a project response, requested with ?include=
+ProjectInclude = Literal["counts", "tasks"]
+
+# Tasks embedded per project by ?include=tasks, by default and at most
+DEFAULT_EMBEDDED_TASKS = 20
+MAX_EMBEDDED_TASKS = 100
+
+# Projects returned by /projects/lookup, by default and at most
+DEFAULT_LOOKUP_RESULTS = 10
+MAX_LOOKUP_RESULTS = 50
+
+# Shortest input matched by similarity; pg_trgm compares three-letter slices
+MIN_FUZZY_LOOKUP_LENGTH = 3
+
 class ProjectCreateRequest(BaseModel):
     """
     Schema for creating a new project.
@@ -1,5 +1,5 @@
-from typing import Optional, Literal
-from datetime import date
+from typing import List, Optional, Literal
+from datetime import date, datetime
 from pydantic import BaseModel, Field
 
 # Define the allowed status types
@@ -21,3 +21,34 @@ class TaskEditRequest(BaseModel):
     description: Optional[str] = Field(None, min_length=1, max_length=500)
     status: Optional[StatusType] = Field(None, description="New status: todo, doing, or done")
     deadline: Optional[date] = Field(None)
+
+# Upper bound on the number of tasks accepted by one bulk request
+MAX_BULK_TASKS = 1000
+
+class TaskBulkFilter(BaseModel):
+    """
+    Conditions selecting the tasks of a bulk operation. All set fields must match.
+    """
+    project_id: Optional[int] = None
+    status: Optional[List[StatusType]] = None
+    deadline_before: Optional[datetime] = None
+    deadline_after: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    closed: Optional[bool] = None
+
+class TaskBulkStatusRequest(BaseModel):
+    """
+    Schema for moving many tasks to a new status.
+    Tasks are selected by `ids`, `filter`, or both (then both must match).
+    """
+    ids: Optional[List[int]] = Field(None, max_length=MAX_BULK_TASKS)
+    filter: Optional[TaskBulkFilter] = None
+    status: StatusType = Field(..., description="New status: todo, doing, or done")
+
+class TaskBulkDeleteRequest(BaseModel):
+    """
+    Schema for deleting many tasks, selected like TaskBulkStatusRequest.
+    """
+    ids: Optional[List[int]] = Field(None, max_length=MAX_BULK_TASKS)
+    filter: Optional[TaskBulkFilter] = None
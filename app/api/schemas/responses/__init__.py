@@ -1,2 +1,15 @@
-from .project_response import ProjectResponse
-from .task_response import TaskResponse
+from .page_response import Page
+from .project_response import (
+    ProjectResponse,
+    ProjectDetailResponse,
+    ProjectDetailProjectionResponse,
+    ProjectProjectionResponse,
+    TaskCountsResponse,
+)
+from .task_response import (
+    TaskResponse,
+    TaskSearchResponse,
+    TaskProjectionResponse,
+)
+from .bulk_response import TaskBulkChangeResponse, TaskBulkCreateResponse, TaskBulkItemResult
+from .import_response import TaskImportResponse, TaskImportRowError
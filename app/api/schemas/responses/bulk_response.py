@@ -0,0 +1,26 @@
+from typing import List, Optional
+from pydantic import BaseModel
+from .task_response import TaskResponse
+
+class TaskBulkItemResult(BaseModel):
+    """
+    Outcome of one item of a bulk task creation, in request order.
+    """
+    index: int
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+
+class TaskBulkCreateResponse(BaseModel):
+    """
+    Schema for the result of a bulk task creation.
+    """
+    created: int
+    failed: int
+    results: List[TaskBulkItemResult]
+
+class TaskBulkChangeResponse(BaseModel):
+    """
+    Schema for the result of a bulk status change or bulk delete.
+    """
+    count: int
+    ids: List[int]
@@ -0,0 +1,20 @@
+from typing import List
+from pydantic import BaseModel
+
+class TaskImportRowError(BaseModel):
+    """
+    A rejected record of an import, by line number in the uploaded file.
+    """
+    line: int
+    error: str
+
+class TaskImportResponse(BaseModel):
+    """
+    Schema for the result of a task import.
+    `errors` lists the first rejected records; `failed` counts all of them.
+    """
+    rows_read: int
+    projects_created: int
+    tasks_created: int
+    failed: int
+    errors: List[TaskImportRowError]
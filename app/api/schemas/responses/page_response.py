@@ -0,0 +1,13 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """
+    Schema for one page of a cursor-paginated list.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `after` to fetch the next page; null on the last page"
+    )
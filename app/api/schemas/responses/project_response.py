@@ -9,8 +9,44 @@ class ProjectResponse(BaseModel):
     id: int
     name: str
     description: str
-    
-    # We can include tasks here if we want to show them inside the project
-    # tasks: List[TaskResponse] = [] 
 
     model_config = ConfigDict(from_attributes=True)
+
+class TaskCountsResponse(BaseModel):
+    """
+    Schema for a project's task counts, in total and by status.
+    `overdue` counts open tasks past their deadline.
+    """
+    total: int
+    todo: int
+    doing: int
+    done: int
+    overdue: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ProjectDetailResponse(ProjectResponse):
+    """
+    Schema for a project with the optional parts requested by ?include=:
+    its task counts and its first tasks. Parts not requested are left
+    out of the response (serialize with exclude_unset).
+    """
+    task_counts: Optional[TaskCountsResponse] = None
+    tasks: Optional[List[TaskResponse]] = None
+
+class ProjectProjectionResponse(BaseModel):
+    """
+    Schema for a project read with ?fields=: only the requested fields
+    are sent (every field without ?fields=), so none of them is required.
+    """
+    id: Optional[int] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+class ProjectDetailProjectionResponse(ProjectProjectionResponse):
+    """
+    Schema for a project read with ?fields= and the parts requested by
+    ?include= (see ProjectDetailResponse).
+    """
+    task_counts: Optional[TaskCountsResponse] = None
+    tasks: Optional[List[TaskResponse]] = None
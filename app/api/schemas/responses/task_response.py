@@ -19,3 +19,27 @@ class TaskResponse(BaseModel):
 
     # This allows Pydantic to read data directly from SQLAlchemy models
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskProjectionResponse(BaseModel):
+    """
+    Schema for a task read with ?fields=: only the requested fields are
+    sent (every field without ?fields=), so none of them is required.
+    """
+    id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[StatusType] = None
+    deadline: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    project_id: Optional[int] = None
+
+
+class TaskSearchResponse(TaskProjectionResponse):
+    """
+    A task found by full-text search, with its relevance: higher is better,
+    and title matches weigh more than description matches. The rank is
+    sent whatever ?fields= asks for.
+    """
+    rank: float
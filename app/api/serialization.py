@@ -0,0 +1,56 @@
+# app/api/serialization.py
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Type
+
+import pydantic_core
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional: pydantic's own encoder writes the same bytes, a little slower
+    orjson = None
+
+Record = Dict[str, Any]
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes plain values (dicts, lists, str, numbers, datetimes) as JSON,
+    byte for byte as Pydantic's model_dump_json() would: UTF-8, compact,
+    UTC datetimes ending in Z.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+    return pydantic_core.to_json(value)
+
+class FastJSONResponse(Response):
+    """
+    JSON response for content that is already made of plain values, e.g.
+    records from record_encoder(). Unlike JSONResponse it encodes without
+    the stdlib json module; unlike returning models it skips validation.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def record_encoder(
+    model: Type[BaseModel], only: Optional[Sequence[str]] = None
+) -> Callable[[Any], Record]:
+    """
+    Returns a function reading `model`'s fields (those in `only`, if given,
+    for ?fields= projections) from an object's attributes into a dict, for
+    objects whose values already have the field types: ORM entities or
+    rows. It skips Pydantic validation, which dominates the cost of long
+    lists; the model still documents the response in OpenAPI.
+    """
+    return _record_encoder(model, None if only is None else frozenset(only))
+
+@lru_cache(maxsize=128)
+def _record_encoder(model: Type[BaseModel], only: Optional[frozenset]) -> Callable[[Any], Record]:
+    fields = tuple(field for field in model.model_fields if only is None or field in only)
+    read = operator.attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: {fields[0]: read(obj)}
+    return lambda obj: dict(zip(fields, read(obj)))
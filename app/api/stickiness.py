@@ -0,0 +1,64 @@
+# app/api/stickiness.py
+import os
+from typing import Optional
+
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.replicas import parse_lsn
+
+# The WAL position of a client's last write travels in this cookie, or in
+# the header for clients that do not keep cookies. Reads carrying it only
+# go to replicas that have replayed that far (see ReplicaSet.pick()).
+READ_AFTER_COOKIE = "read_after_lsn"
+READ_AFTER_HEADER = "X-Read-After-LSN"
+
+# How long a write keeps steering the client's reads; far above any lag a
+# replica is allowed
+READ_AFTER_MAX_AGE = int(os.getenv("REPLICA_STICKY_SECONDS", 60))
+
+def read_after_lsn(request: Request) -> Optional[int]:
+    """
+    The WAL position the client's reads must see, from the header or the
+    cookie; None if it has none or sent garbage.
+    """
+    value = request.headers.get(READ_AFTER_HEADER) or request.cookies.get(READ_AFTER_COOKIE)
+    if not value:
+        return None
+    try:
+        return parse_lsn(value)
+    except ValueError:
+        return None
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware handing a client the WAL position of the write it just
+    made (request.state.write_lsn, set after the commit by the unit of work
+    dependency) as both a cookie and a response header.
+
+    It cannot be done from the dependency itself: the commit happens after
+    the endpoint has returned its response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_lsn(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                lsn = scope.get("state", {}).get("write_lsn")
+                if lsn is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(READ_AFTER_HEADER, lsn)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{READ_AFTER_COOKIE}={lsn}; Max-Age={READ_AFTER_MAX_AGE}; Path=/; HttpOnly; SameSite=Lax",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_lsn)
@@ -0,0 +1,5 @@
+# app/cache/__init__.py
+from .ttl_cache import TTLCache
+from .project_cache import ProjectCache, project_cache
+
+__all__ = ["TTLCache", "ProjectCache", "project_cache"]
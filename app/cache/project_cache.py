@@ -0,0 +1,107 @@
+# app/cache/project_cache.py
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import Engine, func, select
+from sqlalchemy.orm import Session
+
+from app.models import Project
+from app.db.notifications import NotificationChannel
+from .ttl_cache import TTLCache
+
+# Project writes announce here the IDs every process must drop from its cache
+CHANNEL = "project_cache"
+
+class ProjectCache:
+    """
+    Read-through cache for project lookups by ID and by name.
+
+    Only the descriptive columns (id, name, description) are cached, as
+    plain dicts; ProjectRepository re-attaches them to its session. Columns
+    that task writes change, like task_count, are never served from here.
+    Names map to IDs, so renaming a project only needs its ID invalidated.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, notify: bool = False):
+        """
+        With `notify`, invalidations are also broadcast to other processes.
+        """
+        self._by_id = TTLCache(max_size, ttl_seconds)
+        self._ids_by_name = TTLCache(max_size, ttl_seconds)
+        self._channel: Optional[NotificationChannel] = None
+        if notify:
+            self._channel = NotificationChannel(
+                CHANNEL, on_message=self._on_message, on_reset=self.clear
+            )
+
+    @classmethod
+    def from_env(cls) -> Optional["ProjectCache"]:
+        """
+        Builds the cache from PROJECT_CACHE_* settings, or None if disabled.
+
+        Invalidations are always broadcast: with several workers (or the
+        API next to the CLI and the scheduler), a write would otherwise
+        only clear the cache of the process that made it.
+        """
+        if os.getenv("PROJECT_CACHE_ENABLED", "1") != "1":
+            return None
+        return cls(
+            max_size=int(os.getenv("PROJECT_CACHE_SIZE", 1024)),
+            ttl_seconds=float(os.getenv("PROJECT_CACHE_TTL", 30)),
+            notify=True,
+        )
+
+    def get(self, project_id: int) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(project_id)
+
+    def get_id_by_name(self, name: str) -> Optional[int]:
+        return self._ids_by_name.get(name.lower())
+
+    def put(self, project: Project) -> None:
+        self._by_id.set(
+            project.id,
+            {"id": project.id, "name": project.name, "description": project.description},
+        )
+        self._ids_by_name.set(project.name.lower(), project.id)
+
+    def invalidate(self, project_id: int, names: Iterable[str] = ()) -> None:
+        """
+        Drops a project from this process's cache.
+        """
+        self._by_id.invalidate(project_id)
+        for name in names:
+            self._ids_by_name.invalidate(name.lower())
+
+    @staticmethod
+    def publish(session: Session, project_id: int) -> None:
+        """
+        Tells every process to drop a project once the session's
+        transaction commits. Static: processes without a cache of their
+        own (the CLI, the scheduler) must publish their writes too.
+        """
+        session.execute(select(func.pg_notify(CHANNEL, str(project_id))))
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._ids_by_name.clear()
+
+    def start_listener(self, engine: Engine) -> None:
+        if self._channel is not None:
+            self._channel.start(engine)
+
+    def stop_listener(self) -> None:
+        if self._channel is not None:
+            self._channel.stop()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"by_id": self._by_id.stats(), "by_name": self._ids_by_name.stats()}
+
+    def _on_message(self, payload: str) -> None:
+        try:
+            self.invalidate(int(payload))
+        except ValueError:
+            self.clear()
+
+
+# Shared by every request of this process
+project_cache = ProjectCache.from_env()
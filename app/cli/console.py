@@ -4,21 +4,27 @@ import sys
 from datetime import datetime
 from typing import Optional, Sequence
 
+from sqlalchemy.orm import Session
+
+from app.db.unit_of_work import unit_of_work
 from app.models import Project, Task
 from app.models.task import Status
 from app.services import ProjectService, TaskService
 from app.exceptions.base import ToDoListError
+from app.metrics import track_queries
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
 class CommandLineApp:
-    def __init__(self, project_service: ProjectService, task_service: TaskService):
+    def __init__(self, project_service: ProjectService, task_service: TaskService, session: Session):
         """
-        Initialize the CLI app with injected services.
+        Initialize the CLI app with injected services and the session they
+        share, which runs each command in one transaction.
         """
         self.project_service = project_service
         self.task_service = task_service
+        self.session = session
         
         # --- PHASE 3: Deprecation Notice ---
         self._print_deprecation_warning()
@@ -50,27 +56,31 @@ class CommandLineApp:
             choice: str = input("Enter your choice: ").strip()
 
             try:
-                if choice == "1":
-                    self._create_project()
-                elif choice == "2":
-                    self._list_all_projects()
-                elif choice == "3":
-                    self._edit_project()
-                elif choice == "4":
-                    self._delete_project()
-                elif choice == "5":
-                    self._add_task_to_project()
-                elif choice == "6":
-                    self._edit_task()
-                elif choice == "7":
-                    self._delete_task()
-                elif choice == "8":
-                    self._list_tasks_for_project()
-                elif choice == "0":
-                    print("Exiting application. Goodbye!")
-                    break
-                else:
-                    print("❌ ERROR: Invalid choice. Please try again.")
+                # Each command is one unit of work for the query budget. Its
+                # writes run in one transaction once every prompt is answered
+                # (see the helpers), so none stays open while the user types.
+                with track_queries(f"cli command {choice}"):
+                    if choice == "1":
+                        self._create_project()
+                    elif choice == "2":
+                        self._list_all_projects()
+                    elif choice == "3":
+                        self._edit_project()
+                    elif choice == "4":
+                        self._delete_project()
+                    elif choice == "5":
+                        self._add_task_to_project()
+                    elif choice == "6":
+                        self._edit_task()
+                    elif choice == "7":
+                        self._delete_task()
+                    elif choice == "8":
+                        self._list_tasks_for_project()
+                    elif choice == "0":
+                        print("Exiting application. Goodbye!")
+                        break
+                    else:
+                        print("❌ ERROR: Invalid choice. Please try again.")
 
             except ToDoListError as e:
                 print(f"❌ ERROR: {e.message}")
@@ -84,20 +94,22 @@ class CommandLineApp:
     def _create_project(self):
         name: str = input("Enter project name: ").strip()
         description: str = input("Enter project description: ").strip()
-        project: Project = self.project_service.create_project(name, description)
-        print(f"✅ SUCCESS: Project '{project.name}' created with ID {project.id}.")
+        with unit_of_work(self.session):
+            project: Project = self.project_service.create_project(name, description)
+            print(f"✅ SUCCESS: Project '{project.name}' created with ID {project.id}.")
 
     def _list_all_projects(self):
-        projects: Sequence[Project] = self.project_service.get_all_projects()
-        if not projects:
-            print("No projects found.")
-        else:
-            print("\n--- All Projects ---")
-            for project in projects:
-                print(
-                    f"- ID: {project.id}, Name: {project.name}, Tasks: {len(project.tasks)}"
-                )
-                print(f"  Description: {project.description}")
+        with unit_of_work(self.session):
+            projects: Sequence[Project] = self.project_service.get_all_projects()
+            if not projects:
+                print("No projects found.")
+            else:
+                print("\n--- All Projects ---")
+                for project in projects:
+                    print(
+                        f"- ID: {project.id}, Name: {project.name}, Tasks: {project.task_count}"
+                    )
+                    print(f"  Description: {project.description}")
 
     def _edit_project(self):
         project_id_str: str = input("Enter project ID to edit: ").strip()
@@ -110,25 +122,29 @@ class CommandLineApp:
             print("💡 INFO: No changes were made.")
             return
 
-        updated_project: Project = self.project_service.edit_project(
-            project_id,
-            new_name=new_name or None,
-            new_description=new_description or None,
-        )
-        print(f"✅ SUCCESS: Project {updated_project.id} updated.")
+        with unit_of_work(self.session):
+            updated_project: Project = self.project_service.edit_project(
+                project_id,
+                new_name=new_name or None,
+                new_description=new_description or None,
+            )
+            print(f"✅ SUCCESS: Project {updated_project.id} updated.")
 
     def _delete_project(self):
         project_id_str: str = input("Enter project ID to delete: ").strip()
         project_id: int = int(project_id_str)
-        self.project_service.delete_project(project_id)
+        with unit_of_work(self.session):
+            self.project_service.delete_project(project_id)
         print(f"✅ SUCCESS: Project with ID {project_id} deleted.")
 
     def _add_task_to_project(self):
         project_id_str: str = input("Enter project ID to add task to: ").strip()
         project_id: int = int(project_id_str)
         
-        # We call the service to ensure the project exists before asking for task details
-        _ = self.project_service.find_project_by_id(project_id)
+        # We call the service to ensure the project exists before asking for task details.
+        # The lookup ends its transaction before the next prompt.
+        with unit_of_work(self.session):
+            _ = self.project_service.find_project_by_id(project_id)
         
         title: str = input("Enter task title: ").strip()
         description: str = input("Enter task description: ").strip()
@@ -142,17 +158,20 @@ class CommandLineApp:
                 print("❌ ERROR: Invalid date format. Please use YYYY-MM-DD.")
                 return
 
-        task: Task = self.task_service.add_task_to_project(
-            project_id, title, description, deadline
-        )
-        print(f"✅ SUCCESS: Task '{task.title}' added to project ID {project_id}.")
+        with unit_of_work(self.session):
+            task: Task = self.task_service.add_task_to_project(
+                project_id, title, description, deadline
+            )
+            print(f"✅ SUCCESS: Task '{task.title}' added to project ID {project_id}.")
 
     def _edit_task(self):
         task_id_str: str = input("Enter task ID to edit: ").strip()
         task_id: int = int(task_id_str)
 
-        # We find the task first to ensure it exists
-        _ = self.task_service.find_task_by_id(task_id)
+        # We find the task first to ensure it exists; the lookup ends its
+        # transaction before the next prompt
+        with unit_of_work(self.session):
+            _ = self.task_service.find_task_by_id(task_id)
 
         new_title: str = input("New title (leave blank to keep): ").strip()
         new_desc: str = input("New description (leave blank to keep): ").strip()
@@ -171,19 +190,21 @@ class CommandLineApp:
                 print("❌ ERROR: Invalid date format. Please use YYYY-MM-DD.")
                 return
 
-        task: Task = self.task_service.edit_task(
-            task_id,
-            new_title=new_title or None,
-            new_description=new_desc or None,
-            new_status=new_status or None, # type: ignore
-            new_deadline=t_deadline,
-        )
-        print(f"✅ SUCCESS: Task {task.id} updated.")
+        with unit_of_work(self.session):
+            task: Task = self.task_service.edit_task(
+                task_id,
+                new_title=new_title or None,
+                new_description=new_desc or None,
+                new_status=new_status or None, # type: ignore
+                new_deadline=t_deadline,
+            )
+            print(f"✅ SUCCESS: Task {task.id} updated.")
 
     def _delete_task(self):
         task_id_str: str = input("Enter task ID to delete: ").strip()
         task_id: int = int(task_id_str)
-        self.task_service.delete_task(task_id)
+        with unit_of_work(self.session):
+            self.task_service.delete_task(task_id)
         print(f"✅ SUCCESS: Task with ID {task_id} deleted.")
 
     def _list_tasks_for_project(self):
@@ -191,20 +212,21 @@ class CommandLineApp:
         project_id: int = int(project_id_str)
         
         # We get the project first to show its name
-        project: Project = self.project_service.find_project_by_id(project_id)
-        tasks: Sequence[Task] = self.task_service.get_tasks_for_project(project_id)
-
-        if not tasks:
-            print(f"No tasks found for project '{project.name}'.")
-        else:
-            print(f"\n--- Tasks for Project: {project.name} ---")
-            for task in tasks:
-                deadline_info = (
-                    task.deadline.strftime("%Y-%m-%d")
-                    if task.deadline
-                    else "No deadline"
-                )
-                print(
-                    f"- ID: {task.id}, Title: {task.title}, "
-                    f"Status: {task.status}, Deadline: {deadline_info}"
-                )
+        with unit_of_work(self.session):
+            project: Project = self.project_service.find_project_by_id(project_id)
+            tasks: Sequence[Task] = self.task_service.get_tasks_for_project(project_id)
+
+            if not tasks:
+                print(f"No tasks found for project '{project.name}'.")
+            else:
+                print(f"\n--- Tasks for Project: {project.name} ---")
+                for task in tasks:
+                    deadline_info = (
+                        task.deadline.strftime("%Y-%m-%d")
+                        if task.deadline
+                        else "No deadline"
+                    )
+                    print(
+                        f"- ID: {task.id}, Title: {task.title}, "
+                        f"Status: {task.status}, Deadline: {deadline_info}"
+                    )
@@ -1,7 +1,9 @@
 # app/commands/autoclose_overdue.py
 import sys
 import os
+import time
 from datetime import datetime
+from typing import Callable, Optional
 from dotenv import load_dotenv
 
 # Add app root to path to allow imports from app.*
@@ -10,9 +12,38 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..",
 # Load .env variables (like DATABASE_URL)
 load_dotenv()
 
+from sqlalchemy.orm import Session
+
 from app.db.session import get_session
+from app.db.unit_of_work import unit_of_work
+from app.metrics.jobs import AUTOCLOSE_BATCH_SECONDS, JOB_RUNS, JOB_SECONDS, TASKS_AUTOCLOSED
 from app.repositories import TaskRepository
 
+def close_overdue_tasks(
+    session: Session,
+    batch_size: int = 1000,
+    on_batch: Optional[Callable[[int, float], None]] = None,
+) -> int:
+    """
+    Closes every task overdue as of now, `batch_size` at a time, each batch
+    in its own unit of work so row locks are never held on more than one
+    batch. `on_batch` is called with each batch's row count and duration
+    in seconds. Returns the number of tasks closed.
+    """
+    task_repo = TaskRepository(session=session)
+    now = datetime.now().astimezone()
+    total = 0
+    while True:
+        started = time.perf_counter()
+        with unit_of_work(session):
+            closed_count = task_repo.close_overdue_tasks(now, batch_size)
+
+        total += closed_count
+        if on_batch is not None:
+            on_batch(closed_count, time.perf_counter() - started)
+        if closed_count < batch_size:
+            return total
+
 def run_autoclose():
     """
     Entry point for the scheduled task.
@@ -20,24 +51,35 @@ def run_autoclose():
     """
     print(f"[{datetime.now().isoformat()}] Running autoclose overdue tasks job...")
     
-    # Setup session and repository
+    # Setup session
     session = get_session()
-    task_repo = TaskRepository(session=session)
+    batch_size = int(os.getenv("AUTOCLOSE_BATCH_SIZE", 1000))
+    batches = 0
+    started = time.perf_counter()
+    outcome = "success"
+
+    def report_batch(count: int, seconds: float) -> None:
+        nonlocal batches
+        batches += 1
+        AUTOCLOSE_BATCH_SECONDS.observe(seconds)
+        print(f"  Batch {batches}: closed {count} tasks in {seconds * 1000:.1f}ms")
     
     try:
-        # Call the repository method
-        closed_count = task_repo.close_overdue_tasks()
+        closed_count = close_overdue_tasks(session, batch_size, on_batch=report_batch)
+        TASKS_AUTOCLOSED.labels("job").inc(closed_count)
         
         if closed_count > 0:
-            print(f"Successfully closed {closed_count} overdue tasks.")
+            print(f"Successfully closed {closed_count} overdue tasks in {batches} batches.")
         else:
             print("No overdue tasks found to close.")
             
     except Exception as e:
         print(f"Error during autoclose job: {e}")
-        session.rollback()
+        outcome = "error"
     finally:
         session.close()
+        JOB_RUNS.labels("autoclose_overdue", outcome).inc()
+        JOB_SECONDS.labels("autoclose_overdue").observe(time.perf_counter() - started)
 
 if __name__ == "__main__":
     # This allows the script to be run directly
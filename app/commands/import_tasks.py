@@ -0,0 +1,74 @@
+# app/commands/import_tasks.py
+import argparse
+import sys
+import os
+import time
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Add app root to path to allow imports from app.*
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# Load .env variables (like DATABASE_URL)
+load_dotenv()
+
+from app.db.session import get_session
+from app.db.unit_of_work import unit_of_work
+from app.repositories import TaskImportRepository
+from app.services import ImportReport, TaskImportService
+from app.exceptions.base import ValidationError
+
+def run_import(path: str, format: str, batch_size: int) -> None:
+    """
+    Imports tasks from an NDJSON or CSV file, printing progress per batch
+    and the rejected lines at the end.
+    """
+    print(f"[{datetime.now().isoformat()}] Importing tasks from {path}...")
+    started = time.perf_counter()
+
+    def report_progress(report: ImportReport) -> None:
+        elapsed = time.perf_counter() - started
+        print(
+            f"  {report.rows_read} rows read, {report.rows_staged} staged, "
+            f"{report.failed} rejected ({elapsed:.1f}s)"
+        )
+
+    session = get_session()
+    service = TaskImportService(
+        TaskImportRepository(session=session),
+        max_projects=int(os.getenv("MAX_PROJECTS", 10)),
+        max_tasks_per_project=int(os.getenv("MAX_TASKS_PER_PROJECT", 20)),
+        batch_size=batch_size,
+    )
+
+    try:
+        with open(path, encoding="utf-8", newline="") as stream, unit_of_work(session):
+            report = service.import_tasks(stream, format, on_progress=report_progress)
+
+        print(
+            f"Imported {report.tasks_created} tasks and created {report.projects_created} "
+            f"projects in {time.perf_counter() - started:.1f}s; {report.failed} rows rejected."
+        )
+        for line, error in report.errors:
+            print(f"  line {line}: {error}")
+        if report.failed > len(report.errors):
+            print(f"  ... and {report.failed - len(report.errors)} more.")
+
+    except (OSError, ValidationError) as e:
+        print(f"Error during import: {e}")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import tasks from an NDJSON or CSV file.")
+    parser.add_argument("path")
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "csv"],
+        help="Defaults to the file extension (.csv or anything else for NDJSON)",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    run_import(args.path, format, args.batch_size)
@@ -0,0 +1,38 @@
+# app/commands/rebuild_task_counters.py
+import sys
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Add app root to path to allow imports from app.*
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# Load .env variables (like DATABASE_URL)
+load_dotenv()
+
+from app.db.session import get_session
+from app.db.unit_of_work import unit_of_work
+from app.repositories import TaskRepository
+
+def run_rebuild():
+    """
+    Recounts every project's task counters from its tasks.
+    Task writes wait for the duration of the recount.
+    """
+    print(f"[{datetime.now().isoformat()}] Rebuilding project task counters...")
+
+    session = get_session()
+    try:
+        with unit_of_work(session):
+            corrected = TaskRepository(session=session).rebuild_task_counters()
+        if corrected > 0:
+            print(f"Corrected the task counters of {corrected} projects.")
+        else:
+            print("All task counters were correct.")
+    except Exception as e:
+        print(f"Error during task counter rebuild: {e}")
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    run_rebuild()
@@ -1,36 +1,48 @@
 # app/commands/scheduler.py
-import schedule
-import time
+import asyncio
 import sys
 import os
 from datetime import datetime
+from dotenv import load_dotenv
 
 # Add app root to path to allow imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-# Import the job function we just created
-from app.commands.autoclose_overdue import run_autoclose
+# Load .env variables (like DATABASE_URL) before app.db reads them
+load_dotenv()
+
+from app.db.session import engine
+from app.scheduling import build_deadline_engine, build_scheduler
+
+async def _run_forever():
+    scheduler = build_scheduler(engine)
+    deadline_engine = build_deadline_engine(engine)
+    await scheduler.start()
+    if deadline_engine is not None:
+        await deadline_engine.start()
+    try:
+        # Sleep until cancelled; the jobs run on their own loops
+        await asyncio.Event().wait()
+    finally:
+        if deadline_engine is not None:
+            await deadline_engine.stop()
+        await scheduler.stop()
 
 def start_scheduler():
     """
-    Starts the scheduler and runs the job at the defined interval.
+    Starts the scheduler as a standalone process.
+
+    The API can host the same jobs itself (SCHEDULER_ENABLED=1); either
+    way, each job runs in only one process at a time, since its leader
+    holds a PostgreSQL advisory lock.
     """
     print(f"[{datetime.now().isoformat()}] Starting task scheduler...")
-    
-    # Schedule the job to run every 15 minutes
-    schedule.every(15).minutes.do(run_autoclose)
-    
-    print(f"[{datetime.now().isoformat()}] Job 'run_autoclose' scheduled to run every 15 minutes.")
     print("Scheduler is running. Press Ctrl+C to exit.")
 
-    # Run the scheduler loop
-    while True:
-        try:
-            schedule.run_pending()
-            time.sleep(1)
-        except KeyboardInterrupt:
-            print("\nScheduler stopped manually. Goodbye!")
-            break
+    try:
+        asyncio.run(_run_forever())
+    except KeyboardInterrupt:
+        print("\nScheduler stopped manually. Goodbye!")
 
 if __name__ == "__main__":
     start_scheduler()
@@ -0,0 +1,81 @@
+# app/db/notifications.py
+import select
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import Engine, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+
+class NotificationChannel:
+    """
+    Cross-process messages over PostgreSQL LISTEN/NOTIFY.
+
+    Writers call publish() inside their transaction; PostgreSQL delivers
+    the notification to every listening process only if that transaction
+    commits. Each process runs one listener thread on a dedicated
+    connection and hands received payloads to `on_message`, on that thread.
+    """
+
+    def __init__(self, channel: str, on_message: Callable[[str], None], on_reset: Callable[[], None]):
+        """
+        `on_reset` is called whenever the listener (re)connects, since
+        notifications sent while it was disconnected are lost.
+        """
+        self.channel = channel
+        self._on_message = on_message
+        self._on_reset = on_reset
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, session: Session, payload: str) -> None:
+        """
+        Queues a notification in the session's current transaction.
+        """
+        session.execute(sql_select(func.pg_notify(self.channel, payload)))
+
+    def start(self, engine: Engine) -> None:
+        """
+        Starts the listener thread.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, args=(engine,), name=f"listen-{self.channel}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the listener thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _listen(self, engine: Engine) -> None:
+        while not self._stop.is_set():
+            try:
+                connection = engine.raw_connection()
+                # Keep this connection out of the pool for as long as we listen
+                connection.detach()
+                dbapi_connection = connection.dbapi_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                self._on_reset()
+                try:
+                    while not self._stop.is_set():
+                        if select.select([dbapi_connection], [], [], 1.0) == ([], [], []):
+                            continue
+                        dbapi_connection.poll()
+                        while dbapi_connection.notifies:
+                            self._on_message(dbapi_connection.notifies.pop(0).payload)
+                finally:
+                    connection.close()
+            except Exception as e:
+                print(f"Listener on '{self.channel}' failed: {e}")
+                self._stop.wait(5)
@@ -0,0 +1,164 @@
+# app/db/pool.py
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.metrics import registry
+
+POOL_CHECKOUT_SECONDS = registry.histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time to obtain a pooled connection, including waiting, connecting and pre-ping.",
+    ("pool",),
+)
+POOL_CHECKOUT_TIMEOUTS = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds.",
+    ("pool",),
+)
+
+def pool_options() -> Dict[str, Any]:
+    """
+    Connection pool settings for create_engine()/create_async_engine(),
+    from DB_POOL_* environment variables.
+    """
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        # Recycle connections before server or proxy idle timeouts drop them
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        # Test connections on checkout, so a database failover costs a
+        # reconnect instead of an error on the first query
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+        # Reuse the most recently returned connection first, so idle ones
+        # beyond the working set can age out through pool_recycle
+        "pool_use_lifo": os.getenv("DB_POOL_USE_LIFO", "1") == "1",
+    }
+
+
+class PoolMetrics:
+    """
+    Checkout statistics of one pool. Times cover everything connect()
+    does: waiting for a free connection, opening a new one and pre-ping.
+    """
+
+    def __init__(self, name: str):
+        self._lock = threading.Lock()
+        self._seconds = POOL_CHECKOUT_SECONDS.labels(name)
+        self._timeouts = POOL_CHECKOUT_TIMEOUTS.labels(name)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self._timeouts.inc()
+        else:
+            self._seconds.observe(seconds)
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+# Keyed by the pool's logging name, which survives engine.dispose()
+_metrics: Dict[str, PoolMetrics] = {}
+
+def _metrics_for(name: str) -> PoolMetrics:
+    try:
+        return _metrics[name]
+    except KeyError:
+        return _metrics.setdefault(name, PoolMetrics(name))
+
+
+class _TimedCheckout:
+    """Pool mixin recording how long each checkout takes."""
+
+    def connect(self):
+        metrics = _metrics_for(self._orig_logging_name or "default")
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool with checkout timing, for the sync engine."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout timing, for the async engine."""
+
+
+def pool_stats(engine: Engine | AsyncEngine) -> Dict[str, Any]:
+    """
+    Live pool gauges and checkout statistics of an engine.
+    """
+    pool = engine.pool
+    metrics = _metrics_for(pool._orig_logging_name or "default")
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool counts overflow from -size; only positive values are extra connections
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": metrics.checkouts,
+        "timeouts": metrics.timeouts,
+        "wait_seconds_total": round(metrics.wait_seconds_total, 6),
+        "wait_seconds_max": round(metrics.wait_seconds_max, 6),
+    }
+
+def register_pool_gauges(engines: Dict[str, Engine | AsyncEngine]) -> None:
+    """
+    Exposes the live connection counts of `engines`, by name, at /metrics.
+    """
+    def read() -> Dict[Tuple[str, str], float]:
+        values = {}
+        for name, engine in engines.items():
+            stats = pool_stats(engine)
+            for state in ("size", "checked_out", "idle", "overflow"):
+                values[(name, state)] = stats[state]
+        return values
+
+    registry.callback_gauge(
+        "db_pool_connections",
+        "Connections of each pool: configured size, checked out, idle and overflow.",
+        ("pool", "state"),
+        read,
+    )
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """
+    Opens `connections` pool connections at once and returns them to the
+    pool, so the first requests do not pay for connection setup.
+    A database that cannot be reached is reported, not raised: the pool
+    connects lazily anyway.
+    """
+    async def open_one() -> AsyncConnection:
+        connection = await engine.connect().start()
+        await connection.exec_driver_sql("SELECT 1")
+        return connection
+
+    # All are held open together, or the pool would keep handing back the first
+    results = await asyncio.gather(*(open_one() for _ in range(connections)), return_exceptions=True)
+    errors = [result for result in results if isinstance(result, Exception)]
+    for result in results:
+        if isinstance(result, AsyncConnection):
+            await result.close()
+    if errors:
+        print(f"⚠️ Warning: could not warm up the connection pool: {errors[0]}")
@@ -0,0 +1,216 @@
+# app/db/replicas.py
+import asyncio
+import itertools
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.metrics import registry
+
+REPLICA_READS = registry.counter(
+    "db_replica_routed_reads_total",
+    "Read-only sessions opened, by where they were sent: a replica's name or primary.",
+    ("target",),
+)
+
+# The primary's current WAL position, as text (asyncpg would decode pg_lsn
+# to an integer, psycopg2 to text). A transaction committed before it has
+# been replayed by a replica once the replica has replayed this far.
+CURRENT_WAL_LSN = select(cast(func.pg_current_wal_lsn(), Text))
+
+def parse_lsn(value: str) -> int:
+    """
+    Converts a WAL position in pg_lsn text form (e.g. '16/B374D848') to an
+    integer, so positions compare numerically. Raises ValueError.
+    """
+    high, separator, low = value.partition("/")
+    if not separator:
+        raise ValueError(f"Invalid LSN: {value!r}")
+    return (int(high, 16) << 32) | int(low, 16)
+
+def format_lsn(lsn: int) -> str:
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+class Replica:
+    """
+    A streaming replica of the primary, and its replay position and lag as
+    of the last check. Until the first check it counts as too far behind.
+    """
+
+    def __init__(self, name: str, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]):
+        self.name = name
+        self.engine = engine
+        self.session_factory = session_factory
+        self.replay_lsn = 0
+        self.lag_seconds = math.inf
+        self.error: Optional[str] = None
+        # time.monotonic() of the last check that found it caught up
+        self.caught_up_at: Optional[float] = None
+
+class ReplicaSet:
+    """
+    Sends reads to streaming replicas while they keep up with the primary.
+
+    A monitor task checks every `check_seconds` how far each replica's
+    WAL replay is behind the primary. Replicas more than `max_lag_seconds`
+    behind, or that cannot be reached, get no reads until they catch up;
+    with none left, reads go to the primary.
+
+    Reads may also name the WAL position of a client's last write (see
+    app.api.stickiness): only replicas known to have replayed past it may
+    serve them, so a client always reads its own writes. Positions are only
+    learnt by the monitor, so such reads usually go to the primary for one
+    check interval after the write.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[Replica],
+        max_lag_seconds: float,
+        check_seconds: float,
+    ):
+        self._primary = primary
+        self.replicas = list(replicas)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self._turn = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    def pick(self, after_lsn: Optional[int] = None) -> Optional[Replica]:
+        """
+        A replica to read from, taking turns among those within the lag
+        limit that have replayed `after_lsn`; None to read from the primary.
+        """
+        eligible = [
+            replica for replica in self.replicas
+            if replica.lag_seconds <= self.max_lag_seconds
+            and (after_lsn is None or replica.replay_lsn >= after_lsn)
+        ]
+        if not eligible:
+            REPLICA_READS.labels("primary").inc()
+            return None
+        replica = eligible[next(self._turn) % len(eligible)]
+        REPLICA_READS.labels(replica.name).inc()
+        return replica
+
+    async def check(self) -> None:
+        """
+        Measures every replica's lag. The primary's position is read first:
+        a replica that has replayed up to it is not behind at all. Otherwise
+        it has at least the data of the last transaction it replayed, and of
+        the last check that found it caught up: its lag is the time since
+        the later of the two. (The first alone would count a replica idle
+        for an hour as an hour behind, right after the next write.)
+        """
+        checked_at = time.monotonic()
+        try:
+            async with self._primary.connect() as connection:
+                primary_lsn = parse_lsn(await connection.scalar(CURRENT_WAL_LSN))
+        except (DBAPIError, OSError) as e:
+            # Without the primary nothing is routed anyway; keep the last values
+            print(f"⚠️ Warning: could not read the primary's WAL position: {e}")
+            return
+        await asyncio.gather(*(self._check(replica, primary_lsn, checked_at) for replica in self.replicas))
+
+    async def _check(self, replica: Replica, primary_lsn: int, checked_at: float) -> None:
+        statement = select(
+            cast(func.pg_last_wal_replay_lsn(), Text),
+            func.extract("epoch", func.now() - func.pg_last_xact_replay_timestamp()),
+        )
+        try:
+            # A replica that takes longer than the lag limit to answer is no use either
+            replay_lsn, replay_age = await asyncio.wait_for(
+                self._fetch(replica, statement), timeout=self.max_lag_seconds
+            )
+        except (DBAPIError, OSError) as e:
+            # Refused connections surface as OSError, timeouts as TimeoutError (an OSError)
+            self._set_error(replica, f"unreachable: {e!r}")
+            return
+        if replay_lsn is None:
+            self._set_error(replica, "not a streaming replica (pg_last_wal_replay_lsn() is null)")
+            return
+
+        if replica.error is not None:
+            print(f"Replica {replica.name} is back.")
+        replica.error = None
+        replica.replay_lsn = parse_lsn(replay_lsn)
+        if replica.replay_lsn >= primary_lsn:
+            replica.lag_seconds = 0.0
+            replica.caught_up_at = checked_at
+            return
+        bounds = []
+        if replay_age is not None:
+            bounds.append(max(float(replay_age), 0.0))
+        if replica.caught_up_at is not None:
+            bounds.append(time.monotonic() - replica.caught_up_at)
+        replica.lag_seconds = min(bounds, default=math.inf)
+
+    @staticmethod
+    async def _fetch(replica: Replica, statement) -> Any:
+        async with replica.engine.connect() as connection:
+            return (await connection.execute(statement)).one()
+
+    @staticmethod
+    def _set_error(replica: Replica, error: str) -> None:
+        if replica.error is None:
+            print(f"⚠️ Warning: replica {replica.name} gets no reads, {error}")
+        replica.error = error
+        replica.lag_seconds = math.inf
+
+    async def start(self) -> None:
+        """
+        Checks the replicas once, so reads can use them right away, and
+        starts the monitor task.
+        """
+        await self._check_or_distrust()
+        self._task = asyncio.create_task(self._run(), name="replica-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_seconds)
+            await self._check_or_distrust()
+
+    async def _check_or_distrust(self) -> None:
+        """
+        check(), but an unexpected error neither ends the monitor nor
+        leaves stale lags in place: no replica gets reads until a later
+        check succeeds.
+        """
+        try:
+            await self.check()
+        except Exception as e:
+            for replica in self.replicas:
+                self._set_error(replica, f"check failed: {e!r}")
+
+    def lags(self) -> Dict[str, float]:
+        return {replica.name: replica.lag_seconds for replica in self.replicas}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_lag_seconds": self.max_lag_seconds,
+            "replicas": {
+                replica.name: {
+                    # JSON has no infinity
+                    "lag_seconds": None if math.isinf(replica.lag_seconds) else round(replica.lag_seconds, 3),
+                    "replay_lsn": format_lsn(replica.replay_lsn),
+                    "usable": replica.lag_seconds <= self.max_lag_seconds,
+                    "error": replica.error,
+                }
+                for replica in self.replicas
+            },
+        }
@@ -1,8 +1,15 @@
 # app/db/session.py
 import os
+from typing import Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
+from app.metrics import instrument_engine, registry
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, pool_options, register_pool_gauges
+from .replicas import Replica, ReplicaSet
+
 
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -10,20 +17,130 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("No DATABASE_URL set for the application")
 
-# Create the main engine
-engine = create_engine(DATABASE_URL)
+def _async_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+# The async engine talks to the same database through asyncpg.
+# ASYNC_DATABASE_URL can override the URL derived from DATABASE_URL.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+
+# Optional streaming replicas of the database, comma-separated, written
+# like DATABASE_URL. The API sends reads to them (see ReplicaSet).
+REPLICA_DATABASE_URLS = [
+    url.strip() for url in os.getenv("REPLICA_DATABASE_URLS", "").split(",") if url.strip()
+]
+
+# Create the main engine (used by the CLI and the scheduler)
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=TimedQueuePool,
+    pool_logging_name="sync",
+    **pool_options(),
+)
+
+# Create the async engine (used by the API)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_logging_name="async",
+    **pool_options(),
+)
+
+# One async engine per replica, each with a pool of the same size
+replica_engines = {
+    f"replica{number}": create_async_engine(
+        _async_url(url),
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_logging_name=f"replica{number}",
+        **pool_options(),
+    )
+    for number, url in enumerate(REPLICA_DATABASE_URLS, start=1)
+}
+
+# Time every statement and expose the pools at /metrics
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+for name, replica_engine in replica_engines.items():
+    instrument_engine(replica_engine.sync_engine, name)
+register_pool_gauges({"sync": engine, "async": async_engine, **replica_engines})
 
 # Create a session factory. This is not a session itself,
 # but a factory that will create sessions when called.
 session_factory = sessionmaker(
-    autocommit=False, 
-    autoflush=False, 
-    bind=engine, 
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=Session
+)
+
+# Async sessions must not expire objects on commit: the API serializes
+# the returned models after the session work is done, outside the
+# greenlet bridge, where lazy refreshes are not allowed.
+async_session_factory = async_sessionmaker(
+    autoflush=False,
+    bind=async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Sessions for work that only reads: their transactions run READ ONLY, so
+# PostgreSQL rejects any write made by mistake on a read path. The option
+# is reset when the connection returns to the pool.
+read_only_session_factory = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine.execution_options(postgresql_readonly=True),
     class_=Session
 )
 
-def get_session() -> Session:
+async_read_only_session_factory = async_sessionmaker(
+    autoflush=False,
+    bind=async_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# Replica sessions are read-only too. They are marked in their info so the
+# project cache is not filled from possibly stale rows.
+replicas: Optional[ReplicaSet] = None
+if replica_engines:
+    replicas = ReplicaSet(
+        async_engine,
+        [
+            Replica(name, replica_engine, async_sessionmaker(
+                autoflush=False,
+                bind=replica_engine.execution_options(postgresql_readonly=True),
+                class_=AsyncSession,
+                expire_on_commit=False,
+                info={"replica": name},
+            ))
+            for name, replica_engine in replica_engines.items()
+        ],
+        max_lag_seconds=float(os.getenv("REPLICA_MAX_LAG_SECONDS", 2)),
+        check_seconds=float(os.getenv("REPLICA_CHECK_SECONDS", 1)),
+    )
+    registry.callback_gauge(
+        "db_replica_lag_seconds",
+        "Replay lag of each replica as of the last check; +Inf if unreachable.",
+        ("replica",),
+        lambda: {(name,): lag for name, lag in replicas.lags().items()},
+    )
+
+def get_session(read_only: bool = False) -> Session:
     """
     Utility function to get a new database session.
     """
-    return session_factory()
+    return read_only_session_factory() if read_only else session_factory()
+
+def get_async_session(read_only: bool = False, after_lsn: Optional[int] = None) -> AsyncSession:
+    """
+    Utility function to get a new async database session. Read-only
+    sessions go to a replica if one is configured and keeps up, and has
+    replayed the WAL position `after_lsn` if given; else to the primary.
+    """
+    if not read_only:
+        return async_session_factory()
+    replica = replicas.pick(after_lsn) if replicas is not None else None
+    if replica is not None:
+        return replica.session_factory()
+    return async_read_only_session_factory()
@@ -0,0 +1,61 @@
+# app/db/unit_of_work.py
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+# session.info key of the callbacks waiting for the transaction to commit
+_AFTER_COMMIT = "after_commit"
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """
+    Runs the block as one transaction on `session`: commits when the block
+    completes and rolls back if it raises.
+
+    Repositories only flush their writes, so everything a request, command
+    or job does inside the block commits (or not) together.
+    """
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        # Callbacks queued before the transaction began have no rollback event
+        session.info.pop(_AFTER_COMMIT, None)
+        raise
+
+@asynccontextmanager
+async def async_unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Async counterpart of unit_of_work().
+    """
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        session.info.pop(_AFTER_COMMIT, None)
+        raise
+
+def after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Calls `callback` once the session's current transaction commits, e.g.
+    to drop cached state the transaction changed. Dropped if it rolls back.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    # Also fired when a savepoint is released; only the outer commit counts
+    if session.in_nested_transaction():
+        return
+    for callback in session.info.pop(_AFTER_COMMIT, ()):
+        callback()
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_after_commit(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_AFTER_COMMIT, None)
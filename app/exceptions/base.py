@@ -12,3 +12,7 @@ class ValidationError(ToDoListError):
 class InvalidDeadlineError(ValidationError):
     """Raised when the provided deadline is in the past."""
     pass
+
+class QueryBudgetExceededError(ToDoListError):
+    """Raised when a unit of work runs more SQL than its budget allows, or repeats a statement (N+1)."""
+    pass
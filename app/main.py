@@ -2,13 +2,18 @@
 import os
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 # Load .env variables
 load_dotenv()
 
 from app.api.routers import api_router
-from app.db.session import get_session
+from app.api.stickiness import ReadYourWritesMiddleware
+from app.cache import project_cache
+from app.db.pool import warm_up
+from app.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from app.db.session import async_engine, engine, get_session, replicas
+from app.scheduling import build_deadline_engine, build_scheduler
 from app.repositories import ProjectRepository, TaskRepository
 from app.services import ProjectService, TaskService
 from app.cli.console import CommandLineApp
@@ -23,8 +28,34 @@ async def lifespan(app: FastAPI):
     """
     # Startup: You can check DB connection here if needed
     print("🚀 ToDoList API is starting up...")
+    await warm_up(async_engine, int(os.getenv("DB_POOL_WARMUP", os.getenv("DB_POOL_SIZE", 10))))
+    if project_cache is not None:
+        project_cache.start_listener(engine)
+    if replicas is not None:
+        await replicas.start()
+
+    # Optionally run the periodic jobs here instead of in a scheduler process
+    app.state.scheduler = None
+    app.state.deadline_engine = None
+    if os.getenv("SCHEDULER_ENABLED", "0") == "1":
+        app.state.scheduler = build_scheduler(engine)
+        await app.state.scheduler.start()
+        app.state.deadline_engine = build_deadline_engine(engine)
+        if app.state.deadline_engine is not None:
+            await app.state.deadline_engine.start()
     yield
     # Shutdown: Cleanup code goes here
+    if app.state.deadline_engine is not None:
+        await app.state.deadline_engine.stop()
+    if app.state.scheduler is not None:
+        await app.state.scheduler.stop()
+    if project_cache is not None:
+        project_cache.stop_listener()
+    if replicas is not None:
+        await replicas.stop()
+        await replicas.dispose()
+    await async_engine.dispose()
+    engine.dispose()
     print("🛑 ToDoList API is shutting down...")
 
 app = FastAPI(
@@ -34,9 +65,22 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Record request counts, latencies and SQL usage per route
+app.add_middleware(MetricsMiddleware)
+
+# Tell clients the WAL position of their writes, so their reads can wait
+# for the replicas to catch up
+if replicas is not None:
+    app.add_middleware(ReadYourWritesMiddleware)
+
 # Include the main API router
 app.include_router(api_router, prefix="/api")
 
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Metrics of this process in the Prometheus text format."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
 
 # --- Legacy CLI Entry Point (Deprecated) ---
 
@@ -76,7 +120,8 @@ def main():
         # Initialize CLI
         cli_app = CommandLineApp(
             project_service=project_service, 
-            task_service=task_service
+            task_service=task_service,
+            session=session,
         )
 
         print(
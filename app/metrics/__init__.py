@@ -0,0 +1,18 @@
+# app/metrics/__init__.py
+from .registry import CONTENT_TYPE, CallbackGauge, Registry, registry
+from .query_budget import query_budget
+from .sql import QueryStats, current_query_stats, instrument_engine, track_queries
+from .http import MetricsMiddleware
+
+__all__ = [
+    "CONTENT_TYPE",
+    "CallbackGauge",
+    "Registry",
+    "registry",
+    "QueryStats",
+    "current_query_stats",
+    "instrument_engine",
+    "track_queries",
+    "query_budget",
+    "MetricsMiddleware",
+]
@@ -0,0 +1,93 @@
+# app/metrics/http.py
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .registry import registry
+from .query_budget import budget_for
+from .sql import QueryStats, current_query_stats
+
+# Route label of requests no route matched, so unknown paths cannot
+# create a series each
+UNMATCHED_ROUTE = "unmatched"
+
+# Statements per request: 1 is a cache miss, dozens is an N+1
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "HTTP requests, by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled.",
+)
+HTTP_REQUEST_STATEMENTS = registry.histogram(
+    "http_request_db_statements",
+    "SQL statements executed per request.",
+    ("method", "route"),
+    buckets=STATEMENT_BUCKETS,
+)
+HTTP_REQUEST_DB_SECONDS = registry.histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL statements per request.",
+    ("method", "route"),
+)
+
+def _route(scope: Scope) -> str:
+    # The router leaves the matched route in the scope
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts, latencies and SQL usage per
+    route template (e.g. /api/projects/{project_id}), not per raw path.
+    Streaming responses are timed until their last chunk is sent.
+
+    Each request is a unit of work held to its endpoint's query budget
+    (see query_budget).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        def describe():
+            route = scope.get("route")
+            return f"{scope['method']} {_route(scope)}", budget_for(getattr(route, "endpoint", None))
+
+        stats = QueryStats(describe=describe)
+        token = current_query_stats.set(stats)
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            current_query_stats.reset(token)
+
+            route = _route(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            HTTP_REQUEST_SECONDS.labels(method, route).observe(elapsed)
+            HTTP_REQUEST_STATEMENTS.labels(method, route).observe(stats.statements)
+            HTTP_REQUEST_DB_SECONDS.labels(method, route).observe(stats.seconds)
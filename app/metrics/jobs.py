@@ -0,0 +1,26 @@
+# app/metrics/jobs.py
+from .registry import registry
+
+# Autoclose runs take from milliseconds (nothing due) to minutes (a backlog)
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+JOB_RUNS = registry.counter(
+    "job_runs_total",
+    "Runs of periodic jobs in this process, by outcome (success or error).",
+    ("job", "outcome"),
+)
+JOB_SECONDS = registry.histogram(
+    "job_duration_seconds",
+    "Duration of periodic job runs.",
+    ("job",),
+    buckets=JOB_BUCKETS,
+)
+TASKS_AUTOCLOSED = registry.counter(
+    "autoclose_closed_tasks_total",
+    "Overdue tasks closed, by what closed them (job or deadline_engine).",
+    ("source",),
+)
+AUTOCLOSE_BATCH_SECONDS = registry.histogram(
+    "autoclose_batch_duration_seconds",
+    "Duration of one autoclose batch transaction.",
+)
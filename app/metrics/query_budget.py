@@ -0,0 +1,67 @@
+# app/metrics/query_budget.py
+import logging
+import os
+import re
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+from app.exceptions.base import QueryBudgetExceededError
+from .registry import registry
+
+if TYPE_CHECKING:
+    from .sql import QueryStats
+
+logger = logging.getLogger(__name__)
+
+# What a unit of work exceeding its budget does: "off", "log" (log a
+# warning, for production) or "raise" (QueryBudgetExceededError, for tests)
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "log")
+
+# Statements a request may run unless its endpoint sets its own budget
+DEFAULT_QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", 20))
+
+# Runs of one identical statement in a unit of work that flag it as an N+1
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))
+
+QUERY_BUDGET_VIOLATIONS = registry.counter(
+    "db_query_budget_violations_total",
+    "Units of work over their statement budget (budget) or repeating a statement (repeat).",
+    ("unit", "kind"),
+)
+
+Endpoint = TypeVar("Endpoint", bound=Callable)
+
+def query_budget(statements: int) -> Callable[[Endpoint], Endpoint]:
+    """
+    Sets the number of SQL statements an endpoint may run per request.
+    """
+    def decorate(endpoint: Endpoint) -> Endpoint:
+        endpoint.query_budget = statements
+        return endpoint
+    return decorate
+
+def budget_for(endpoint: Optional[Callable]) -> Optional[int]:
+    """The statement budget of `endpoint`, or the default."""
+    return getattr(endpoint, "query_budget", DEFAULT_QUERY_BUDGET)
+
+def _shorten(statement: str, length: int = 200) -> str:
+    statement = re.sub(r"\s+", " ", statement).strip()
+    return statement if len(statement) <= length else statement[:length] + "..."
+
+def report_over_budget(stats: "QueryStats") -> None:
+    """Called once, by the first statement past the budget."""
+    _report(stats, "budget", f"'{stats.name}' ran more than {stats.budget} SQL statements.")
+
+def report_repeat(stats: "QueryStats", statement: str) -> None:
+    """Called once per statement, when it has run QUERY_REPEAT_THRESHOLD times."""
+    _report(
+        stats,
+        "repeat",
+        f"'{stats.name}' ran the same SQL statement {QUERY_REPEAT_THRESHOLD} times "
+        f"(N+1?): {_shorten(statement)}",
+    )
+
+def _report(stats: "QueryStats", kind: str, message: str) -> None:
+    QUERY_BUDGET_VIOLATIONS.labels(stats.name, kind).inc()
+    if QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceededError(message)
+    logger.warning(message)
@@ -0,0 +1,96 @@
+# app/metrics/registry.py
+from typing import Callable, Dict, Iterable, Sequence, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    disable_created_metrics,
+    generate_latest,
+)
+from prometheus_client.metrics_core import GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+# Content type of the Prometheus text exposition format rendered by Registry
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Latency buckets in seconds, from a fast cached read to a slow export
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+# No *_created series: a creation timestamp per label set doubles the
+# series count for nothing rate() needs
+disable_created_metrics()
+
+
+class CallbackGauge(Collector):
+    """
+    A gauge read when the registry is rendered. `func` returns a mapping
+    of label values (in labelnames order) to the current value.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        func: Callable[[], Dict[LabelValues, float]],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._func = func
+
+    def describe(self) -> Iterable[Metric]:
+        # Lets the registry check names without calling `func`
+        yield GaugeMetricFamily(self.name, self.documentation, labels=self.labelnames)
+
+    def collect(self) -> Iterable[Metric]:
+        family = GaugeMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for values, value in self._func().items():
+            family.add_metric(values, value)
+        yield family
+
+
+class Registry(CollectorRegistry):
+    """
+    The metrics of this process, rendered in the Prometheus text format
+    by prometheus_client. The helpers create metrics registered here
+    rather than in prometheus_client's global registry.
+    """
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return Counter(name, documentation, labelnames, registry=self)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return Gauge(name, documentation, labelnames, registry=self)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return Histogram(name, documentation, labelnames, registry=self, buckets=buckets)
+
+    def callback_gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        func: Callable[[], Dict[LabelValues, float]],
+    ) -> CallbackGauge:
+        gauge = CallbackGauge(name, documentation, labelnames, func)
+        self.register(gauge)
+        return gauge
+
+    def render(self) -> bytes:
+        return generate_latest(self)
+
+
+# The process-wide registry served at /metrics
+registry = Registry()
@@ -0,0 +1,100 @@
+# app/metrics/sql.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import Engine, event
+
+from .query_budget import (
+    DEFAULT_QUERY_BUDGET,
+    QUERY_BUDGET_MODE,
+    QUERY_REPEAT_THRESHOLD,
+    report_over_budget,
+    report_repeat,
+)
+from .registry import registry
+
+DB_STATEMENT_SECONDS = registry.histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing SQL statements, by engine.",
+    ("engine",),
+)
+
+class QueryStats:
+    """
+    SQL statements run within one unit of work (a request, a CLI command),
+    counted per statement text. SQLAlchemy renders bound parameters as
+    placeholders, so the text fingerprints a query regardless of its values.
+
+    `describe`, if given, supplies the name and budget on the first
+    statement; a request only knows its route once it has been routed.
+    """
+    __slots__ = ("name", "budget", "statements", "seconds", "fingerprints", "_describe")
+
+    def __init__(
+        self,
+        name: str = "",
+        budget: Optional[int] = None,
+        describe: Optional[Callable[[], Tuple[str, Optional[int]]]] = None,
+    ):
+        self.name = name
+        self.budget = budget
+        self.statements = 0
+        self.seconds = 0.0
+        self.fingerprints: Dict[str, int] = {}
+        self._describe = describe
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        repeats = self.fingerprints.get(statement, 0) + 1
+        self.fingerprints[statement] = repeats
+        if QUERY_BUDGET_MODE == "off":
+            return
+
+        if self._describe is not None:
+            self.name, self.budget = self._describe()
+            self._describe = None
+        if repeats == QUERY_REPEAT_THRESHOLD:
+            report_repeat(self, statement)
+        if self.budget is not None and self.statements == self.budget + 1:
+            report_over_budget(self)
+
+
+# Set by MetricsMiddleware for the duration of a request. Context
+# variables follow the request into run_sync greenlets and threadpools.
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+@contextmanager
+def track_queries(name: str, budget: Optional[int] = DEFAULT_QUERY_BUDGET) -> Iterator[QueryStats]:
+    """
+    Counts the statements run inside the block as one unit of work,
+    held to `budget` statements (None for no limit).
+    """
+    stats = QueryStats(name, budget)
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Times every statement executed through `engine` (pass
+    `async_engine.sync_engine` for an async engine) and adds it to the
+    current unit of work's QueryStats.
+    """
+    series = DB_STATEMENT_SECONDS.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._metrics_started
+        series.observe(elapsed)
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
@@ -2,5 +2,6 @@
 from app.db.base import Base
 from .project import Project
 from .task import Task
+from .counter import Counter
 
-__all__ = ["Base", "Project", "Task"]
+__all__ = ["Base", "Project", "Task", "Counter"]
@@ -0,0 +1,20 @@
+# app/models/counter.py
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+# Name of the row holding the number of existing projects
+PROJECTS_COUNTER = "projects"
+# Name of the row bumped by every project write; the project list's ETag
+PROJECTS_VERSION = "projects_version"
+
+class Counter(Base):
+    """
+    Named counter rows. Updating a row takes its row lock, which is what
+    lets quota checks be done atomically inside a single INSERT statement.
+    """
+    __tablename__ = "counters"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
@@ -1,7 +1,7 @@
 # app/models/project.py
 from __future__ import annotations
 from typing import TYPE_CHECKING, List
-from sqlalchemy import String, Integer
+from sqlalchemy import BigInteger, String, Integer, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -16,9 +16,48 @@ class Project(Base):
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     description: Mapped[str] = mapped_column(String(255))
 
+    # Number of tasks in the project, kept in step by TaskRepository.
+    # Task creation checks and bumps it in the same statement as the insert.
+    task_count: Mapped[int] = mapped_column(
+        Integer,
+        server_default="0",
+        init=False
+    )
+
+    # Number of tasks in each status, kept in step by TaskRepository like
+    # task_count; rebuild_task_counters repairs drift
+    todo_count: Mapped[int] = mapped_column(Integer, server_default="0", init=False)
+    doing_count: Mapped[int] = mapped_column(Integer, server_default="0", init=False)
+    done_count: Mapped[int] = mapped_column(Integer, server_default="0", init=False)
+
+    # Bumped by every write to the project's tasks; the task list's ETag
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default="0",
+        init=False
+    )
+
     tasks: Mapped[List["Task"]] = relationship(
         "Task", 
         back_populates="project", 
         cascade="all, delete-orphan",
         init=False
     )
+
+# Case-insensitive uniqueness of project names, enforced by the database
+Index("ux_projects_lower_name", func.lower(Project.name), unique=True)
+
+# Name lookups as you type. A default btree cannot serve LIKE 'abc%' under
+# a non-C collation, so prefixes get a text_pattern_ops index; misspelled
+# names are matched by trigram similarity (pg_trgm), ranked by the GiST index.
+Index(
+    "ix_projects_lower_name_pattern",
+    func.lower(Project.name).label("lower_name"),
+    postgresql_ops={"lower_name": "text_pattern_ops"},
+)
+Index(
+    "ix_projects_lower_name_trgm",
+    func.lower(Project.name).label("lower_name"),
+    postgresql_using="gist",
+    postgresql_ops={"lower_name": "gist_trgm_ops"},
+)
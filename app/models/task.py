@@ -2,7 +2,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
-from sqlalchemy import String, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Computed, String, Integer, ForeignKey, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -14,8 +15,27 @@ if TYPE_CHECKING:
 from typing import Literal
 Status = Literal["todo", "doing", "done"]
 
+# Text search configuration of search_vector. 'simple' lowercases words
+# without stemming or stop words, so titles in any language are matched.
+SEARCH_CONFIG = "simple"
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serve the per-project task list and its filters/sorts
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        Index("ix_tasks_project_id_status_deadline", "project_id", "status", "deadline"),
+        Index("ix_tasks_project_id_deadline_id", "project_id", "deadline", "id"),
+        Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+        # Only the tasks the autoclose job may still close
+        Index(
+            "ix_tasks_open_deadline",
+            "deadline",
+            postgresql_where=text("closed_at IS NULL AND status <> 'done'"),
+        ),
+        # Full-text search over title and description
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     # ستون‌های جدول
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
@@ -40,6 +60,20 @@ class Task(Base):
     
     project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"), init=False)
 
+    # Maintained by the database; title matches rank above description matches.
+    # Deferred, so loading tasks never pulls it in.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', description), 'B')",
+            persisted=True,
+        ),
+        init=False,
+        repr=False,
+        deferred=True,
+    )
+
     project: Mapped["Project"] = relationship(
         "Project", 
         back_populates="tasks",
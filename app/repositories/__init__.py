@@ -1,5 +1,19 @@
 # app/repositories/__init__.py
-from .project_repository import ProjectRepository
-from .task_repository import TaskRepository
+from .project_repository import ProjectField, ProjectRepository, TaskCounts
+from .task_repository import TaskField, TaskFilter, TaskRepository, TaskSortField
+from .async_project_repository import AsyncProjectRepository
+from .async_task_repository import AsyncTaskRepository
+from .import_repository import TaskImportRepository
 
-__all__ = ["ProjectRepository", "TaskRepository"]
+__all__ = [
+    "ProjectField",
+    "ProjectRepository",
+    "TaskCounts",
+    "TaskRepository",
+    "TaskField",
+    "TaskFilter",
+    "TaskSortField",
+    "AsyncProjectRepository",
+    "AsyncTaskRepository",
+    "TaskImportRepository",
+]
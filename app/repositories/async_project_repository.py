@@ -0,0 +1,33 @@
+# app/repositories/async_project_repository.py
+from typing import Callable, Optional, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import ProjectCache
+from .project_repository import ProjectRepository
+
+T = TypeVar("T")
+
+class AsyncProjectRepository:
+    """
+    Async counterpart of ProjectRepository.
+
+    Work runs through run(), against the sync ProjectRepository inside
+    AsyncSession.run_sync(), so the sync and async paths share the same
+    queries and never drift apart.
+    """
+
+    def __init__(self, session: AsyncSession, cache: Optional[ProjectCache] = None):
+        """
+        Initialize the repository with an async database session and an
+        optional project cache.
+        """
+        self.session = session
+        self.cache = cache
+
+    async def run(self, fn: Callable[[ProjectRepository], T]) -> T:
+        """
+        Run `fn` against a sync ProjectRepository bound to this session.
+        """
+        return await self.session.run_sync(
+            lambda session: fn(ProjectRepository(session, self.cache))
+        )
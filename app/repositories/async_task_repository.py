@@ -0,0 +1,45 @@
+# app/repositories/async_task_repository.py
+from typing import AsyncIterator, Callable, Sequence, Optional, TypeVar
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .task_repository import TaskFilter, TaskRepository
+
+T = TypeVar("T")
+
+class AsyncTaskRepository:
+    """
+    Async counterpart of TaskRepository.
+
+    Like AsyncProjectRepository, it runs work against the sync repository
+    through AsyncSession.run_sync() instead of duplicating queries. Only
+    exports, which stream from a server-side cursor, are async natively.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize the repository with an async database session.
+        """
+        self.session = session
+
+    async def run(self, fn: Callable[[TaskRepository], T]) -> T:
+        """
+        Run `fn` against a sync TaskRepository bound to this session.
+        """
+        return await self.session.run_sync(lambda session: fn(TaskRepository(session)))
+
+    async def stream_for_export(
+        self, filters: Optional[TaskFilter] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yields the rows of TaskRepository.export_statement() in batches of
+        `batch_size`, read from a server-side cursor: memory use depends on
+        the batch size only, and the first batch arrives before the query
+        has produced its last row.
+        """
+        statement = TaskRepository.export_statement(filters).execution_options(
+            yield_per=batch_size
+        )
+        result = await self.session.stream(statement)
+        async for batch in result.partitions():
+            yield batch
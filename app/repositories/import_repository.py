@@ -0,0 +1,256 @@
+# app/repositories/import_repository.py
+import csv
+import io
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    case,
+    exists,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import Counter, Project, Task
+from app.models.counter import PROJECTS_COUNTER, PROJECTS_VERSION
+from .task_repository import STATUS_COUNTERS, TaskRepository
+
+# Per-transaction staging table that COPY loads into. It lives in its own
+# MetaData so it is never part of the schema or of Alembic's autogenerate.
+staging = Table(
+    "task_import",
+    MetaData(),
+    Column("line", Integer, primary_key=True),
+    Column("project_name", String),
+    Column("project_description", String),
+    Column("title", String),
+    Column("description", String),
+    Column("status", String),
+    Column("deadline", DateTime(timezone=True)),
+    Column("project_id", Integer),
+    Column("error", String),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Columns filled by copy_rows(), in the order of each row tuple
+COPY_COLUMNS = (
+    "line",
+    "project_name",
+    "project_description",
+    "title",
+    "description",
+    "status",
+    "deadline",
+)
+
+
+class TaskImportRepository:
+    """
+    Loads tasks, and the projects they name, in bulk: rows are streamed
+    into a temporary staging table with COPY and then merged into projects
+    and tasks with a handful of set-based statements, in one transaction.
+    """
+
+    def __init__(self, session: Session):
+        """
+        Initialize the repository with a database session.
+        """
+        self.session = session
+
+    def create_staging(self) -> None:
+        """
+        Create the staging table; it is dropped when the transaction ends.
+        """
+        staging.create(self.session.connection())
+
+    def copy_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Append rows, as tuples of COPY_COLUMNS, to the staging table.
+        """
+        buffer = io.StringIO()
+        # None is written as an unquoted empty field, which COPY reads as NULL
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {staging.name} ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def merge(
+        self, max_projects: int, max_tasks: int, max_errors: int
+    ) -> Tuple[int, int, int, List[Tuple[int, str]]]:
+        """
+        Merge the staged rows.
+
+        Projects named by the rows but missing are created first, as many
+        as `max_projects` allows, in order of first appearance. Each
+        project then takes its rows in line order until it holds
+        `max_tasks` tasks. Counters and versions are updated, and the new
+        deadlines announced, like the single-row write paths do.
+
+        Returns (projects created, tasks created, rows rejected, the first
+        `max_errors` (line, error) pairs).
+        """
+        projects_created = self._create_projects(max_projects)
+
+        # Resolve every row's project, case-insensitively like the name index
+        self.session.execute(
+            update(staging)
+            .where(func.lower(Project.name) == func.lower(staging.c.project_name))
+            .values(project_id=Project.id)
+        )
+        self.session.execute(
+            update(staging)
+            .where(staging.c.project_id.is_(None))
+            .values(error=f"Cannot create more than {max_projects} projects.")
+        )
+
+        # Lock the target projects so their task_count holds until commit
+        self.session.execute(
+            select(Project.id)
+            .where(Project.id.in_(select(staging.c.project_id)))
+            .order_by(Project.id)
+            .with_for_update()
+        )
+        ranked = (
+            select(
+                staging.c.line,
+                func.row_number()
+                .over(partition_by=staging.c.project_id, order_by=staging.c.line)
+                .label("position"),
+            )
+            .where(staging.c.error.is_(None))
+            .subquery()
+        )
+        self.session.execute(
+            update(staging)
+            .where(
+                staging.c.line == ranked.c.line,
+                Project.id == staging.c.project_id,
+                ranked.c.position > max_tasks - Project.task_count,
+            )
+            .values(error=literal("Cannot add more tasks to '") + Project.name + "'.")
+        )
+
+        deadlines = self.session.scalars(
+            insert(Task)
+            .from_select(
+                ["title", "description", "status", "deadline", "closed_at", "project_id"],
+                select(
+                    staging.c.title,
+                    staging.c.description,
+                    staging.c.status,
+                    staging.c.deadline,
+                    case((staging.c.status == "done", func.now())),
+                    staging.c.project_id,
+                )
+                .where(staging.c.error.is_(None))
+                .order_by(staging.c.line),
+            )
+            .returning(Task.deadline)
+        ).all()
+        tasks_created = len(deadlines)
+        # Like single creates, so the deadline engine schedules them now
+        TaskRepository(self.session)._announce_deadlines(deadlines)
+
+        per_project = (
+            select(
+                staging.c.project_id,
+                func.count().label("imported"),
+                *(
+                    func.count().filter(staging.c.status == status).label(status)
+                    for status in STATUS_COUNTERS
+                ),
+            )
+            .where(staging.c.error.is_(None))
+            .group_by(staging.c.project_id)
+            .subquery()
+        )
+        self.session.execute(
+            update(Project)
+            .where(Project.id == per_project.c.project_id)
+            .values(
+                task_count=Project.task_count + per_project.c.imported,
+                version=Project.version + 1,
+                **{
+                    counter: getattr(Project, counter) + per_project.c[status]
+                    for status, counter in STATUS_COUNTERS.items()
+                },
+            )
+        )
+
+        rejected = self.session.scalar(
+            select(func.count()).where(staging.c.error.is_not(None))
+        )
+        errors = self.session.execute(
+            select(staging.c.line, staging.c.error)
+            .where(staging.c.error.is_not(None))
+            .order_by(staging.c.line)
+            .limit(max_errors)
+        ).all()
+        return projects_created, tasks_created, rejected, [tuple(error) for error in errors]
+
+    def _create_projects(self, max_projects: int) -> int:
+        """
+        Create the missing projects the staged rows name, within the limit.
+        """
+        # Hold the projects counter row for the rest of the transaction
+        existing = self.session.scalar(
+            select(Counter.value)
+            .where(Counter.name == PROJECTS_COUNTER)
+            .with_for_update()
+        ) or 0
+        if existing >= max_projects:
+            return 0
+
+        missing = (
+            select(
+                staging.c.project_name,
+                staging.c.project_description,
+                staging.c.line,
+            )
+            .distinct(func.lower(staging.c.project_name))
+            .where(
+                ~exists().where(func.lower(Project.name) == func.lower(staging.c.project_name))
+            )
+            .order_by(func.lower(staging.c.project_name), staging.c.line)
+            .subquery()
+        )
+        created = self.session.execute(
+            insert(Project)
+            .from_select(
+                ["name", "description"],
+                select(missing.c.project_name, missing.c.project_description)
+                .order_by(missing.c.line)
+                .limit(max_projects - existing),
+            )
+            .on_conflict_do_nothing(index_elements=[func.lower(Project.name)])
+        ).rowcount
+
+        if created:
+            self.session.execute(
+                update(Counter)
+                .where(Counter.name == PROJECTS_COUNTER)
+                .values(value=Counter.value + created)
+            )
+            self.session.execute(
+                update(Counter)
+                .where(Counter.name == PROJECTS_VERSION)
+                .values(value=Counter.value + 1)
+            )
+        return created
@@ -1,79 +1,422 @@
 # app/repositories/project_repository.py
-from typing import List, Sequence
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Sequence, get_args
+from sqlalchemy import Row, String, func, literal, select, true, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, make_transient_to_detached
 
 
 
-from app.models import Project
+from app.cache import ProjectCache
+from app.db.unit_of_work import after_commit
+from app.models import Counter, Project, Task
+from app.models.counter import PROJECTS_COUNTER, PROJECTS_VERSION
+from app.models.task import Status
+from .task_repository import TASK_COLUMNS
+
+# Project columns read paths may select by name, for ?fields= projections
+ProjectField = Literal["id", "name", "description"]
+PROJECT_COLUMNS = {field: getattr(Project, field) for field in get_args(ProjectField)}
+
+def _escape_like(value: str) -> str:
+    """Escapes the LIKE wildcards in `value`, using backslash as the escape."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+@dataclass(frozen=True)
+class TaskCounts:
+    """
+    Number of tasks of a project, in total and by status. `overdue` counts
+    the open tasks past their deadline that autoclose has not closed yet.
+    """
+    total: int
+    todo: int
+    doing: int
+    done: int
+    overdue: int
+
 
 class ProjectRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, cache: Optional[ProjectCache] = None):
         """
-        Initialize the repository with a database session.
+        Initialize the repository with a database session and, optionally,
+        a read-through cache for get_by_id() and get_by_name().
         """
         self.session = session
+        self.cache = cache
 
-    def create(self, name: str, description: str) -> Project:
+    def create(self, name: str, description: str, max_projects: int) -> Project | None:
         """
-        Create a new project.
+        Create a new project, unless `max_projects` already exist or the
+        name is taken (case-insensitive). Returns None in those cases.
+
+        Both rules are enforced by one statement: the projects counter row
+        is bumped only while it is below the limit (its row lock serializes
+        concurrent creates), and the insert reads from that update and
+        skips on a conflict with the lower(name) unique index.
         """
-        # We use init=False on relationships, so we pass
-        # model fields explicitly.
-        db_project = Project(name=name, description=description)
-        self.session.add(db_project)
-        self.session.commit()
-        self.session.refresh(db_project)
+        slot = (
+            update(Counter)
+            .where(Counter.name == PROJECTS_COUNTER, Counter.value < max_projects)
+            .values(value=Counter.value + 1)
+            .returning(Counter.value)
+            .cte("slot")
+        )
+        inserted = (
+            insert(Project)
+            .from_select(
+                ["name", "description"],
+                select(literal(name, String), literal(description, String)).select_from(slot),
+            )
+            .on_conflict_do_nothing(index_elements=[func.lower(Project.name)])
+            .returning(*Project.__table__.c)
+            .cte("inserted")
+        )
+        # One row if a slot was taken; its project is None on a name conflict
+        statement = (
+            select(slot.c.value, aliased(Project, inserted))
+            .select_from(slot)
+            .outerjoin(inserted, true())
+            .add_cte(slot)
+        )
+        row = self.session.execute(statement).first()
+        if row is None:
+            return None
+        db_project = row[1]
+        if db_project is None:
+            # Give the slot back rather than roll back the caller's unit of work
+            self.session.execute(
+                update(Counter)
+                .where(Counter.name == PROJECTS_COUNTER)
+                .values(value=Counter.value - 1)
+            )
+            return None
+        self._bump_list_version()
+        # Nothing to invalidate: the cache never stores misses
         return db_project
 
     def get_by_id(self, project_id: int) -> Project | None:
         """
         Get a single project by its ID.
         """
+        if self.cache is not None:
+            cached = self.cache.get(project_id)
+            if cached is not None:
+                return self._from_cache(cached)
+
         # .get() is the simplest way to fetch by primary key
-        return self.session.get(Project, project_id)
+        db_project = self.session.get(Project, project_id)
+        self._cache_put(db_project)
+        return db_project
 
     def get_by_name(self, name: str) -> Project | None:
         """
         Get a single project by its name (case-insensitive).
         """
-        statement = select(Project).where(Project.name.ilike(name))
-        return self.session.scalars(statement).first()
+        if self.cache is not None:
+            project_id = self.cache.get_id_by_name(name)
+            if project_id is not None:
+                db_project = self.get_by_id(project_id)
+                # The name may have moved on since it was cached
+                if db_project is not None and db_project.name.lower() == name.lower():
+                    return db_project
 
-    def get_all(self) -> Sequence[Project]:
+        # Compared like the lower(name) unique index, which serves the lookup;
+        # ilike would also treat % and _ in the name as wildcards
+        statement = select(Project).where(func.lower(Project.name) == func.lower(name))
+        db_project = self.session.scalars(statement).first()
+        self._cache_put(db_project)
+        return db_project
+
+    def find_by_prefix(self, prefix: str, limit: int) -> Sequence[Project]:
+        """
+        Get up to `limit` projects whose name starts with `prefix`
+        (case-insensitive), in name order.
+        """
+        lower_name = func.lower(Project.name)
+        # The pattern is built here rather than in SQL, so the planner sees
+        # a constant prefix it can turn into an index range
+        pattern = _escape_like(prefix.lower()) + "%"
+        statement = (
+            select(Project)
+            .where(lower_name.like(pattern, escape="\\"))
+            .order_by(lower_name)
+            .limit(limit)
+        )
+        return self.session.scalars(statement).all()
+
+    def find_similar(
+        self, name: str, limit: int, exclude_ids: Sequence[int] = ()
+    ) -> Sequence[Project]:
+        """
+        Get up to `limit` projects whose name is similar to `name` by
+        trigram similarity (pg_trgm), most similar first. Tolerates typos
+        and matches words anywhere in the name.
+        """
+        lower_name = func.lower(Project.name)
+        term = name.lower()
+        statement = (
+            select(Project)
+            # % is pg_trgm's similarity test; <-> its distance, which the
+            # GiST index returns in order
+            .where(lower_name.bool_op("%")(term))
+            .order_by(lower_name.op("<->")(term), Project.id)
+            .limit(limit)
+        )
+        if exclude_ids:
+            statement = statement.where(Project.id.not_in(exclude_ids))
+        return self.session.scalars(statement).all()
+
+    def _cache_put(self, db_project: Project | None) -> None:
+        """
+        Cache a project read from the database, unless it was read from a
+        replica: a lagging replica may return a row this process has just
+        invalidated, and the stale copy would outlive the lag.
+        """
+        if db_project is not None and self.cache is not None and "replica" not in self.session.info:
+            self.cache.put(db_project)
+
+    def _from_cache(self, cached: Dict[str, Any]) -> Project:
+        """
+        Attach a cached project snapshot to the session without a query.
+        Columns missing from the snapshot load lazily on first access.
+        """
+        project = Project(name=cached["name"], description=cached["description"])
+        project.id = cached["id"]
+        make_transient_to_detached(project)
+        return self.session.merge(project, load=False)
+
+    def get_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Sequence[Project]:
         """
         Get all projects, sorted by ID.
+        Pass the last seen ID as `after_id` to read the next page (keyset
+        pagination): the primary key index seeks straight to it, so every
+        page costs the same no matter how deep the client pages.
         """
         statement = select(Project).order_by(Project.id)
+        if after_id is not None:
+            statement = statement.where(Project.id > after_id)
+        if limit is not None:
+            statement = statement.limit(limit)
         return self.session.scalars(statement).all()
-    
+
+    def get_project_rows(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[ProjectField]] = None,
+    ) -> Sequence[Row]:
+        """
+        Like get_all(), for reading only: returns plain rows of the columns
+        in `fields` (all if None; id is always included), which skip the
+        identity map and instrumentation.
+        """
+        wanted = set(PROJECT_COLUMNS) if fields is None else {"id", *fields}
+        columns = [column for field, column in PROJECT_COLUMNS.items() if field in wanted]
+        statement = select(*columns).order_by(Project.id)
+        if after_id is not None:
+            statement = statement.where(Project.id > after_id)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return self.session.execute(statement).all()
+
     def count(self) -> int:
         """
         Get the total number of projects.
         """
-        return len(self.session.scalars(select(Project)).all())
+        statement = select(Counter.value).where(Counter.name == PROJECTS_COUNTER)
+        return self.session.scalar(statement) or 0
+
+    def get_list_version(self) -> int:
+        """
+        Get the version of the project list, bumped by every project write.
+        """
+        statement = select(Counter.value).where(Counter.name == PROJECTS_VERSION)
+        return self.session.scalar(statement) or 0
+
+    def get_tasks_version(self, project_id: int) -> int | None:
+        """
+        Get the version of a project's task list, bumped by every write to
+        its tasks. Returns None if the project does not exist.
+        """
+        statement = select(Project.version).where(Project.id == project_id)
+        return self.session.scalar(statement)
+
+    def get_task_counts(self, project_ids: Sequence[int]) -> Dict[int, TaskCounts]:
+        """
+        Get the task counts of the given projects; missing projects are left out.
+
+        Totals come from the counters TaskRepository keeps on the project
+        row. The overdue count is read from the partial index
+        ix_tasks_open_deadline, which autoclose keeps small.
+        """
+        overdue = (
+            select(Task.project_id, func.count().label("overdue"))
+            .where(
+                Task.project_id.in_(project_ids),
+                Task.status != "done",
+                Task.closed_at == None,
+                Task.deadline < func.now(),
+            )
+            .group_by(Task.project_id)
+            .subquery()
+        )
+        statement = (
+            select(
+                Project.id,
+                Project.task_count,
+                Project.todo_count,
+                Project.doing_count,
+                Project.done_count,
+                func.coalesce(overdue.c.overdue, 0),
+            )
+            .outerjoin(overdue, overdue.c.project_id == Project.id)
+            .where(Project.id.in_(project_ids))
+        )
+        return {
+            project_id: TaskCounts(*counts)
+            for project_id, *counts in self.session.execute(statement)
+        }
+
+    def get_tasks_by_project(
+        self,
+        project_ids: Sequence[int],
+        limit: int,
+        statuses: Optional[Sequence[Status]] = None,
+    ) -> Dict[int, List[Row]]:
+        """
+        Get the first `limit` tasks (by ID) of each given project as plain
+        rows, optionally only those in `statuses`, in one query for all of them.
+
+        A windowed row_number() caps every project at `limit` rows in the
+        database, which selectinload() cannot do, while keeping the
+        one-query-per-page cost of eager loading.
+        """
+        criteria = [Task.project_id.in_(project_ids)]
+        if statuses:
+            criteria.append(Task.status.in_(statuses))
+        ranked = (
+            select(
+                *TASK_COLUMNS.values(),
+                func.row_number()
+                .over(partition_by=Task.project_id, order_by=Task.id)
+                .label("position"),
+            )
+            .where(*criteria)
+            .subquery()
+        )
+        statement = (
+            select(*(ranked.c[field] for field in TASK_COLUMNS))
+            .where(ranked.c.position <= limit)
+            .order_by(ranked.c.project_id, ranked.c.id)
+        )
+        tasks: Dict[int, List[Row]] = {project_id: [] for project_id in project_ids}
+        for row in self.session.execute(statement):
+            tasks[row.project_id].append(row)
+        return tasks
+
+    def _bump_list_version(self) -> None:
+        self.session.execute(
+            update(Counter)
+            .where(Counter.name == PROJECTS_VERSION)
+            .values(value=Counter.value + 1)
+        )
 
     def update(
-        self, 
-        project: Project, 
-        new_name: str | None = None, 
-        new_description: str | None = None
-    ) -> Project:
-        """
-        Update a project's details.
-        """
-        if new_name:
-            project.name = new_name
-        if new_description:
-            project.description = new_description
-        
-        self.session.commit()
-        self.session.refresh(project)
-        return project
+        self,
+        project_id: int,
+        new_name: str | None = None,
+        new_description: str | None = None,
+    ) -> Project | None:
+        """
+        Update the given fields of a project in one UPDATE ... RETURNING,
+        which also bumps the project list's version. Returns the updated
+        project, or None if it does not exist or the new name is taken
+        (case-insensitive) by another project.
+        """
+        values = {}
+        if new_name is not None:
+            values["name"] = new_name
+        if new_description is not None:
+            values["description"] = new_description
+        if not values:
+            return self.get_by_id(project_id)
+
+        # The old name is read from the locked row, to drop it from the cache
+        locked = (
+            select(Project.id, Project.name)
+            .where(Project.id == project_id)
+            .with_for_update()
+            .subquery("locked")
+        )
+        changed = (
+            update(Project)
+            .where(Project.id == locked.c.id)
+            .values(**values)
+            .returning(*Project.__table__.c, locked.c.name.label("old_name"))
+            .cte("changed")
+        )
+        list_version = (
+            update(Counter)
+            .where(Counter.name == PROJECTS_VERSION, select(changed.c.id).exists())
+            .values(value=Counter.value + 1)
+            .cte("list_version")
+        )
+        statement = (
+            select(aliased(Project, changed), changed.c.old_name)
+            .add_cte(list_version)
+            .execution_options(populate_existing=True)
+        )
+        if new_name is None:
+            row = self.session.execute(statement).first()
+        else:
+            # The lower(name) unique index catches a rename onto another
+            # project's name; checking first would cost a query every time.
+            # The savepoint keeps the caller's unit of work usable after it.
+            try:
+                with self.session.begin_nested():
+                    row = self.session.execute(statement).first()
+            except IntegrityError:
+                return None
+        if row is None:
+            return None
+
+        db_project, old_name = row
+        self._publish_invalidation(project_id)
+        self._invalidate_on_commit(project_id, old_name, db_project.name)
+        return db_project
 
     def delete(self, project: Project) -> None:
         """
         Delete a project.
         """
+        self.session.execute(
+            update(Counter)
+            .where(Counter.name == PROJECTS_COUNTER)
+            .values(value=Counter.value - 1)
+        )
+        project_id, name = project.id, project.name
         self.session.delete(project)
-        self.session.commit()
+        self._bump_list_version()
+        self._publish_invalidation(project_id)
+        self.session.flush()
+        self._invalidate_on_commit(project_id, name)
+
+    def _publish_invalidation(self, project_id: int) -> None:
+        """
+        Queue a cache invalidation for other processes; it is only
+        delivered if the current transaction commits. Sent even without a
+        cache here, for the processes that have one.
+        """
+        ProjectCache.publish(self.session, project_id)
+
+    def _invalidate_on_commit(self, project_id: int, *names: str) -> None:
+        """
+        Drop a project from this process's cache once the transaction
+        commits, so any read that misses afterwards loads the new row.
+        """
+        if self.cache is not None:
+            cache = self.cache
+            after_commit(self.session, lambda: cache.invalidate(project_id, names))
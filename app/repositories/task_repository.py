@@ -1,14 +1,95 @@
 # app/repositories/task_repository.py
-from typing import Sequence, Optional
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Literal, Sequence, Optional, Tuple, get_args
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import CTE, ColumnElement, DateTime, Row, Select, String, and_, case, cast, delete, func, insert, literal, null, or_, select, text, true
+from sqlalchemy.dialects.postgresql import ARRAY, REAL
 
 from datetime import datetime
 from sqlalchemy import update
 
 from app.models import Task, Project
-from app.models.task import Status  # Import Status from its correct file
+from app.models.task import SEARCH_CONFIG, Status  # Import Status from its correct file
+
+TaskSortField = Literal["id", "deadline", "created_at"]
+
+# Task columns read paths may select by name, for ?fields= projections
+TaskField = Literal[
+    "id", "project_id", "title", "description", "status", "deadline", "created_at", "closed_at"
+]
+TASK_COLUMNS = {field: getattr(Task, field) for field in get_args(TaskField)}
+
+_SORT_COLUMNS = {
+    "id": Task.id,
+    "deadline": Task.deadline,
+    "created_at": Task.created_at,
+}
+
+# Project column counting the tasks in each status
+STATUS_COUNTERS = {status: f"{status}_count" for status in get_args(Status)}
+
+# Channel announcing new or moved task deadlines to the deadline engine.
+# Announcing costs a statement per such write, so it is opt-in.
+DEADLINE_CHANNEL = "task_deadlines"
+ANNOUNCE_DEADLINES = os.getenv("DEADLINE_ENGINE_ENABLED", "0") == "1"
+
+# Columns of a task export, in output order
+EXPORT_COLUMNS = tuple(TASK_COLUMNS.values())
+
+def task_columns(fields: Optional[Sequence[str]] = None, required: Sequence[str] = ()) -> List[Any]:
+    """
+    Columns of `fields` (all task columns if None) plus the `required` ones
+    a query needs for itself, e.g. its sort key, in TASK_COLUMNS order.
+    """
+    wanted = set(TASK_COLUMNS) if fields is None else {*fields, *required}
+    return [column for field, column in TASK_COLUMNS.items() if field in wanted]
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """
+    Optional conditions for task queries. Fields left as None are ignored.
+    `closed` selects tasks closed (True) or not yet closed (False) by the
+    autoclose job, i.e. by whether closed_at is set.
+    """
+    project_id: Optional[int] = None
+    statuses: Optional[Sequence[Status]] = None
+    deadline_before: Optional[datetime] = None
+    deadline_after: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    closed: Optional[bool] = None
+
+    def conditions(self) -> List[ColumnElement[bool]]:
+        """
+        Returns the WHERE clauses for the set fields.
+        """
+        conditions: List[ColumnElement[bool]] = []
+        if self.project_id is not None:
+            conditions.append(Task.project_id == self.project_id)
+        if self.statuses:
+            conditions.append(Task.status.in_(self.statuses))
+        if self.deadline_before is not None:
+            conditions.append(Task.deadline < self.deadline_before)
+        if self.deadline_after is not None:
+            conditions.append(Task.deadline > self.deadline_after)
+        if self.created_after is not None:
+            conditions.append(Task.created_at >= self.created_after)
+        if self.created_before is not None:
+            conditions.append(Task.created_at < self.created_before)
+        if self.closed is not None:
+            conditions.append(
+                Task.closed_at.is_not(None) if self.closed else Task.closed_at.is_(None)
+            )
+        return conditions
+
+    def apply(self, statement: Select) -> Select:
+        """
+        Adds the WHERE clauses for the set fields to `statement`.
+        """
+        return statement.where(*self.conditions())
 
 
 class TaskRepository:
@@ -20,103 +101,566 @@ class TaskRepository:
 
     def create(
         self,
-        project: Project,
+        project_id: int,
         title: str,
         description: str,
+        max_tasks: int,
         deadline: Optional[datetime] = None,
-    ) -> Task:
-        """
-        Create a new task and associate it with a project.
-        """
-        # Create the task instance
-        db_task = Task(
-            title=title, 
-            description=description, 
-            deadline=deadline
-        )
-        
-        # Add it to the project's list of tasks
-        # SQLAlchemy will automatically handle setting the project_id
-        project.tasks.append(db_task)
-        
-        self.session.commit()
-        self.session.refresh(db_task)
+    ) -> Task | None:
+        """
+        Create a new task in a project, unless the project does not exist
+        or already holds `max_tasks` tasks. Returns None in those cases.
+
+        The project's task_count is bumped only while it is below the
+        limit, and the task is inserted from that update's result, so the
+        check and the insert are one atomic statement.
+        Every write to a project's tasks also bumps the project's version
+        and moves its per-status counters (STATUS_COUNTERS) in step.
+        """
+        slot = (
+            update(Project)
+            .where(Project.id == project_id, Project.task_count < max_tasks)
+            .values(
+                task_count=Project.task_count + 1,
+                todo_count=Project.todo_count + 1,
+                version=Project.version + 1,
+            )
+            .returning(Project.id)
+            .cte("slot")
+        )
+        statement = (
+            insert(Task)
+            .from_select(
+                ["title", "description", "deadline", "status", "project_id"],
+                select(
+                    literal(title, String),
+                    literal(description, String),
+                    literal(deadline, DateTime(timezone=True)),
+                    literal("todo", String),
+                    slot.c.id,
+                ),
+            )
+            .returning(Task)
+            .add_cte(slot)
+        )
+        db_task = self.session.scalars(statement).first()
+        if db_task is not None:
+            self._announce_deadlines([db_task.deadline])
         return db_task
 
+    def create_many(
+        self,
+        project_id: int,
+        tasks: Sequence[Tuple[str, str, Optional[datetime]]],
+        max_tasks: int,
+    ) -> Sequence[Task] | None:
+        """
+        Create several (title, description, deadline) tasks in a project
+        with one multi-row INSERT ... RETURNING, in input order.
+        Returns None, inserting nothing, if the project does not exist or
+        the tasks would take it past `max_tasks`.
+        """
+        slot = (
+            update(Project)
+            .where(
+                Project.id == project_id,
+                Project.task_count + len(tasks) <= max_tasks,
+            )
+            .values(
+                task_count=Project.task_count + len(tasks),
+                todo_count=Project.todo_count + len(tasks),
+                version=Project.version + 1,
+            )
+            .returning(Project.id)
+            .cte("slot")
+        )
+        # unnest() over three array parameters keeps the SQL text the same
+        # for any batch size, so it is planned and cached as one statement
+        titles, descriptions, deadlines = zip(*tasks)
+        rows = func.unnest(
+            literal(list(titles), ARRAY(String)),
+            literal(list(descriptions), ARRAY(String)),
+            literal(list(deadlines), ARRAY(DateTime(timezone=True))),
+        ).table_valued(
+            "title", "description", "deadline", with_ordinality="position"
+        ).render_derived(name="rows")
+
+        statement = (
+            insert(Task)
+            .from_select(
+                ["title", "description", "deadline", "status", "project_id"],
+                select(
+                    rows.c.title,
+                    rows.c.description,
+                    rows.c.deadline,
+                    literal("todo", String),
+                    slot.c.id,
+                )
+                .select_from(rows.join(slot, true()))
+                .order_by(rows.c.position),
+            )
+            .returning(Task)
+            .add_cte(slot)
+        )
+        # IDs are drawn in SELECT order, so sorting by ID restores input order
+        db_tasks = sorted(self.session.scalars(statement).all(), key=lambda task: task.id)
+        self._announce_deadlines(task.deadline for task in db_tasks)
+        return db_tasks or None
+
     def get_by_id(self, task_id: int) -> Task | None:
         """
         Get a single task by its ID.
         """
         return self.session.get(Task, task_id)
 
-    def get_tasks_for_project(self, project_id: int) -> Sequence[Task]:
+    def get_tasks_for_project(
+        self,
+        project_id: int,
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSortField = "id",
+        descending: bool = False,
+        after_id: Optional[int] = None,
+        after_value: Any = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Task]:
         """
-        Get all tasks associated with a specific project ID, sorted by task ID.
+        Get the tasks of a specific project ID, filtered and sorted in the database.
+        Rows are ordered by (`sort`, id); to read the next page pass the last
+        seen row's id as `after_id` and its `sort` value as `after_value`.
         """
-        statement = (
-            select(Task)
-            .where(Task.project_id == project_id)
-            .order_by(Task.id)
+        statement = self._project_tasks(
+            select(Task), project_id, filters, sort, descending, after_id, after_value, limit
         )
         return self.session.scalars(statement).all()
 
+    def get_task_rows_for_project(
+        self,
+        project_id: int,
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSortField = "id",
+        descending: bool = False,
+        after_id: Optional[int] = None,
+        after_value: Any = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[TaskField]] = None,
+    ) -> Sequence[Row]:
+        """
+        Like get_tasks_for_project(), for reading only: returns plain rows of
+        the columns in `fields` (all if None; id and the sort column are
+        always included), which skip the identity map and instrumentation.
+        """
+        statement = self._project_tasks(
+            select(*task_columns(fields, ("id", sort))),
+            project_id, filters, sort, descending, after_id, after_value, limit,
+        )
+        return self.session.execute(statement).all()
+
+    def _project_tasks(
+        self,
+        statement: Select,
+        project_id: int,
+        filters: Optional[TaskFilter],
+        sort: TaskSortField,
+        descending: bool,
+        after_id: Optional[int],
+        after_value: Any,
+        limit: Optional[int],
+    ) -> Select:
+        """
+        Narrows `statement` to one page of a project's tasks in (`sort`, id) order.
+        """
+        statement = statement.where(Task.project_id == project_id)
+        if filters is not None:
+            statement = filters.apply(statement)
+
+        column = _SORT_COLUMNS[sort]
+        if after_id is not None:
+            statement = statement.where(
+                self._after(column, after_value, after_id, descending)
+            )
+
+        if column is Task.id:
+            order = [Task.id.desc() if descending else Task.id]
+        else:
+            # ASC sorts NULL deadlines last and DESC sorts them first, which
+            # is what a forward or backward scan of a btree index yields.
+            order = [column.desc(), Task.id.desc()] if descending else [column, Task.id]
+        statement = statement.order_by(*order)
+
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
+    def get_task_row(self, task_id: int, fields: Optional[Sequence[TaskField]] = None) -> Row | None:
+        """
+        Get a single task by its ID as a plain row of the columns in
+        `fields` (all if None), for reading only.
+        """
+        statement = select(*task_columns(fields)).where(Task.id == task_id)
+        return self.session.execute(statement).first()
+
+    @staticmethod
+    def export_statement(filters: Optional[TaskFilter] = None) -> Select:
+        """
+        Query for exporting tasks as plain rows, ordered by ID.
+        Selecting columns instead of Task entities keeps the ORM's identity
+        map out of the way, so an export can stream any number of rows.
+        """
+        statement = select(*EXPORT_COLUMNS).order_by(Task.id)
+        if filters is not None:
+            statement = filters.apply(statement)
+        return statement
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[TaskFilter] = None,
+        after_rank: Optional[float] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[TaskField]] = None,
+    ) -> Sequence[Row]:
+        """
+        Full-text search over task titles and descriptions, as plain rows of
+        the columns in `fields` (all if None; id is always included) plus
+        `rank`, ordered by rank, best first, then by id. `query` uses web
+        search syntax: quoted phrases, `or` and `-word` exclusions.
+        To read the next page pass the last seen row's rank and id.
+        """
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank(Task.search_vector, tsquery).label("rank")
+        statement = select(*task_columns(fields, ("id",)), rank).where(Task.search_vector.bool_op("@@")(tsquery))
+        if filters is not None:
+            statement = filters.apply(statement)
+
+        if after_id is not None:
+            # Ranks are REAL; compare at that precision so the cursor's rank
+            # matches the row it was taken from
+            after = cast(after_rank, REAL)
+            statement = statement.where(
+                or_(rank < after, and_(rank == after, Task.id > after_id))
+            )
+        statement = statement.order_by(rank.desc(), Task.id)
+
+        if limit is not None:
+            statement = statement.limit(limit)
+        return self.session.execute(statement).all()
+
+    @staticmethod
+    def _after(column, after_value: Any, after_id: int, descending: bool):
+        """
+        Keyset condition selecting the rows that sort after (after_value, after_id).
+        """
+        id_after = Task.id < after_id if descending else Task.id > after_id
+        if column is Task.id:
+            return id_after
+        if descending:
+            if after_value is None:
+                return or_(and_(column.is_(None), id_after), column.is_not(None))
+            return or_(column < after_value, and_(column == after_value, id_after))
+        if after_value is None:
+            return and_(column.is_(None), id_after)
+        return or_(
+            column > after_value,
+            and_(column == after_value, id_after),
+            column.is_(None),
+        )
+
     def update(
         self,
-        task: Task,
+        task_id: int,
         new_title: Optional[str] = None,
         new_description: Optional[str] = None,
         new_status: Optional[Status] = None,
         new_deadline: Optional[datetime] = None,
-    ) -> Task:
+    ) -> Task | None:
         """
-        Update a task's details.
+        Update the given fields of a task in one UPDATE ... RETURNING, which
+        also moves its project's version and status counters. Returns the
+        updated task, or None if it does not exist.
         """
+        values: dict = {}
         if new_title is not None:
-            task.title = new_title
+            values["title"] = new_title
         if new_description is not None:
-            task.description = new_description
+            values["description"] = new_description
         if new_status is not None:
-            task.status = new_status
+            values["status"] = new_status
         if new_deadline is not None:
-            task.deadline = new_deadline
-        
-        self.session.commit()
-        self.session.refresh(task)
-        return task
+            values["deadline"] = new_deadline
+        if not values:
+            return self.session.get(Task, task_id)
+
+        # Lock the row first: UPDATE ... RETURNING only sees the new status
+        locked = (
+            select(Task.id, Task.status)
+            .where(Task.id == task_id)
+            .with_for_update()
+            .subquery("locked")
+        )
+        changed = (
+            update(Task)
+            .where(Task.id == locked.c.id)
+            .values(**values)
+            .returning(
+                *EXPORT_COLUMNS,
+                locked.c.status.label("old_status"),
+                Task.status.label("new_status"),
+            )
+            .cte("changed")
+        )
+        statement = (
+            select(aliased(Task, changed))
+            .add_cte(self._touch_projects(changed))
+            .execution_options(populate_existing=True)
+        )
+        db_task = self.session.scalars(statement).first()
+        if db_task is not None and new_deadline is not None:
+            # The stored, time-zone-aware value
+            self._announce_deadlines([db_task.deadline])
+        return db_task
 
     def delete(self, task: Task) -> None:
         """
-        Delete a task.
+        Delete a task, lowering its project's counters in the same
+        statement (see delete_many()).
+        """
+        self.delete_many(task_ids=[task.id])
+        # The row is gone; the session must not try to flush the object
+        if task in self.session:
+            self.session.expunge(task)
+
+    def _announce_deadlines(self, deadlines: Iterable[Optional[datetime]]) -> None:
+        """
+        Queue a notification of the given deadlines, as epoch seconds, for
+        the deadline engine. Delivered when the transaction commits.
+        Deleted tasks need no announcement: the engine re-checks on firing.
         """
-        self.session.delete(task)
-        self.session.commit()
-        
-        
-    def close_overdue_tasks(self) -> int:
+        if not ANNOUNCE_DEADLINES:
+            return
+        stamps = sorted({f"{deadline.timestamp():.3f}" for deadline in deadlines if deadline})
+        # NOTIFY payloads must stay under 8000 bytes
+        for start in range(0, len(stamps), 500):
+            payload = ",".join(stamps[start:start + 500])
+            self.session.execute(select(func.pg_notify(DEADLINE_CHANNEL, payload)))
+
+    def get_open_deadlines(
+        self, after: Optional[datetime] = None, limit: int = 1000
+    ) -> Sequence[datetime]:
         """
-        Finds tasks that are not 'done' and whose deadline has passed.
-        Sets their status to 'done' and records the 'closed_at' time.
-        Returns the number of tasks closed.
+        Get the distinct deadlines of tasks the autoclose job may still
+        close, ascending, starting after `after`. Reads the partial index
+        ix_tasks_open_deadline only.
         """
-        now = datetime.now().astimezone()
-        
-        # Define the update statement
         statement = (
+            select(Task.deadline)
+            .where(
+                Task.status != "done",
+                Task.closed_at == None,
+                Task.deadline.is_not(None) if after is None else Task.deadline > after,
+            )
+            .distinct()
+            .order_by(Task.deadline)
+            .limit(limit)
+        )
+        return self.session.scalars(statement).all()
+
+    @staticmethod
+    def _touch_projects(changed: CTE) -> CTE:
+        """
+        CTE applying the task changes in `changed` to their projects.
+
+        `changed` is a CTE of modified tasks returning project_id,
+        old_status and new_status (NULL for a deleted task). Every project
+        with a row gets its version bumped, and its task_count and
+        per-status counters moved by the net change of its rows.
+        """
+        old_status, new_status = changed.c.old_status, changed.c.new_status
+        per_project = (
+            select(
+                changed.c.project_id,
+                (func.count(new_status) - func.count(old_status)).label("tasks"),
+                *(
+                    func.sum(
+                        case((new_status == status, 1), else_=0)
+                        - case((old_status == status, 1), else_=0)
+                    ).label(status)
+                    for status in STATUS_COUNTERS
+                ),
+            )
+            .group_by(changed.c.project_id)
+            .subquery()
+        )
+        return (
+            update(Project)
+            .where(Project.id == per_project.c.project_id)
+            .values(
+                version=Project.version + 1,
+                task_count=Project.task_count + per_project.c.tasks,
+                **{
+                    counter: getattr(Project, counter) + per_project.c[status]
+                    for status, counter in STATUS_COUNTERS.items()
+                },
+            )
+            .cte("touched")
+        )
+
+    @staticmethod
+    def _bulk_criteria(
+        task_ids: Optional[Sequence[int]], filters: Optional[TaskFilter]
+    ) -> List[ColumnElement[bool]]:
+        """
+        WHERE clauses selecting the tasks of a bulk operation.
+        """
+        criteria = filters.conditions() if filters is not None else []
+        if task_ids is not None:
+            criteria.append(Task.id.in_(task_ids))
+        return criteria
+
+    def update_status_many(
+        self,
+        new_status: Status,
+        task_ids: Optional[Sequence[int]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Sequence[int]:
+        """
+        Sets the status of every task matching `task_ids` and `filters` in
+        one UPDATE ... RETURNING. Moving tasks to 'done' stamps closed_at
+        on the ones that were not closed yet. Tasks already in
+        `new_status` are left untouched.
+        Returns the IDs of the updated tasks.
+        """
+        values: dict = {"status": new_status}
+        if new_status == "done":
+            values["closed_at"] = func.coalesce(Task.closed_at, func.now())
+
+        # Lock the rows first: UPDATE ... RETURNING only sees the new status
+        locked = (
+            select(Task.id, Task.status)
+            .where(*self._bulk_criteria(task_ids, filters), Task.status != new_status)
+            .with_for_update()
+            .subquery("locked")
+        )
+        changed = (
             update(Task)
+            .where(Task.id == locked.c.id)
+            .values(**values)
+            .returning(
+                Task.id,
+                Task.project_id,
+                locked.c.status.label("old_status"),
+                Task.status.label("new_status"),
+            )
+            .cte("changed")
+        )
+        statement = select(changed.c.id).add_cte(self._touch_projects(changed))
+        return self.session.scalars(statement).all()
+
+    def delete_many(
+        self,
+        task_ids: Optional[Sequence[int]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Sequence[int]:
+        """
+        Deletes every task matching `task_ids` and `filters`, and lowers the
+        task counters of their projects, in one statement.
+        Returns the IDs of the deleted tasks.
+        """
+        deleted = (
+            delete(Task)
+            .where(*self._bulk_criteria(task_ids, filters))
+            .returning(
+                Task.id,
+                Task.project_id,
+                Task.status.label("old_status"),
+                cast(null(), String).label("new_status"),
+            )
+            .cte("deleted")
+        )
+        statement = select(deleted.c.id).add_cte(self._touch_projects(deleted))
+        return self.session.scalars(statement).all()
+
+    def close_overdue_tasks(self, now: datetime, batch_size: int = 1000) -> int:
+        """
+        Finds up to `batch_size` tasks that are not 'done' and whose deadline
+        is before `now`. Sets their status to 'done' and records `now` as
+        their 'closed_at' time. Returns the number of tasks closed.
+
+        Callers repeat this, one unit of work per batch, until fewer than
+        `batch_size` tasks are closed, so row locks are never held on more
+        than one batch. Rows locked by someone else (e.g. a task being
+        edited) are skipped and picked up by the next run.
+        """
+        # Served by the partial index ix_tasks_open_deadline
+        overdue = (
+            select(Task.id, Task.status)
             .where(
                 Task.status != "done",
                 Task.deadline < now,
                 Task.closed_at == None  # Only close them once
             )
+            .order_by(Task.deadline)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .subquery("overdue")
+        )
+        closed = (
+            update(Task)
+            .where(Task.id == overdue.c.id)
             .values(
                 status="done",
                 closed_at=now
             )
+            .returning(
+                Task.project_id,
+                overdue.c.status.label("old_status"),
+                Task.status.label("new_status"),
+            )
+            .cte("closed")
+        )
+        statement = (
+            select(func.count())
+            .select_from(closed)
+            .add_cte(self._touch_projects(closed))
+        )
+        # Execute the update, counting the closed tasks
+        return self.session.scalar(statement)
+
+    def rebuild_task_counters(self) -> int:
+        """
+        Recounts task_count and the per-status counters of every project
+        from its tasks, repairing any drift. Task writes wait while the
+        count runs, so the result is exact. Projects whose counters were
+        off also get their version bumped.
+        Returns the number of projects corrected.
+        """
+        self.session.execute(text("LOCK TABLE tasks IN SHARE MODE"))
+        counts = (
+            select(
+                Project.id.label("project_id"),
+                func.count(Task.id).label("tasks"),
+                *(
+                    func.count(Task.id).filter(Task.status == status).label(status)
+                    for status in STATUS_COUNTERS
+                ),
+            )
+            .select_from(Project)
+            .outerjoin(Task, Task.project_id == Project.id)
+            .group_by(Project.id)
+            .subquery()
+        )
+        stored = [Project.task_count, *(getattr(Project, counter) for counter in STATUS_COUNTERS.values())]
+        actual = [counts.c.tasks, *(counts.c[status] for status in STATUS_COUNTERS)]
+        statement = (
+            update(Project)
+            .where(
+                Project.id == counts.c.project_id,
+                or_(*(column != value for column, value in zip(stored, actual))),
+            )
+            .values(
+                version=Project.version + 1,
+                task_count=counts.c.tasks,
+                **{counter: counts.c[status] for status, counter in STATUS_COUNTERS.items()},
+            )
         )
-        
-        # Execute the update
-        result = self.session.execute(statement)
-        self.session.commit()
-        
-        # result.rowcount gives us the number of affected rows
-        return result.rowcount
+        return self.session.execute(statement).rowcount
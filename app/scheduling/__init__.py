@@ -0,0 +1,15 @@
+# app/scheduling/__init__.py
+from .leadership import AdvisoryLeader
+from .job_scheduler import Job, JobScheduler, JobStats
+from .deadline_engine import DeadlineEngine
+from .jobs import build_deadline_engine, build_scheduler
+
+__all__ = [
+    "AdvisoryLeader",
+    "Job",
+    "JobScheduler",
+    "JobStats",
+    "DeadlineEngine",
+    "build_deadline_engine",
+    "build_scheduler",
+]
@@ -0,0 +1,229 @@
+# app/scheduling/deadline_engine.py
+import asyncio
+import heapq
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import sessionmaker
+
+from app.commands.autoclose_overdue import close_overdue_tasks
+from app.db.notifications import NotificationChannel
+from app.metrics.jobs import TASKS_AUTOCLOSED
+from app.repositories import TaskRepository
+from app.repositories.task_repository import DEADLINE_CHANNEL
+from .leadership import AdvisoryLeader
+
+class DeadlineEngine:
+    """
+    Closes overdue tasks at their deadline instead of on a polling interval.
+
+    The engine keeps a min-heap of upcoming open deadlines (epoch seconds)
+    and sleeps until the earliest one is due. Deadlines are loaded from the
+    partial index ix_tasks_open_deadline one window at a time: the heap
+    holds every open deadline up to `_loaded_until`, and the next window is
+    read once it runs dry. TaskRepository announces the deadlines it writes
+    over NOTIFY; those inside the loaded window are pushed onto the heap.
+
+    When the earliest deadline is due, the engine waits `coalesce_seconds`
+    more and closes everything overdue with the autoclose job's batched
+    close_overdue_tasks(), so deadlines close together cost one UPDATE.
+    A stale heap entry (a task deleted, closed or moved later) just finds
+    nothing to close. Every `reload_seconds` the heap is rebuilt from the
+    index, in case a notification was lost; the periodic autoclose job
+    remains the safety net for everything else.
+
+    Only one process runs the engine at a time (see AdvisoryLeader).
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        window_size: int = 1000,
+        coalesce_seconds: float = 1.0,
+        reload_seconds: float = 300.0,
+    ):
+        """
+        Initialize a stopped engine using `engine` for its queries.
+        """
+        self._session_factory = sessionmaker(bind=engine, autoflush=False)
+        self._window_size = window_size
+        self._coalesce_seconds = coalesce_seconds
+        self._reload_seconds = reload_seconds
+        self._leader = AdvisoryLeader(engine, "deadline_engine")
+        self._channel = NotificationChannel(
+            DEADLINE_CHANNEL, on_message=self._on_message, on_reset=self._on_reset
+        )
+        self._engine = engine
+
+        self._heap: List[float] = []
+        # All open deadlines up to this one are on the heap
+        self._loaded_until: Optional[datetime] = None
+        # The last window was short: every open deadline is on the heap
+        self._exhausted = False
+        self._reload_at = 0.0
+        # Deadlines announced while a window is being read, applied after it
+        self._pending: Optional[List[float]] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+        self.closed = 0
+        self.fires = 0
+        self.loads = 0
+        self.last_fired_at: Optional[datetime] = None
+
+    async def start(self) -> None:
+        """
+        Starts listening for deadlines and the engine loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._channel.start(self._engine)
+        self._task = asyncio.create_task(self._run(), name="deadline-engine")
+
+    async def stop(self) -> None:
+        """
+        Stops the engine and hands leadership over.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self._channel.stop)
+        await asyncio.to_thread(self._leader.resign)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "leader": self._leader.is_leader,
+            "pending_deadlines": len(self._heap),
+            "next_deadline": datetime.fromtimestamp(self._heap[0]).astimezone() if self._heap else None,
+            "loaded_until": None if self._exhausted else self._loaded_until,
+            "closed": self.closed,
+            "fires": self.fires,
+            "loads": self.loads,
+            "last_fired_at": self.last_fired_at,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._step()
+            except DBAPIError as e:
+                print(f"Deadline engine could not reach the database: {e}")
+                self._reload_at = 0.0
+                await self._sleep(min(self._reload_seconds, 10))
+            except Exception as e:
+                # Nothing else watches this task: log, reload from scratch and go on
+                print(f"Deadline engine step failed: {e!r}")
+                self._reload_at = 0.0
+                await self._sleep(min(self._reload_seconds, 10))
+
+    async def _step(self) -> None:
+        """One turn of the engine loop: load, sleep or fire."""
+        leader = await asyncio.to_thread(self._leader.lead)
+        if not leader:
+            # Followers keep no heap; retry leadership now and then
+            self._heap.clear()
+            self._reload_at = 0.0
+            await self._sleep(self._reload_seconds)
+            return
+
+        if time.monotonic() >= self._reload_at:
+            self._heap.clear()
+            self._loaded_until = None
+            self._exhausted = False
+            self._reload_at = time.monotonic() + self._reload_seconds
+            await self._load_next()
+        elif not self._heap and not self._exhausted:
+            await self._load_next()
+
+        delay = self._reload_at - time.monotonic()
+        if self._heap:
+            delay = min(delay, self._heap[0] + self._coalesce_seconds - time.time())
+        if delay > 0:
+            await self._sleep(delay)
+            return
+
+        if self._heap and self._heap[0] <= time.time():
+            await self._fire()
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleeps for `seconds` or until woken by an earlier deadline."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    # The heap and window state are only touched on the event loop;
+    # worker threads run the queries alone.
+
+    async def _load_next(self) -> None:
+        """Pushes the next window of open deadlines onto the heap."""
+        self._pending = []
+        try:
+            deadlines = await asyncio.to_thread(self._read_window, self._loaded_until)
+        finally:
+            pending, self._pending = self._pending, None
+        self.loads += 1
+        for deadline in deadlines:
+            heapq.heappush(self._heap, deadline.timestamp())
+        if deadlines:
+            self._loaded_until = deadlines[-1]
+        self._exhausted = len(deadlines) < self._window_size
+        self._add_deadlines(pending)
+
+    def _read_window(self, after: Optional[datetime]) -> List[datetime]:
+        with self._session_factory() as session:
+            return list(TaskRepository(session).get_open_deadlines(after, self._window_size))
+
+    async def _fire(self) -> None:
+        """Closes every overdue task and drops the deadlines that are past."""
+        now = time.time()
+        while self._heap and self._heap[0] <= now:
+            heapq.heappop(self._heap)
+        closed = await asyncio.to_thread(self._close_overdue)
+        TASKS_AUTOCLOSED.labels("deadline_engine").inc(closed)
+        self.closed += closed
+        self.fires += 1
+        self.last_fired_at = datetime.now().astimezone()
+
+    def _close_overdue(self) -> int:
+        with self._session_factory() as session:
+            return close_overdue_tasks(session)
+
+    def _on_message(self, payload: str) -> None:
+        """Called on the listener thread with announced deadlines."""
+        try:
+            stamps = [float(stamp) for stamp in payload.split(",") if stamp]
+        except ValueError:
+            return
+        self._loop.call_soon_threadsafe(self._add_deadlines, stamps)
+
+    def _on_reset(self) -> None:
+        """Called on the listener thread when notifications may have been missed."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._request_reload)
+
+    def _add_deadlines(self, stamps: List[float]) -> None:
+        if not self._leader.is_leader:
+            return
+        if self._pending is not None:
+            self._pending.extend(stamps)
+            return
+        earliest = self._heap[0] if self._heap else None
+        for stamp in stamps:
+            # Deadlines past the loaded window are read with a later window
+            if self._exhausted or (
+                self._loaded_until is not None and stamp <= self._loaded_until.timestamp()
+            ):
+                heapq.heappush(self._heap, stamp)
+        if self._heap and (earliest is None or self._heap[0] < earliest):
+            self._wakeup.set()
+
+    def _request_reload(self) -> None:
+        self._reload_at = 0.0
+        self._wakeup.set()
@@ -0,0 +1,165 @@
+# app/scheduling/job_scheduler.py
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import DBAPIError
+
+from .leadership import AdvisoryLeader
+
+@dataclass
+class JobStats:
+    """Counters and last-run details of one job in this process."""
+    runs: int = 0
+    failures: int = 0
+    # Ticks skipped because the previous run had not finished
+    overlaps_skipped: int = 0
+    # Ticks skipped because another process leads the job
+    follower_ticks: int = 0
+    last_started_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+@dataclass
+class Job:
+    """A periodic job. `func` is synchronous and runs in a worker thread."""
+    name: str
+    func: Callable[[], Any]
+    interval_seconds: float
+    leader: AdvisoryLeader
+    jitter_seconds: float = 0.0
+    stats: JobStats = field(default_factory=JobStats)
+    running: bool = False
+
+
+class JobScheduler:
+    """
+    Runs registered jobs periodically on the event loop, in worker threads.
+
+    Each job has a leader among all processes sharing the database (see
+    AdvisoryLeader), so the job runs in exactly one replica and moves to
+    another one if the leader dies.
+
+    Ticks are fixed-rate plus random jitter; a tick that finds the previous
+    run still going is skipped instead of stacking up.
+    """
+
+    def __init__(self, engine: Engine):
+        """
+        Initialize an empty scheduler taking its leader locks through `engine`.
+        """
+        self._engine = engine
+        self._jobs: Dict[str, Job] = {}
+        self._loops: List[asyncio.Task] = []
+        self._runs: Set[asyncio.Task] = set()
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval_seconds: float,
+        jitter_seconds: float = 0.0,
+    ) -> None:
+        """
+        Adds a job; must be called before start().
+        """
+        if name in self._jobs:
+            raise ValueError(f"Job '{name}' is already registered.")
+        self._jobs[name] = Job(
+            name, func, interval_seconds, AdvisoryLeader(self._engine, name), jitter_seconds
+        )
+
+    async def start(self) -> None:
+        """
+        Starts one scheduling loop per job.
+        """
+        for job in self._jobs.values():
+            self._loops.append(asyncio.create_task(self._loop(job), name=f"job-{job.name}"))
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """
+        Stops scheduling, waits up to `timeout` seconds for running jobs and
+        hands leadership over by releasing the advisory locks.
+        """
+        for loop in self._loops:
+            loop.cancel()
+        await asyncio.gather(*self._loops, return_exceptions=True)
+        self._loops.clear()
+        if self._runs:
+            await asyncio.wait(self._runs, timeout=timeout)
+        for job in self._jobs.values():
+            if not job.running:
+                await asyncio.to_thread(job.leader.resign)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns each job's settings, leadership and run statistics.
+        """
+        return {
+            job.name: {
+                "interval_seconds": job.interval_seconds,
+                "jitter_seconds": job.jitter_seconds,
+                "leader": job.leader.is_leader,
+                "running": job.running,
+                "runs": job.stats.runs,
+                "failures": job.stats.failures,
+                "overlaps_skipped": job.stats.overlaps_skipped,
+                "follower_ticks": job.stats.follower_ticks,
+                "last_started_at": job.stats.last_started_at,
+                "last_duration_seconds": job.stats.last_duration_seconds,
+                "last_error": job.stats.last_error,
+            }
+            for job in self._jobs.values()
+        }
+
+    async def _loop(self, job: Job) -> None:
+        next_tick = time.monotonic()
+        while True:
+            next_tick += job.interval_seconds
+            delay = next_tick - time.monotonic() + random.uniform(0, job.jitter_seconds)
+            await asyncio.sleep(max(delay, 0))
+
+            if job.running:
+                job.stats.overlaps_skipped += 1
+                continue
+            job.running = True
+            run = asyncio.create_task(self._run(job))
+            self._runs.add(run)
+            run.add_done_callback(self._runs.discard)
+
+    async def _run(self, job: Job) -> None:
+        try:
+            await asyncio.to_thread(self._run_if_leader, job)
+        finally:
+            job.running = False
+
+    def _run_if_leader(self, job: Job) -> None:
+        """
+        Runs the job if this process leads it. Called in a worker thread.
+        """
+        try:
+            leader = job.leader.lead()
+        except DBAPIError as e:
+            print(f"Scheduler could not reach the database for job '{job.name}': {e}")
+            return
+        if not leader:
+            job.stats.follower_ticks += 1
+            return
+
+        job.stats.last_started_at = datetime.now().astimezone()
+        started = time.perf_counter()
+        try:
+            job.func()
+            job.stats.last_error = None
+        except Exception as e:
+            job.stats.failures += 1
+            job.stats.last_error = str(e)
+            print(f"Job '{job.name}' failed: {e}")
+        finally:
+            job.stats.runs += 1
+            job.stats.last_duration_seconds = time.perf_counter() - started
@@ -0,0 +1,35 @@
+# app/scheduling/jobs.py
+import os
+from typing import Optional
+
+from sqlalchemy import Engine
+
+from app.commands.autoclose_overdue import run_autoclose
+from .deadline_engine import DeadlineEngine
+from .job_scheduler import JobScheduler
+
+def build_scheduler(engine: Engine) -> JobScheduler:
+    """
+    Creates a scheduler with every periodic job of the application registered.
+    """
+    scheduler = JobScheduler(engine)
+    scheduler.register(
+        "autoclose_overdue",
+        run_autoclose,
+        interval_seconds=float(os.getenv("AUTOCLOSE_INTERVAL_SECONDS", 15 * 60)),
+        jitter_seconds=float(os.getenv("AUTOCLOSE_JITTER_SECONDS", 30)),
+    )
+    return scheduler
+
+def build_deadline_engine(engine: Engine) -> Optional[DeadlineEngine]:
+    """
+    Creates the deadline engine, or None unless DEADLINE_ENGINE_ENABLED=1.
+    It complements the autoclose job, which keeps running as a safety net.
+    """
+    if os.getenv("DEADLINE_ENGINE_ENABLED", "0") != "1":
+        return None
+    return DeadlineEngine(
+        engine,
+        coalesce_seconds=float(os.getenv("DEADLINE_ENGINE_COALESCE_SECONDS", 1)),
+        reload_seconds=float(os.getenv("DEADLINE_ENGINE_RELOAD_SECONDS", 300)),
+    )
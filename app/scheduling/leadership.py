@@ -0,0 +1,76 @@
+# app/scheduling/leadership.py
+import zlib
+from typing import Optional
+
+from sqlalchemy import Connection, Engine, func, select
+from sqlalchemy.exc import DBAPIError
+
+class AdvisoryLeader:
+    """
+    Leader election among processes sharing a database, by name.
+
+    The leader is the process holding the name's PostgreSQL advisory lock.
+    The lock is held on a dedicated connection for as long as the process
+    leads, so leadership moves to another process only when the leader
+    resigns or its connection dies. Methods block; call them from a worker
+    thread when on the event loop.
+    """
+
+    def __init__(self, engine: Engine, name: str):
+        """
+        Initialize a non-leading candidate for `name`.
+        """
+        self._engine = engine
+        self.name = name
+        self._connection: Optional[Connection] = None
+
+    @property
+    def lock_key(self) -> int:
+        """Advisory lock key, the same in every process."""
+        return zlib.crc32(f"scheduler:{self.name}".encode())
+
+    @property
+    def is_leader(self) -> bool:
+        return self._connection is not None
+
+    def lead(self) -> bool:
+        """
+        Whether this process leads, trying to become leader if not.
+        Raises DBAPIError if the database cannot be reached.
+        """
+        if self._connection is not None:
+            try:
+                self._connection.exec_driver_sql("SELECT 1")
+                return True
+            except DBAPIError:
+                # The connection, and with it the lock, is gone
+                self.resign()
+
+        # AUTOCOMMIT: the lock is held by the session, not by a transaction
+        # that would sit idle for the lifetime of the process
+        connection = self._engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = connection.scalar(select(func.pg_try_advisory_lock(self.lock_key)))
+        except DBAPIError:
+            connection.invalidate()
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    def resign(self) -> None:
+        """
+        Releases the lock, if held, so another process can lead.
+        """
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.scalar(select(func.pg_advisory_unlock(self.lock_key)))
+            connection.close()
+        except DBAPIError:
+            connection.invalidate()
+            connection.close()
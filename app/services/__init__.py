@@ -1,5 +1,15 @@
 # app/services/__init__.py
 from .project_service import ProjectService
 from .task_service import TaskService
+from .async_project_service import AsyncProjectService
+from .async_task_service import AsyncTaskService
+from .import_service import ImportReport, TaskImportService
 
-__all__ = ["ProjectService", "TaskService"]
+__all__ = [
+    "ProjectService",
+    "TaskService",
+    "AsyncProjectService",
+    "AsyncTaskService",
+    "ImportReport",
+    "TaskImportService",
+]
@@ -0,0 +1,102 @@
+# app/services/async_project_service.py
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import Row
+
+from app.repositories import AsyncProjectRepository, ProjectField, TaskCounts
+from app.models import Project
+from app.models.task import Status
+from .project_service import ProjectService
+
+T = TypeVar("T")
+
+class AsyncProjectService:
+    """
+    Async facade over ProjectService.
+
+    The business rules live in ProjectService only; each call here runs
+    the whole sync service method in a single run_sync() hop, so one API
+    call costs one trip through the greenlet bridge.
+    """
+
+    def __init__(self, project_repo: AsyncProjectRepository, max_projects: int):
+        """
+        Initialize the service with an async repository and configurations.
+        """
+        self._repo = project_repo
+        self._max_projects = max_projects
+
+    async def _run(self, fn: Callable[[ProjectService], T]) -> T:
+        """Runs `fn` against a sync ProjectService sharing our session."""
+        return await self._repo.run(
+            lambda repo: fn(ProjectService(repo, self._max_projects))
+        )
+
+    async def create_project(self, name: str, description: str) -> Project:
+        """Creates a new project."""
+        return await self._run(lambda service: service.create_project(name, description))
+
+    async def find_project_by_id(self, project_id: int) -> Project:
+        """Finds a project by its ID. Raises error if not found."""
+        return await self._run(lambda service: service.find_project_by_id(project_id))
+
+    async def edit_project(
+        self,
+        project_id: int,
+        new_name: Optional[str] = None,
+        new_description: Optional[str] = None,
+    ) -> Project:
+        """Edits an existing project."""
+        return await self._run(
+            lambda service: service.edit_project(project_id, new_name, new_description)
+        )
+
+    async def delete_project(self, project_id: int) -> None:
+        """Deletes a project by its ID."""
+        await self._run(lambda service: service.delete_project(project_id))
+
+    async def get_projects_version(self) -> int:
+        """Returns the version of the project list, which changes with every project write."""
+        return await self._run(lambda service: service.get_projects_version())
+
+    async def get_all_projects(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Sequence[Project]:
+        """Returns a sequence of all projects, optionally one page at a time."""
+        return await self._run(lambda service: service.get_all_projects(after_id, limit))
+
+    async def get_project_rows(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[ProjectField]] = None,
+    ) -> Sequence[Row]:
+        """Like get_all_projects(), as read-only rows of `fields`."""
+        return await self._run(lambda service: service.get_project_rows(after_id, limit, fields))
+
+    async def get_task_counts(self, project_ids: Sequence[int]) -> Dict[int, TaskCounts]:
+        """Returns the task counts of the given projects, by project ID."""
+        return await self._run(lambda service: service.get_task_counts(project_ids))
+
+    async def get_project_summary(self, project_id: int) -> TaskCounts:
+        """Returns a project's task counts. Raises error if not found."""
+        return await self._run(lambda service: service.get_project_summary(project_id))
+
+    async def lookup_projects(
+        self, text: str, limit: int, fuzzy: bool = True, min_fuzzy_length: int = 3
+    ) -> List[Project]:
+        """Returns projects whose name starts with, then resembles, `text`."""
+        return await self._run(
+            lambda service: service.lookup_projects(text, limit, fuzzy, min_fuzzy_length)
+        )
+
+    async def get_tasks_by_project(
+        self,
+        project_ids: Sequence[int],
+        limit: int,
+        statuses: Optional[Sequence[Status]] = None,
+    ) -> Dict[int, List[Row]]:
+        """Returns up to `limit` tasks of each given project as read-only rows, optionally filtered by status."""
+        return await self._run(
+            lambda service: service.get_tasks_by_project(project_ids, limit, statuses)
+        )
@@ -0,0 +1,180 @@
+# app/services/async_task_service.py
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import Row
+
+from app.models import Task
+from app.models.task import Status
+from app.exceptions.base import ValidationError
+from app.repositories import AsyncProjectRepository, AsyncTaskRepository, ProjectRepository
+from app.repositories import TaskField, TaskFilter, TaskSortField
+from .task_service import TaskService
+
+T = TypeVar("T")
+
+class AsyncTaskService:
+    """
+    Async facade over TaskService.
+
+    See AsyncProjectService: the rules stay in TaskService and each call
+    runs in a single run_sync() hop on the request's session.
+    """
+
+    def __init__(
+        self,
+        task_repo: AsyncTaskRepository,
+        project_repo: AsyncProjectRepository,
+        max_tasks_per_project: int,
+    ):
+        """
+        Initialize the service with async repositories and configurations.
+        """
+        self._task_repo = task_repo
+        self._project_repo = project_repo
+        self._max_tasks_per_project = max_tasks_per_project
+
+    async def _run(self, fn: Callable[[TaskService], T]) -> T:
+        """Runs `fn` against a sync TaskService sharing our session."""
+        return await self._task_repo.run(
+            lambda task_repo: fn(
+                TaskService(
+                    task_repo,
+                    ProjectRepository(task_repo.session, self._project_repo.cache),
+                    self._max_tasks_per_project,
+                )
+            )
+        )
+
+    async def add_task_to_project(
+        self,
+        project_id: int,
+        task_title: str,
+        task_description: str,
+        deadline: Optional[datetime] = None,
+    ) -> Task:
+        """Adds a new task to a project."""
+        return await self._run(
+            lambda service: service.add_task_to_project(
+                project_id, task_title, task_description, deadline
+            )
+        )
+
+    async def add_tasks_to_project(
+        self,
+        project_id: int,
+        tasks: Sequence[Tuple[str, str, Optional[datetime]]],
+    ) -> List[Task | ValidationError]:
+        """Adds several tasks to a project at once."""
+        return await self._run(lambda service: service.add_tasks_to_project(project_id, tasks))
+
+    async def find_task_by_id(self, task_id: int) -> Task:
+        """Finds a task by its ID. Raises error if not found."""
+        return await self._run(lambda service: service.find_task_by_id(task_id))
+
+    async def find_task_row_by_id(self, task_id: int, fields: Optional[Sequence[TaskField]] = None) -> Row:
+        """Finds a task by its ID as a read-only row of `fields`. Raises error if not found."""
+        return await self._run(lambda service: service.find_task_row_by_id(task_id, fields))
+
+    async def edit_task(
+        self,
+        task_id: int,
+        new_title: Optional[str] = None,
+        new_description: Optional[str] = None,
+        new_status: Optional[Status] = None,
+        new_deadline: Optional[datetime] = None,
+    ) -> Task:
+        """Edits an existing task."""
+        return await self._run(
+            lambda service: service.edit_task(
+                task_id, new_title, new_description, new_status, new_deadline
+            )
+        )
+
+    async def delete_task(self, task_id: int) -> None:
+        """Deletes a task by its ID."""
+        await self._run(lambda service: service.delete_task(task_id))
+
+    async def update_tasks_status(
+        self,
+        new_status: Status,
+        task_ids: Optional[Sequence[int]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Sequence[int]:
+        """Moves every task selected by IDs and/or filters to `new_status`."""
+        return await self._run(
+            lambda service: service.update_tasks_status(new_status, task_ids, filters)
+        )
+
+    async def delete_tasks(
+        self,
+        task_ids: Optional[Sequence[int]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Sequence[int]:
+        """Deletes every task selected by IDs and/or filters."""
+        return await self._run(lambda service: service.delete_tasks(task_ids, filters))
+
+    async def export_tasks(
+        self, filters: Optional[TaskFilter] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Returns an iterator over the tasks matching `filters`, as batches of
+        plain rows ordered by ID. The project filter, if any, is checked
+        up front, so the error surfaces before any row is streamed.
+        """
+        if filters is not None and filters.project_id is not None:
+            await self.get_tasks_version(filters.project_id)
+        return self._task_repo.stream_for_export(filters, batch_size)
+
+    async def get_tasks_version(self, project_id: int) -> int:
+        """Returns the version of a project's task list, which changes with every write to its tasks."""
+        return await self._run(lambda service: service.get_tasks_version(project_id))
+
+    async def get_tasks_for_project(
+        self,
+        project_id: int,
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSortField = "id",
+        descending: bool = False,
+        after_id: Optional[int] = None,
+        after_value: Any = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Task]:
+        """Gets the tasks of a specific project, optionally filtered, sorted and paged."""
+        return await self._run(
+            lambda service: service.get_tasks_for_project(
+                project_id, filters, sort, descending, after_id, after_value, limit
+            )
+        )
+
+    async def get_task_rows_for_project(
+        self,
+        project_id: int,
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSortField = "id",
+        descending: bool = False,
+        after_id: Optional[int] = None,
+        after_value: Any = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[TaskField]] = None,
+    ) -> Sequence[Row]:
+        """Like get_tasks_for_project(), as read-only rows of `fields`."""
+        return await self._run(
+            lambda service: service.get_task_rows_for_project(
+                project_id, filters, sort, descending, after_id, after_value, limit, fields
+            )
+        )
+
+    async def search_tasks(
+        self,
+        query: str,
+        filters: Optional[TaskFilter] = None,
+        after_rank: Optional[float] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[TaskField]] = None,
+    ) -> Sequence[Row]:
+        """Searches task titles and descriptions, best matches first, as read-only rows of `fields` and `rank`."""
+        return await self._run(
+            lambda service: service.search_tasks(query, filters, after_rank, after_id, limit, fields)
+        )
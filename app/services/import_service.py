@@ -0,0 +1,183 @@
+# app/services/import_service.py
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, TextIO, Tuple
+
+from app.repositories.import_repository import TaskImportRepository
+from app.exceptions.base import ValidationError
+from .project_service import ProjectService
+from .task_service import TaskService
+
+ImportFormat = Literal["ndjson", "csv"]
+
+# Description given to projects created by an import that names none
+DEFAULT_PROJECT_DESCRIPTION = "Imported project."
+
+# Columns a CSV import must have; project_description, status and deadline are optional
+REQUIRED_CSV_COLUMNS = ("project", "title", "description")
+
+@dataclass
+class ImportReport:
+    """Progress and outcome of an import. Errors are (line, message) pairs."""
+    rows_read: int = 0
+    rows_staged: int = 0
+    projects_created: int = 0
+    tasks_created: int = 0
+    failed: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+
+class TaskImportService:
+    """
+    Imports tasks, and the projects they belong to, from NDJSON or CSV.
+
+    Every record names its project by `project` (created if missing, with
+    `project_description`) and carries the task's `title`, `description`
+    and optional `status` and `deadline`. Records are validated with the
+    same rules as ProjectService and TaskService, in batches that are
+    COPYed into a staging table as they fill; the database then merges
+    them in one transaction.
+    """
+
+    def __init__(
+        self,
+        import_repo: TaskImportRepository,
+        max_projects: int,
+        max_tasks_per_project: int,
+        batch_size: int = 5000,
+        max_errors: int = 1000,
+    ):
+        """
+        Initialize the service. At most `max_errors` errors are listed in
+        the report; all of them are counted.
+        """
+        self._repo = import_repo
+        self._max_projects = max_projects
+        self._max_tasks_per_project = max_tasks_per_project
+        self._batch_size = batch_size
+        self._max_errors = max_errors
+
+    def import_tasks(
+        self,
+        stream: TextIO,
+        format: ImportFormat,
+        on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """
+        Imports the records read from `stream`. `on_progress` is called
+        after every staged batch and once the merge is done.
+        Raises ValidationError if the input cannot be read at all.
+        """
+        report = ImportReport()
+        records = self._read_csv(stream) if format == "csv" else self._read_ndjson(stream)
+
+        self._repo.create_staging()
+        batch: List[Tuple[Any, ...]] = []
+        for line, record in records:
+            report.rows_read += 1
+            try:
+                batch.append(self._to_row(line, record))
+            except ValidationError as e:
+                self._add_error(report, line, e.message)
+                continue
+
+            if len(batch) >= self._batch_size:
+                self._stage(batch, report, on_progress)
+                batch = []
+        if batch:
+            self._stage(batch, report, on_progress)
+
+        projects_created, tasks_created, rejected, errors = self._repo.merge(
+            self._max_projects,
+            self._max_tasks_per_project,
+            max(self._max_errors - len(report.errors), 0),
+        )
+        report.projects_created = projects_created
+        report.tasks_created = tasks_created
+        report.failed += rejected
+        report.errors = sorted(report.errors + errors)
+        if on_progress is not None:
+            on_progress(report)
+        return report
+
+    def _stage(
+        self,
+        batch: List[Tuple[Any, ...]],
+        report: ImportReport,
+        on_progress: Optional[Callable[[ImportReport], None]],
+    ) -> None:
+        self._repo.copy_rows(batch)
+        report.rows_staged += len(batch)
+        if on_progress is not None:
+            on_progress(report)
+
+    def _add_error(self, report: ImportReport, line: int, message: str) -> None:
+        report.failed += 1
+        if len(report.errors) < self._max_errors:
+            report.errors.append((line, message))
+
+    @staticmethod
+    def _to_row(line: int, record: Any) -> Tuple[Any, ...]:
+        """
+        Validates a record and returns its staging row (see COPY_COLUMNS).
+        """
+        if isinstance(record, ValidationError):
+            raise record
+
+        project_name = record.get("project") or ""
+        project_description = record.get("project_description") or DEFAULT_PROJECT_DESCRIPTION
+        title = record.get("title") or ""
+        description = record.get("description") or ""
+        status = record.get("status") or "todo"
+        for value in (project_name, project_description, title, description, status):
+            if not isinstance(value, str):
+                raise ValidationError("Fields must be strings.")
+        ProjectService._validate_fields(project_name, project_description)
+        TaskService._validate_fields(title, description, status)
+
+        deadline = record.get("deadline") or None
+        if deadline is not None:
+            try:
+                deadline = datetime.fromisoformat(deadline)
+            except (TypeError, ValueError):
+                raise ValidationError("Deadline must be an ISO 8601 date or datetime.")
+            # A naive deadline is in this process's time zone, as validated;
+            # staged without an offset, PostgreSQL would read it in its own
+            if deadline.tzinfo is None:
+                deadline = deadline.astimezone()
+            TaskService._validate_deadline(deadline)
+
+        return (line, project_name, project_description, title, description, status, deadline)
+
+    @staticmethod
+    def _read_ndjson(stream: TextIO) -> Iterator[Tuple[int, Any]]:
+        """
+        Yields (line number, record) for every non-blank line; unreadable
+        lines yield a ValidationError instead of a record.
+        """
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError:
+                yield line, ValidationError("Invalid JSON.")
+                continue
+            if not isinstance(record, dict):
+                yield line, ValidationError("Each line must be a JSON object.")
+                continue
+            yield line, record
+
+    @staticmethod
+    def _read_csv(stream: TextIO) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Yields (line number, record) for every CSV record after the header.
+        """
+        reader = csv.DictReader(stream)
+        missing = [column for column in REQUIRED_CSV_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValidationError(f"CSV header is missing columns: {', '.join(missing)}.")
+        for record in reader:
+            yield reader.line_num, record
@@ -1,8 +1,11 @@
 # app/services/project_service.py
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
-from app.repositories import ProjectRepository
+from sqlalchemy import Row
+
+from app.repositories import ProjectField, ProjectRepository, TaskCounts
 from app.models import Project
+from app.models.task import Status
 from app.exceptions.base import ValidationError  # Import from the correct file
 from app.exceptions.service_exceptions import (
     ProjectLimitExceededError,
@@ -20,35 +23,46 @@ class ProjectService:
         self._repo = project_repo
         self._max_projects = max_projects
 
-    def _validate_fields(self, name: str, description: str) -> None:
+    @staticmethod
+    def _validate_fields(name: str, description: str) -> None:
         """Validates project fields."""
+        ProjectService._validate_name(name)
+        ProjectService._validate_description(description)
+
+    @staticmethod
+    def _validate_name(name: str) -> None:
         if not name or not name.strip():
             raise ValidationError("Project name cannot be empty.")
-        if not description or not description.strip():
-            raise ValidationError("Project description cannot be empty.")
         if len(name) > 100:
             raise ValidationError("Project name cannot exceed 100 characters.")
+
+    @staticmethod
+    def _validate_description(description: str) -> None:
+        if not description or not description.strip():
+            raise ValidationError("Project description cannot be empty.")
         if len(description) > 255:
             raise ValidationError("Project description cannot exceed 255 characters.")
 
     def create_project(self, name: str, description: str) -> Project:
         """Creates a new project."""
         self._validate_fields(name, description)
-        
-        # Check for duplicate name (using the repository)
+
+        # The repository enforces the name uniqueness and the project limit
+        # in the insert itself, so a successful create is one round trip.
+        project = self._repo.create(
+            name=name, description=description, max_projects=self._max_projects
+        )
+        if project is not None:
+            return project
+
+        # Only the failure path pays for finding out which rule was hit
         if self._repo.get_by_name(name):
             raise ProjectNameExistsError(
                 f"Project with name '{name}' already exists (case-insensitive)."
             )
-        
-        # Check project limit (using the repository)
-        if self._repo.count() >= self._max_projects:
-            raise ProjectLimitExceededError(
-                f"Cannot create more than {self._max_projects} projects."
-            )
-
-        # Create project (using the repository)
-        return self._repo.create(name=name, description=description)
+        raise ProjectLimitExceededError(
+            f"Cannot create more than {self._max_projects} projects."
+        )
 
     def find_project_by_id(self, project_id: int) -> Project:
         """Finds a project by its ID. Raises error if not found."""
@@ -64,26 +78,24 @@ class ProjectService:
         new_description: Optional[str] = None,
     ) -> Project:
         """Edits an existing project."""
-        project_to_edit = self.find_project_by_id(project_id)
+        # Only the new values need checking; the stored ones passed before
+        if new_name is not None:
+            self._validate_name(new_name)
+        if new_description is not None:
+            self._validate_description(new_description)
 
-        name_to_validate = new_name if new_name is not None else project_to_edit.name
-        desc_to_validate = (
-            new_description if new_description is not None else project_to_edit.description
+        # The repository updates and returns the row in one statement; the
+        # name's uniqueness is enforced by the database
+        project = self._repo.update(
+            project_id, new_name=new_name, new_description=new_description
         )
-        self._validate_fields(name_to_validate, desc_to_validate)
-
-        if new_name is not None and new_name.lower() != project_to_edit.name.lower():
-            # Check if the *new* name already exists
-            if self._repo.get_by_name(new_name):
-                raise ProjectNameExistsError(
-                    f"Another project with name '{new_name}' already exists."
-                )
-
-        # Update project (using the repository)
-        return self._repo.update(
-            project=project_to_edit,
-            new_name=new_name,
-            new_description=new_description,
+        if project is not None:
+            return project
+
+        # Only the failure path pays for finding out which rule was hit
+        self.find_project_by_id(project_id)
+        raise ProjectNameExistsError(
+            f"Another project with name '{new_name}' already exists."
         )
 
     def delete_project(self, project_id: int) -> None:
@@ -92,6 +104,60 @@ class ProjectService:
         # Delete project (using the repository)
         self._repo.delete(project_to_delete)
 
-    def get_all_projects(self) -> Sequence[Project]:
-        """Returns a sequence of all projects."""
-        return self._repo.get_all()
+    def get_projects_version(self) -> int:
+        """Returns the version of the project list, which changes with every project write."""
+        return self._repo.get_list_version()
+
+    def get_all_projects(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Sequence[Project]:
+        """Returns a sequence of all projects, optionally one page at a time."""
+        return self._repo.get_all(after_id=after_id, limit=limit)
+
+    def get_project_rows(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[ProjectField]] = None,
+    ) -> Sequence[Row]:
+        """Like get_all_projects(), as read-only rows of `fields`."""
+        return self._repo.get_project_rows(after_id=after_id, limit=limit, fields=fields)
+
+    def lookup_projects(
+        self, text: str, limit: int, fuzzy: bool = True, min_fuzzy_length: int = 3
+    ) -> List[Project]:
+        """
+        Returns up to `limit` projects for a name being typed: those whose
+        name starts with `text` first, then, if `fuzzy` and `text` has at
+        least `min_fuzzy_length` characters, those with a similar name.
+        """
+        text = text.strip()
+        if not text:
+            raise ValidationError("Lookup text cannot be empty.")
+
+        projects = list(self._repo.find_by_prefix(text, limit))
+        if fuzzy and len(projects) < limit and len(text) >= min_fuzzy_length:
+            projects += self._repo.find_similar(
+                text, limit - len(projects), exclude_ids=[project.id for project in projects]
+            )
+        return projects
+
+    def get_task_counts(self, project_ids: Sequence[int]) -> Dict[int, TaskCounts]:
+        """Returns the task counts of the given projects, by project ID."""
+        return self._repo.get_task_counts(project_ids)
+
+    def get_project_summary(self, project_id: int) -> TaskCounts:
+        """Returns a project's task counts. Raises error if not found."""
+        counts = self._repo.get_task_counts([project_id]).get(project_id)
+        if counts is None:
+            raise ProjectNotFoundError(f"Project with ID '{project_id}' not found.")
+        return counts
+
+    def get_tasks_by_project(
+        self,
+        project_ids: Sequence[int],
+        limit: int,
+        statuses: Optional[Sequence[Status]] = None,
+    ) -> Dict[int, List[Row]]:
+        """Returns up to `limit` tasks of each given project as read-only rows, optionally filtered by status."""
+        return self._repo.get_tasks_by_project(project_ids, limit, statuses)
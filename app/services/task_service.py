@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row
 
 from app.models import Project, Task
 from app.models.task import Status
 from app.repositories import ProjectRepository, TaskRepository  # <-- This is the key line
+from app.repositories import TaskField, TaskFilter, TaskSortField
 from app.exceptions.base import InvalidDeadlineError, ValidationError
 from app.exceptions.service_exceptions import (
     ProjectNotFoundError,
@@ -26,25 +29,46 @@ class TaskService:
         self._project_repo = project_repo
         self._max_tasks_per_project = max_tasks_per_project
 
+    @staticmethod
     def _validate_fields(
-        self, title: str, description: str, status: Optional[Status] = None
+        title: str, description: str, status: Optional[Status] = None
     ) -> None:
         """Validates all task fields based on DB constraints."""
+        TaskService._validate_title(title)
+        TaskService._validate_description(description)
+        if status:
+            TaskService._validate_status(status)
+
+    @staticmethod
+    def _validate_title(title: str) -> None:
         if not title or not title.strip():
             raise ValidationError("Task title cannot be empty.")
-        if not description or not description.strip():
-            raise ValidationError("Task description cannot be empty.")
-        
         # Updated validation to match DB schema
         if len(title) > 100:
             raise ValidationError("Task title cannot exceed 100 characters.")
+
+    @staticmethod
+    def _validate_description(description: str) -> None:
+        if not description or not description.strip():
+            raise ValidationError("Task description cannot be empty.")
         if len(description) > 500:
             raise ValidationError("Task description cannot exceed 500 characters.")
-        
-        if status and status not in ["todo", "doing", "done"]:
+
+    @staticmethod
+    def _validate_status(status: Status) -> None:
+        """Checks that the status is one of the known values."""
+        if status not in ["todo", "doing", "done"]:
             raise ValidationError("Status must be one of 'todo', 'doing', or 'done'.")
 
-    def _validate_deadline(self, deadline: Optional[datetime]):
+    def _validate_bulk_selection(
+        self, task_ids: Optional[Sequence[int]], filters: Optional[TaskFilter]
+    ) -> None:
+        """Refuses bulk operations that would select every task."""
+        if task_ids is None and (filters is None or filters == TaskFilter()):
+            raise ValidationError("Specify task IDs or at least one filter.")
+
+    @staticmethod
+    def _validate_deadline(deadline: Optional[datetime]):
         """Checks if the deadline is in the past."""
         if deadline:
             # Ensure deadline is timezone-aware if it's not already
@@ -68,24 +92,68 @@ class TaskService:
         self._validate_fields(task_title, task_description)
         self._validate_deadline(deadline)
 
-        # Find the project using the repository
+        # Create the task using the repository; the task limit is
+        # checked atomically by the same statement
+        task = self._task_repo.create(
+            project_id=project_id,
+            title=task_title,
+            description=task_description,
+            max_tasks=self._max_tasks_per_project,
+            deadline=deadline,
+        )
+        if task is not None:
+            return task
+
+        # Nothing was inserted: either the project is missing or full
         project = self._project_repo.get_by_id(project_id)
         if not project:
             raise ProjectNotFoundError(f"Project with ID '{project_id}' not found.")
-        
-        # Check task limit (accessing the relationship)
-        if len(project.tasks) >= self._max_tasks_per_project:
-            raise TaskLimitExceededError(
-                f"Cannot add more tasks to '{project.name}'."
+        raise TaskLimitExceededError(
+            f"Cannot add more tasks to '{project.name}'."
+        )
+
+    def add_tasks_to_project(
+        self,
+        project_id: int,
+        tasks: Sequence[Tuple[str, str, Optional[datetime]]],
+    ) -> List[Task | ValidationError]:
+        """
+        Adds several (title, description, deadline) tasks to a project at once.
+
+        Every item is validated first; the valid ones are inserted together
+        in one statement, checking the task limit once for all of them.
+        Returns, per input item, the created Task or its ValidationError.
+        """
+        errors: dict[int, ValidationError] = {}
+        valid: List[Tuple[str, str, Optional[datetime]]] = []
+        for index, (title, description, deadline) in enumerate(tasks):
+            try:
+                self._validate_fields(title, description)
+                self._validate_deadline(deadline)
+            except ValidationError as e:
+                errors[index] = e
+            else:
+                valid.append((title, description, deadline))
+
+        created: Sequence[Task] | None = []
+        if valid:
+            created = self._task_repo.create_many(
+                project_id, valid, self._max_tasks_per_project
             )
+        if not created:
+            project = self._project_repo.get_by_id(project_id)
+            if not project:
+                raise ProjectNotFoundError(f"Project with ID '{project_id}' not found.")
+            if valid:
+                raise TaskLimitExceededError(
+                    f"Cannot add {len(valid)} more tasks to '{project.name}'."
+                )
 
-        # Create the task using the repository
-        return self._task_repo.create(
-            project=project,
-            title=task_title,
-            description=task_description,
-            deadline=deadline,
-        )
+        created_tasks = iter(created)
+        return [
+            errors[index] if index in errors else next(created_tasks)
+            for index in range(len(tasks))
+        ]
 
     def find_task_by_id(self, task_id: int) -> Task:
         """Finds a task by its ID. Raises error if not found."""
@@ -94,6 +162,13 @@ class TaskService:
             raise TaskNotFoundError(f"Task with ID '{task_id}' not found.")
         return task
 
+    def find_task_row_by_id(self, task_id: int, fields: Optional[Sequence[TaskField]] = None) -> Row:
+        """Finds a task by its ID as a read-only row of `fields`. Raises error if not found."""
+        row = self._task_repo.get_task_row(task_id, fields)
+        if row is None:
+            raise TaskNotFoundError(f"Task with ID '{task_id}' not found.")
+        return row
+
     def edit_task(
         self,
         task_id: int,
@@ -103,28 +178,27 @@ class TaskService:
         new_deadline: Optional[datetime] = None,
     ) -> Task:
         """Edits an existing task."""
-        task_to_edit = self.find_task_by_id(task_id)
-
-        title_to_validate = new_title if new_title is not None else task_to_edit.title
-        desc_to_validate = (
-            new_description if new_description is not None else task_to_edit.description
-        )
-        status_to_validate = (
-            new_status if new_status is not None else task_to_edit.status
-        )
-        self._validate_fields(title_to_validate, desc_to_validate, status_to_validate)
-
+        # Only the new values need checking; the stored ones passed before.
+        # The task is not read first: the update returns the new row.
+        if new_title is not None:
+            self._validate_title(new_title)
+        if new_description is not None:
+            self._validate_description(new_description)
+        if new_status is not None:
+            self._validate_status(new_status)
         if new_deadline is not None:
             self._validate_deadline(new_deadline)
 
-        # Update the task using the repository
-        return self._task_repo.update(
-            task=task_to_edit,
+        task = self._task_repo.update(
+            task_id,
             new_title=new_title,
             new_description=new_description,
             new_status=new_status,
             new_deadline=new_deadline,
         )
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID '{task_id}' not found.")
+        return task
 
     def delete_task(self, task_id: int) -> None:
         """Deletes a task by its ID."""
@@ -132,10 +206,114 @@ class TaskService:
         # Delete the task using the repository
         self._task_repo.delete(task_to_delete)
 
-    def get_tasks_for_project(self, project_id: int) -> Sequence[Task]:
-        """Gets all tasks for a specific project."""
+    def update_tasks_status(
+        self,
+        new_status: Status,
+        task_ids: Optional[Sequence[int]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Sequence[int]:
+        """
+        Moves every task selected by IDs and/or filters to `new_status`.
+        Returns the IDs of the tasks that changed.
+        """
+        self._validate_status(new_status)
+        self._validate_bulk_selection(task_ids, filters)
+        return self._task_repo.update_status_many(new_status, task_ids, filters)
+
+    def delete_tasks(
+        self,
+        task_ids: Optional[Sequence[int]] = None,
+        filters: Optional[TaskFilter] = None,
+    ) -> Sequence[int]:
+        """
+        Deletes every task selected by IDs and/or filters.
+        Returns the IDs of the deleted tasks.
+        """
+        self._validate_bulk_selection(task_ids, filters)
+        return self._task_repo.delete_many(task_ids, filters)
+
+    def get_tasks_version(self, project_id: int) -> int:
+        """Returns the version of a project's task list, which changes with every write to its tasks."""
+        version = self._project_repo.get_tasks_version(project_id)
+        if version is None:
+            raise ProjectNotFoundError(f"Project with ID '{project_id}' not found.")
+        return version
+
+    def get_tasks_for_project(
+        self,
+        project_id: int,
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSortField = "id",
+        descending: bool = False,
+        after_id: Optional[int] = None,
+        after_value: Any = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Task]:
+        """Gets the tasks of a specific project, optionally filtered, sorted and paged."""
         # First, ensure project exists
         if not self._project_repo.get_by_id(project_id):
             raise ProjectNotFoundError(f"Project with ID '{project_id}' not found.")
         
-        return self._task_repo.get_tasks_for_project(project_id)
+        return self._task_repo.get_tasks_for_project(
+            project_id,
+            filters=filters,
+            sort=sort,
+            descending=descending,
+            after_id=after_id,
+            after_value=after_value,
+            limit=limit,
+        )
+
+    def get_task_rows_for_project(
+        self,
+        project_id: int,
+        filters: Optional[TaskFilter] = None,
+        sort: TaskSortField = "id",
+        descending: bool = False,
+        after_id: Optional[int] = None,
+        after_value: Any = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[TaskField]] = None,
+    ) -> Sequence[Row]:
+        """Like get_tasks_for_project(), as read-only rows of `fields`."""
+        if not self._project_repo.get_by_id(project_id):
+            raise ProjectNotFoundError(f"Project with ID '{project_id}' not found.")
+
+        return self._task_repo.get_task_rows_for_project(
+            project_id,
+            filters=filters,
+            sort=sort,
+            descending=descending,
+            after_id=after_id,
+            after_value=after_value,
+            limit=limit,
+            fields=fields,
+        )
+
+    def search_tasks(
+        self,
+        query: str,
+        filters: Optional[TaskFilter] = None,
+        after_rank: Optional[float] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[TaskField]] = None,
+    ) -> Sequence[Row]:
+        """
+        Searches task titles and descriptions, best matches first, optionally
+        filtered and paged. Returns read-only rows of `fields` and `rank`.
+        """
+        if not query.strip():
+            raise ValidationError("Search query cannot be empty.")
+        if filters is not None and filters.project_id is not None:
+            if not self._project_repo.get_by_id(filters.project_id):
+                raise ProjectNotFoundError(f"Project with ID '{filters.project_id}' not found.")
+
+        return self._task_repo.search(
+            query,
+            filters=filters,
+            after_rank=after_rank,
+            after_id=after_id,
+            limit=limit,
+            fields=fields,
+        )
@@ -0,0 +1,98 @@
+# benchmarks/api_throughput.py
+"""
+Throughput benchmark for the ToDoList API.
+
+Opens N keep-alive connections and hammers one endpoint for a fixed
+duration, then prints requests/second and latency percentiles.
+Only the standard library is used, so the client itself never becomes
+the bottleneck because of a missing dependency.
+
+Usage:
+    uvicorn app.main:app --workers 1 &
+    python benchmarks/api_throughput.py --connections 500 --duration 30 \
+        --path /api/projects/
+
+To compare the sync and async stacks, run it once against a checkout of
+the previous release and once against this one with the same settings.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def _worker(host: str, port: int, path: str, deadline: float, latencies: list, errors: list):
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n"
+    ).encode()
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError as e:
+        errors.append(str(e))
+        return
+
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            headers = await reader.readuntil(b"\r\n\r\n")
+            status_line, *header_lines = headers.decode("latin-1").split("\r\n")
+            length = 0
+            for line in header_lines:
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+
+            latencies.append(time.perf_counter() - started)
+            if not status_line.split(" ")[1].startswith("2"):
+                errors.append(status_line)
+    except (OSError, asyncio.IncompleteReadError) as e:
+        errors.append(str(e))
+    finally:
+        writer.close()
+
+
+async def run(base_url: str, path: str, connections: int, duration: float) -> None:
+    parts = urlsplit(base_url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    latencies: list = []
+    errors: list = []
+
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(_worker(host, port, path, deadline, latencies, errors) for _ in range(connections))
+    )
+    elapsed = time.perf_counter() - started
+
+    if not latencies:
+        print(f"No successful requests. First errors: {errors[:3]}")
+        return
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"connections: {connections}, duration: {elapsed:.1f}s, path: {path}")
+    print(f"requests:    {len(latencies)} ({len(latencies) / elapsed:.0f} req/s)")
+    print(f"errors:      {len(errors)}")
+    print(
+        f"latency:     p50={quantiles[49] * 1000:.1f}ms "
+        f"p90={quantiles[89] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/api/projects/")
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=30.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.path, args.connections, args.duration))
+
+
+if __name__ == "__main__":
+    main()
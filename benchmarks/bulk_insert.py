@@ -0,0 +1,65 @@
+# benchmarks/bulk_insert.py
+"""
+Compares creating tasks one by one with TaskService.add_task_to_project
+against a single TaskService.add_tasks_to_project call.
+
+Runs against DATABASE_URL in a throwaway project that is deleted at the
+end. Every call is its own unit of work, committed like an API request:
+the per-task path pays a commit per task, the bulk path one in all.
+
+Usage:
+    python benchmarks/bulk_insert.py --tasks 500
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.db.session import get_session
+from app.db.unit_of_work import unit_of_work
+from app.repositories import ProjectRepository, TaskRepository
+from app.services import ProjectService, TaskService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500)
+    args = parser.parse_args()
+
+    session = get_session()
+    project_repo = ProjectRepository(session)
+    project_service = ProjectService(project_repo, max_projects=10**9)
+    task_service = TaskService(TaskRepository(session), project_repo, max_tasks_per_project=10**9)
+    items = [(f"Task {i}", "Benchmark task", None) for i in range(args.tasks)]
+
+    timings = {}
+    for label in ("per-task", "bulk"):
+        with unit_of_work(session):
+            project = project_service.create_project(f"bench-{uuid.uuid4().hex[:12]}", "Benchmark project")
+        started = time.perf_counter()
+        if label == "bulk":
+            with unit_of_work(session):
+                task_service.add_tasks_to_project(project.id, items)
+        else:
+            for title, description, deadline in items:
+                with unit_of_work(session):
+                    task_service.add_task_to_project(project.id, title, description, deadline)
+        timings[label] = time.perf_counter() - started
+        with unit_of_work(session):
+            project_service.delete_project(project.id)
+
+    for label, elapsed in timings.items():
+        print(f"{label:>8}: {elapsed * 1000:8.1f} ms  ({args.tasks / elapsed:9.0f} tasks/s)")
+    print(f"speedup: {timings['per-task'] / timings['bulk']:.1f}x")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
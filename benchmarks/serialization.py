@@ -0,0 +1,91 @@
+# benchmarks/serialization.py
+"""
+Compares the per-item cost of encoding a page of tasks as JSON the way
+list endpoints used to (Page[TaskResponse].model_validate() from the ORM
+objects, then model_dump_json()) with the record encoders of
+app.api.serialization, using orjson if installed and Pydantic's encoder
+otherwise. All variants must produce the same bytes; this is checked.
+
+Needs no database: the tasks are transient ORM objects.
+
+Usage:
+    python benchmarks/serialization.py --items 500 --rounds 200
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.api import serialization
+from app.api.schemas.responses import Page, TaskResponse
+from app.api.serialization import dumps, record_encoder
+from app.models import Task
+
+
+def make_tasks(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    tasks = []
+    for i in range(count):
+        task = Task(
+            title=f"Task {i}",
+            description="Benchmark task with a description of typical length",
+            deadline=now + timedelta(days=i % 30) if i % 3 else None,
+        )
+        task.id = i + 1
+        task.project_id = 1
+        task.created_at = now
+        task.closed_at = None
+        tasks.append(task)
+    return tasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.items)
+    task_record = record_encoder(TaskResponse)
+    orjson = serialization.orjson
+
+    def validated() -> bytes:
+        page = {"items": tasks, "next_cursor": None}
+        return Page[TaskResponse].model_validate(page).model_dump_json().encode()
+
+    def records() -> bytes:
+        return dumps({"items": [task_record(task) for task in tasks], "next_cursor": None})
+
+    def records_pydantic() -> bytes:
+        # The fallback used when orjson is not installed
+        serialization.orjson = None
+        try:
+            return records()
+        finally:
+            serialization.orjson = orjson
+
+    variants = {"model_validate + model_dump_json": validated}
+    if orjson is not None:
+        variants["record_encoder + orjson"] = records
+    variants["record_encoder + pydantic_core"] = records_pydantic
+
+    expected = validated()
+    timings = {}
+    for label, encode in variants.items():
+        if encode() != expected:
+            sys.exit(f"{label} does not produce the same JSON as model_dump_json()")
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            encode()
+        timings[label] = (time.perf_counter() - started) / (args.rounds * args.items)
+
+    baseline = timings["model_validate + model_dump_json"]
+    for label, per_item in timings.items():
+        print(f"{label:>34}: {per_item * 1e6:6.2f} µs/item  ({baseline / per_item:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
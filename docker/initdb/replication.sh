@@ -0,0 +1,6 @@
+#!/bin/sh
+# docker/initdb/replication.sh
+# Run by the postgres image when it creates the primary's data directory:
+# lets the db-replica service stream WAL from it as POSTGRES_USER.
+set -e
+echo "host replication $POSTGRES_USER all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,69 @@
+# tests/test_conditional.py
+from app.api.conditional import response_cache
+
+def get(client, url, etag=None, **params):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(url, params=params, headers=headers)
+
+def test_unchanged_project_list_is_304(client, new_project):
+    new_project()
+    first = get(client, "/api/projects/")
+    etag = first.headers["ETag"]
+
+    again = get(client, "/api/projects/", etag)
+    assert (again.status_code, again.headers["ETag"], again.content) == (304, etag, b"")
+    assert get(client, "/api/projects/", f"W/{etag}").status_code == 304
+    assert get(client, "/api/projects/", f'"other", {etag}').status_code == 304
+    assert get(client, "/api/projects/", "*").status_code == 304
+
+def test_project_writes_change_the_list_etag(client, new_project):
+    project_id = new_project()
+    etags = [get(client, "/api/projects/").headers["ETag"]]
+
+    client.put(f"/api/projects/{project_id}", json={"description": "changed"})
+    etags.append(get(client, "/api/projects/").headers["ETag"])
+    new_project("Other")
+    etags.append(get(client, "/api/projects/").headers["ETag"])
+    client.delete(f"/api/projects/{project_id}")
+    response = get(client, "/api/projects/", etags[-1])
+
+    assert len(set(etags)) == 3
+    assert response.status_code == 200
+    assert [project["name"] for project in response.json()["items"]] == ["Other"]
+
+def test_task_writes_change_the_task_list_etag(client, new_project, new_task):
+    project_id = new_project()
+    other_id = new_project("Other")
+    url = f"/api/projects/{project_id}/tasks"
+    etag = get(client, url).headers["ETag"]
+
+    # Writes to another project's tasks leave this list alone
+    new_task(other_id)
+    assert get(client, url, etag).status_code == 304
+
+    task = new_task(project_id)
+    response = get(client, url, etag)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    client.post("/api/tasks/bulk/status", json={"ids": [task["id"]], "status": "done"})
+    response = get(client, url, etag)
+    assert response.status_code == 200
+    assert response.json()["items"][0]["status"] == "done"
+
+def test_each_query_has_its_own_etag(client, new_project):
+    new_project()
+    etag = get(client, "/api/projects/", limit=1).headers["ETag"]
+
+    assert get(client, "/api/projects/", etag, limit=2).status_code == 200
+    assert get(client, "/api/projects/", etag, limit=1).status_code == 304
+
+def test_rendered_pages_are_served_from_the_cache(client, new_project):
+    new_project()
+    hits = response_cache.stats()["hits"]
+
+    first = get(client, "/api/projects/")
+    second = get(client, "/api/projects/")
+
+    assert first.content == second.content
+    assert response_cache.stats()["hits"] == hits + 1
@@ -0,0 +1,110 @@
+# tests/test_deadline_engine.py
+import asyncio
+import io
+import select
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from app.db.unit_of_work import unit_of_work
+from app.models import Task
+from app.repositories import ProjectRepository, TaskRepository
+from app.repositories import task_repository
+from app.repositories.import_repository import TaskImportRepository
+from app.repositories.task_repository import DEADLINE_CHANNEL
+from app.scheduling.deadline_engine import DeadlineEngine
+from app.services.import_service import TaskImportService
+
+DEADLINE = datetime(2099, 1, 1, 12, 30).astimezone()
+
+@pytest.fixture
+def announce(monkeypatch):
+    monkeypatch.setattr(task_repository, "ANNOUNCE_DEADLINES", True)
+
+@pytest.fixture
+def project_id(session) -> int:
+    with unit_of_work(session):
+        return ProjectRepository(session).create("Project", "description", 10).id
+
+@pytest.fixture
+def announcements(engine):
+    """Returns a function reading the deadlines announced so far, as epoch seconds."""
+    connection = engine.raw_connection()
+    dbapi_connection = connection.dbapi_connection
+    dbapi_connection.autocommit = True
+    with dbapi_connection.cursor() as cursor:
+        cursor.execute(f'LISTEN "{DEADLINE_CHANNEL}"')
+
+    def read() -> List[float]:
+        select.select([dbapi_connection], [], [], 1.0)
+        dbapi_connection.poll()
+        payloads = [notify.payload for notify in dbapi_connection.notifies]
+        dbapi_connection.notifies.clear()
+        return [float(stamp) for payload in payloads for stamp in payload.split(",")]
+
+    yield read
+    connection.invalidate()
+
+def create_task(session, project_id: int, deadline=None) -> Task:
+    with unit_of_work(session):
+        return TaskRepository(session).create(project_id, "task", "description", 10, deadline)
+
+def test_task_writes_announce_their_deadlines(session, project_id, announce, announcements):
+    create_task(session, project_id, DEADLINE)
+    create_task(session, project_id)
+    with unit_of_work(session):
+        TaskRepository(session).create_many(
+            project_id, [("a", "d", DEADLINE + timedelta(hours=1)), ("b", "d", None)], 10
+        )
+
+    assert announcements() == [DEADLINE.timestamp(), (DEADLINE + timedelta(hours=1)).timestamp()]
+
+def test_rolled_back_writes_announce_nothing(session, project_id, announce, announcements):
+    with pytest.raises(RuntimeError):
+        with unit_of_work(session):
+            TaskRepository(session).create(project_id, "task", "description", 10, DEADLINE)
+            raise RuntimeError
+
+    assert announcements() == []
+
+def test_imports_announce_their_deadlines(session, announce, announcements):
+    service = TaskImportService(TaskImportRepository(session), 10, 10)
+    with unit_of_work(session):
+        service.import_tasks(io.StringIO(
+            '{"project": "A", "title": "t", "description": "d", "deadline": "2099-01-01T12:30:00+00:00"}\n'
+        ), "ndjson")
+
+    assert announcements() == [datetime.fromisoformat("2099-01-01T12:30:00+00:00").timestamp()]
+
+def test_nothing_is_announced_while_the_engine_is_disabled(session, project_id, announcements):
+    create_task(session, project_id, DEADLINE)
+
+    assert announcements() == []
+
+def test_engine_closes_tasks_at_their_deadline(engine, session, project_id, announce):
+    later = create_task(session, project_id, DEADLINE).id
+
+    async def run():
+        deadline_engine = DeadlineEngine(engine, coalesce_seconds=0.1)
+        await deadline_engine.start()
+        try:
+            # Announced after the engine has loaded its first window
+            await asyncio.sleep(0.5)
+            soon = await asyncio.to_thread(
+                lambda: create_task(session, project_id, datetime.now().astimezone() + timedelta(seconds=1)).id
+            )
+            stop_at = time.monotonic() + 10
+            while deadline_engine.closed == 0 and time.monotonic() < stop_at:
+                await asyncio.sleep(0.1)
+            return soon, deadline_engine
+        finally:
+            await deadline_engine.stop()
+
+    soon, deadline_engine = asyncio.run(run())
+
+    session.expire_all()
+    assert session.get(Task, soon).closed_at is not None
+    assert session.get(Task, later).closed_at is None
+    assert deadline_engine.closed == 1
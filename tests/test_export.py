@@ -0,0 +1,78 @@
+# tests/test_export.py
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from app.api.export import EXPORT_FIELDS, csv_lines, ndjson_lines
+
+def ndjson_records(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+def test_exports_every_task_as_ndjson(client, new_project, new_task):
+    first = new_task(new_project(), "one", deadline="2099-01-01")
+    second = new_task(new_project("Other"), "two")
+
+    response = client.get("/api/tasks/export")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="tasks.ndjson"'
+    records = ndjson_records(response)
+    assert [record["id"] for record in records] == [first["id"], second["id"]]
+    assert set(records[0]) == set(EXPORT_FIELDS)
+    assert records[0]["title"] == "one"
+    assert datetime.fromisoformat(records[0]["deadline"]) == datetime.fromisoformat(first["deadline"])
+
+def test_exports_csv_with_a_header(client, new_project, new_task):
+    task = new_task(new_project(), 'Say "hi", then\nleave')
+
+    response = client.get("/api/tasks/export", params={"format": "csv"})
+
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == EXPORT_FIELDS
+    assert rows[1][EXPORT_FIELDS.index("title")] == task["title"]
+    assert len(rows) == 2
+
+def test_export_applies_the_filters(client, new_project, new_task):
+    project_id = new_project()
+    ids = [new_task(project_id, f"task {i}")["id"] for i in range(3)]
+    new_task(new_project("Other"))
+    client.post("/api/tasks/bulk/status", json={"ids": [ids[1]], "status": "done"})
+
+    response = client.get("/api/tasks/export", params={"project_id": project_id, "status": "todo"})
+
+    assert [record["id"] for record in ndjson_records(response)] == [ids[0], ids[2]]
+
+def test_export_of_a_missing_project_is_404(client):
+    assert client.get("/api/tasks/export", params={"project_id": 1}).status_code == 404
+
+def test_export_streams_past_one_batch(client, new_project, monkeypatch):
+    monkeypatch.setenv("MAX_TASKS_PER_PROJECT", "1500")
+    project_id = new_project()
+    for start in (0, 600):
+        items = [{"title": f"task {start + i}", "description": "d"} for i in range(600)]
+        client.post(f"/api/projects/{project_id}/tasks/bulk", json=items)
+
+    records = ndjson_records(client.get("/api/tasks/export"))
+
+    assert [record["title"] for record in records] == [f"task {i}" for i in range(1200)]
+
+def test_encoders_write_one_chunk_per_batch():
+    deadline = datetime(2099, 1, 1, tzinfo=timezone.utc)
+    row = (1, 2, "title", "description", "todo", deadline, deadline, None)
+
+    async def batches():
+        yield [row, row]
+        yield [row]
+
+    async def collect(lines):
+        return [chunk async for chunk in lines]
+
+    ndjson = asyncio.run(collect(ndjson_lines(batches())))
+    assert [chunk.count("\n") for chunk in ndjson] == [2, 1]
+    assert json.loads(ndjson[1])["deadline"] == "2099-01-01T00:00:00+00:00"
+
+    # The header is a chunk of its own
+    assert [chunk.count("\r\n") for chunk in asyncio.run(collect(csv_lines(batches())))] == [1, 2, 1]
@@ -0,0 +1,137 @@
+# tests/test_import.py
+import io
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.unit_of_work import unit_of_work
+from app.exceptions.base import ValidationError
+from app.models import Counter, Project, Task
+from app.models.counter import PROJECTS_COUNTER
+from app.repositories import ProjectRepository
+from app.repositories.import_repository import TaskImportRepository
+from app.services.import_service import ImportReport, TaskImportService
+
+MAX_PROJECTS = 2
+MAX_TASKS = 3
+
+def run_import(session: Session, text: str, format: str = "ndjson") -> ImportReport:
+    service = TaskImportService(TaskImportRepository(session), MAX_PROJECTS, MAX_TASKS, batch_size=2)
+    with unit_of_work(session):
+        return service.import_tasks(io.StringIO(text), format)
+
+def ndjson(*records) -> str:
+    return "".join(f"{json.dumps(record)}\n" for record in records)
+
+def task(project: str, title: str, **fields) -> dict:
+    return {"project": project, "title": title, "description": "description", **fields}
+
+def project_named(session: Session, name: str) -> Project:
+    return session.scalar(select(Project).where(Project.name == name))
+
+def test_imports_into_existing_and_new_projects(session, assert_counters_match):
+    with unit_of_work(session):
+        inbox = ProjectRepository(session).create("Inbox", "description", MAX_PROJECTS).id
+
+    report = run_import(session, ndjson(
+        task("INBOX", "one"),
+        task("inbox", "two", status="done"),
+        task("Work", "three", project_description="Work things"),
+    ))
+
+    assert report == ImportReport(
+        rows_read=3, rows_staged=3, projects_created=1, tasks_created=3, failed=0, errors=[]
+    )
+    work = project_named(session, "Work")
+    assert work.description == "Work things"
+    assert session.scalar(select(func.count()).where(Task.project_id == inbox)) == 2
+    assert_counters_match(inbox)
+    assert_counters_match(work.id)
+    assert session.scalar(select(Counter.value).where(Counter.name == PROJECTS_COUNTER)) == 2
+
+def test_reports_quota_errors_by_line(session, assert_counters_match):
+    report = run_import(session, ndjson(
+        task("A", "a1"),
+        task("B", "b1"),
+        task("C", "c1"),
+        *(task("A", f"a{i}") for i in range(2, 5)),
+    ))
+
+    assert (report.projects_created, report.tasks_created, report.failed) == (2, 4, 2)
+    assert report.errors == [
+        (3, "Cannot create more than 2 projects."),
+        (6, "Cannot add more tasks to 'A'."),
+    ]
+    assert project_named(session, "C") is None
+    assert_counters_match(project_named(session, "A").id)
+
+def test_reports_invalid_lines_and_imports_the_rest(session):
+    report = run_import(session, "\n".join([
+        json.dumps(task("A", "kept")),
+        "{not json",
+        "[1, 2]",
+        json.dumps(task("A", "bad status", status="later")),
+        json.dumps(task("A", "bad deadline", deadline="tomorrow")),
+        json.dumps(task("A", "past deadline", deadline="2000-01-01")),
+        "",
+    ]))
+
+    assert (report.rows_read, report.rows_staged, report.tasks_created) == (6, 1, 1)
+    assert [line for line, _ in report.errors] == [2, 3, 4, 5, 6]
+    assert report.errors[:3] == [
+        (2, "Invalid JSON."),
+        (3, "Each line must be a JSON object."),
+        (4, "Status must be one of 'todo', 'doing', or 'done'."),
+    ]
+
+def test_imports_csv(session, assert_counters_match):
+    report = run_import(session, (
+        "project,title,description,status,deadline\n"
+        "A,one,first,doing,\n"
+        "A,two,second,,2099-12-01T09:30:00+00:00\n"
+    ), format="csv")
+
+    assert (report.projects_created, report.tasks_created, report.errors) == (1, 2, [])
+    tasks = session.scalars(select(Task).order_by(Task.id)).all()
+    assert [(t.title, t.status) for t in tasks] == [("one", "doing"), ("two", "todo")]
+    assert tasks[1].deadline == datetime.fromisoformat("2099-12-01T09:30:00+00:00")
+    assert_counters_match(tasks[0].project_id)
+
+def test_rejects_csv_without_required_columns(session):
+    with pytest.raises(ValidationError, match="description"):
+        run_import(session, "project,title\nA,one\n", format="csv")
+
+def test_reads_naive_deadlines_in_local_time(session):
+    run_import(session, ndjson(task("A", "one", deadline="2099-12-01")))
+
+    assert session.scalar(select(Task.deadline)) == datetime(2099, 12, 1).astimezone()
+
+def test_concurrent_imports_respect_the_project_quota(session, concurrently):
+    reports = concurrently(
+        lambda worker, i: run_import(worker, ndjson(task(f"P{i}", "t"), task("Shared", "t"))), 6
+    )
+
+    projects = session.scalars(select(Project.name)).all()
+    assert len(projects) == MAX_PROJECTS
+    assert sum(report.projects_created for report in reports) == MAX_PROJECTS
+    assert session.scalar(select(Counter.value).where(Counter.name == PROJECTS_COUNTER)) == MAX_PROJECTS
+    assert session.scalar(select(func.count()).select_from(Task)) == sum(
+        report.tasks_created for report in reports
+    )
+
+def test_import_endpoint(client):
+    body = ndjson(task("A", "one"), task("A", "two", status="later"))
+
+    response = client.post("/api/import/tasks", content=body)
+
+    assert response.json() == {
+        "rows_read": 2,
+        "projects_created": 1,
+        "tasks_created": 1,
+        "failed": 1,
+        "errors": [{"line": 2, "error": "Status must be one of 'todo', 'doing', or 'done'."}],
+    }
+    assert client.post("/api/import/tasks", params={"format": "csv"}, content="title\none\n").status_code == 400
@@ -0,0 +1,45 @@
+# tests/test_lookup.py
+from app.repositories import ProjectRepository
+
+def lookup(client, prefix, **params):
+    response = client.get("/api/projects/lookup", params={"prefix": prefix, **params})
+    assert response.status_code == 200, response.text
+    return [project["name"] for project in response.json()]
+
+def test_prefix_lookup_is_case_insensitive_in_name_order(client, new_project):
+    for name in ["Work", "weekend", "WEB site", "Inbox"]:
+        new_project(name)
+
+    assert lookup(client, "we", fuzzy="false") == ["WEB site", "weekend"]
+    assert lookup(client, "W", fuzzy="false", limit=2) == ["WEB site", "weekend"]
+
+def test_prefix_wildcards_are_literal(client, new_project):
+    for name in ["100% done", "100 percent", "a_b", "axb"]:
+        new_project(name)
+
+    assert lookup(client, "100%", fuzzy="false") == ["100% done"]
+    assert lookup(client, "a_", fuzzy="false") == ["a_b"]
+
+def test_short_prefixes_are_not_fuzzy(client, new_project):
+    new_project("Inbox")
+
+    # Under three characters only the prefix is looked up
+    assert lookup(client, "nb") == []
+
+def test_blank_prefix_is_400(client):
+    assert client.get("/api/projects/lookup", params={"prefix": "  "}).status_code == 400
+
+def test_fuzzy_lookup_tolerates_typos(client, new_project, pg_trgm):
+    for name in ["Groceries", "Grocery list", "Garden"]:
+        new_project(name)
+
+    # Prefix matches come first, then similar names without repeating them
+    assert lookup(client, "grocery") == ["Grocery list", "Groceries"]
+    assert lookup(client, "grocreies")[0] == "Groceries"
+    assert "Garden" not in lookup(client, "grocreies")
+
+def test_get_by_name_ignores_case(session, new_project):
+    project_id = new_project("Inbox")
+
+    assert ProjectRepository(session).get_by_name("INBOX").id == project_id
+    assert ProjectRepository(session).get_by_name("Inbo") is None
@@ -0,0 +1,40 @@
+# tests/test_metrics.py
+from prometheus_client.parser import text_string_to_metric_families
+
+from app.metrics import Registry
+
+def samples(text: str) -> dict:
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+def test_requests_are_counted_by_route_template(client, new_project):
+    project_id = new_project()
+    client.get(f"/api/projects/{project_id}")
+    client.get("/api/projects/999")
+
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=")
+    values = samples(response.text)
+    route = (("method", "GET"), ("route", "/api/projects/{project_id}"))
+    assert values[("http_requests_total", (*route, ("status", "200")))] >= 1
+    assert values[("http_requests_total", (*route, ("status", "404")))] >= 1
+    assert values[("http_request_duration_seconds_count", route)] >= 2
+    assert values[("http_request_db_statements_count", route)] >= 2
+    assert not any(name.endswith("_created") for name, _ in values)
+
+def test_callback_gauges_are_read_at_render_time():
+    registry = Registry()
+    readings = iter([{("a",): 1.0}, {("a",): 2.0, ("b",): 3.0}])
+    registry.callback_gauge("queue_depth", "Items queued.", ("queue",), lambda: next(readings))
+    registry.counter("jobs_total", "Jobs run.", ("job",)).labels("sync").inc(2)
+
+    first = samples(registry.render().decode())
+    second = samples(registry.render().decode())
+
+    assert first[("queue_depth", (("queue", "a"),))] == 1.0
+    assert first[("jobs_total", (("job", "sync"),))] == 2.0
+    assert second[("queue_depth", (("queue", "b"),))] == 3.0
@@ -0,0 +1,57 @@
+# tests/test_pagination.py
+import pytest
+
+from app.api.pagination import decode_id_cursor, encode_cursor
+from app.exceptions.base import ValidationError
+
+def read_all(client, url, **params):
+    """Follows next_cursor from the first page to the last; returns the pages' items."""
+    pages = []
+    response = client.get(url, params=params).json()
+    pages.append(response["items"])
+    while response["next_cursor"] is not None:
+        response = client.get(url, params={**params, "after": response["next_cursor"]}).json()
+        pages.append(response["items"])
+    return pages
+
+def test_projects_are_listed_page_by_page(client, new_project):
+    ids = [new_project(f"project {i}") for i in range(5)]
+
+    pages = read_all(client, "/api/projects/", limit=2)
+
+    assert [[project["id"] for project in page] for page in pages] == [ids[:2], ids[2:4], ids[4:]]
+
+def test_a_full_last_page_has_no_next_cursor(client, new_project):
+    for i in range(2):
+        new_project(f"project {i}")
+
+    assert client.get("/api/projects/", params={"limit": 2}).json()["next_cursor"] is None
+
+def test_tasks_are_listed_page_by_page(client, new_project, new_task):
+    project_id = new_project()
+    ids = [new_task(project_id, f"task {i}")["id"] for i in range(5)]
+
+    pages = read_all(client, f"/api/projects/{project_id}/tasks", limit=2)
+
+    assert [task["id"] for page in pages for task in page] == ids
+    assert len(pages) == 3
+
+def test_pages_do_not_shift_when_earlier_rows_are_deleted(client, new_project):
+    ids = [new_project(f"project {i}") for i in range(4)]
+    first = client.get("/api/projects/", params={"limit": 2}).json()
+
+    client.delete(f"/api/projects/{ids[0]}")
+    second = client.get("/api/projects/", params={"limit": 2, "after": first["next_cursor"]}).json()
+
+    assert [project["id"] for project in second["items"]] == ids[2:]
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor({"id": "1"}), "WzFd"])
+def test_invalid_cursors_are_400(client, new_project, cursor):
+    project_id = new_project()
+
+    assert client.get("/api/projects/", params={"after": cursor}).status_code == 400
+    assert client.get(f"/api/projects/{project_id}/tasks", params={"after": cursor}).status_code == 400
+
+def test_cursor_round_trip():
+    assert decode_id_cursor(encode_cursor({"id": 42})) == 42
+    assert decode_id_cursor(None) is None
@@ -0,0 +1,110 @@
+# tests/test_project_cache.py
+import time
+
+import pytest
+from sqlalchemy import update
+
+from app.cache import ProjectCache, TTLCache
+from app.db.unit_of_work import unit_of_work
+from app.models import Project
+from app.repositories import ProjectRepository
+
+@pytest.fixture
+def cache() -> ProjectCache:
+    return ProjectCache(max_size=10, ttl_seconds=30)
+
+@pytest.fixture
+def project_id(session) -> int:
+    with unit_of_work(session):
+        return ProjectRepository(session).create("Inbox", "description", 10).id
+
+def change_behind_the_cache(session, project_id: int, **values) -> None:
+    with unit_of_work(session):
+        session.execute(update(Project).where(Project.id == project_id).values(**values))
+    session.expunge_all()
+
+def test_ttl_cache_evicts_the_least_recently_used_entry():
+    cache = TTLCache(max_size=2, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_cache_entries_expire(monkeypatch):
+    cache = TTLCache(max_size=2, ttl_seconds=30)
+    cache.set("a", 1)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_lookups_are_served_from_the_cache(session, cache, project_id):
+    repo = ProjectRepository(session, cache)
+    assert repo.get_by_id(project_id).description == "description"
+    change_behind_the_cache(session, project_id, description="changed")
+
+    assert repo.get_by_id(project_id).description == "description"
+    assert repo.get_by_name("INBOX").id == project_id
+    assert cache.stats()["by_id"]["hits"] == 2
+
+def test_misses_are_not_cached(session, cache):
+    repo = ProjectRepository(session, cache)
+
+    assert repo.get_by_id(1) is None
+    assert cache.get(1) is None
+
+def test_update_invalidates_on_commit_only(session, cache, project_id):
+    repo = ProjectRepository(session, cache)
+    repo.get_by_id(project_id)
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(session):
+            repo.update(project_id, new_description="rolled back")
+            raise RuntimeError
+    assert cache.get(project_id)["description"] == "description"
+
+    with unit_of_work(session):
+        repo.update(project_id, new_name="Renamed")
+    assert cache.get(project_id) is None
+    assert cache.get_id_by_name("inbox") is None
+    assert repo.get_by_name("Inbox") is None
+    assert repo.get_by_id(project_id).name == "Renamed"
+
+def test_delete_invalidates(session, cache, project_id):
+    repo = ProjectRepository(session, cache)
+    with unit_of_work(session):
+        repo.delete(repo.get_by_id(project_id))
+
+    assert repo.get_by_id(project_id) is None
+    assert repo.get_by_name("Inbox") is None
+
+def test_a_cached_name_that_moved_on_is_not_served(session, cache, project_id):
+    repo = ProjectRepository(session, cache)
+    repo.get_by_name("Inbox")
+    # Another process renamed it; only its ID was dropped from our cache
+    change_behind_the_cache(session, project_id, name="Renamed")
+    cache.invalidate(project_id)
+
+    assert repo.get_by_name("Inbox") is None
+
+def test_writes_in_other_processes_invalidate_through_notifications(engine, session, project_id):
+    cache = ProjectCache(max_size=10, ttl_seconds=30, notify=True)
+    cache.start_listener(engine)
+    try:
+        # Notifications sent before the listener is connected are lost, so retry until one lands
+        deadline = time.monotonic() + 10
+        while True:
+            ProjectRepository(session, cache).get_by_id(project_id)
+            with unit_of_work(session):
+                ProjectRepository(session).update(project_id, new_description=f"{time.monotonic()}")
+            for _ in range(20):
+                if cache.get(project_id) is None:
+                    return
+                time.sleep(0.05)
+            assert time.monotonic() < deadline, "no invalidation arrived"
+    finally:
+        cache.stop_listener()
@@ -0,0 +1,81 @@
+# tests/test_project_repository.py
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.unit_of_work import unit_of_work
+from app.models import Counter, Project
+from app.models.counter import PROJECTS_COUNTER
+from app.repositories import ProjectRepository
+
+MAX_PROJECTS = 3
+
+def create(session: Session, name: str, max_projects: int = MAX_PROJECTS) -> Optional[int]:
+    with unit_of_work(session):
+        project = ProjectRepository(session).create(name, "description", max_projects)
+        return None if project is None else project.id
+
+def assert_projects(session: Session, count: int) -> None:
+    """The projects counter and the table both hold `count` projects."""
+    session.expire_all()
+    assert session.scalar(select(func.count()).select_from(Project)) == count
+    assert session.scalar(select(Counter.value).where(Counter.name == PROJECTS_COUNTER)) == count
+
+def test_create_stops_at_the_limit(session):
+    ids = [create(session, f"project {i}") for i in range(MAX_PROJECTS + 2)]
+
+    assert all(ids[:MAX_PROJECTS])
+    assert ids[MAX_PROJECTS:] == [None, None]
+    assert_projects(session, MAX_PROJECTS)
+
+def test_create_rejects_a_name_differing_only_in_case(session):
+    assert create(session, "Inbox") is not None
+    assert create(session, "INBOX") is None
+
+    # The slot the conflicting insert took is given back
+    assert_projects(session, 1)
+    assert create(session, "Other") is not None
+
+def test_concurrent_creates_never_exceed_the_limit(session, concurrently):
+    ids = concurrently(lambda worker, i: create(worker, f"project {i}"), 12)
+
+    assert sum(project_id is not None for project_id in ids) == MAX_PROJECTS
+    assert_projects(session, MAX_PROJECTS)
+
+def test_concurrent_creates_of_one_name_make_one_project(session, concurrently):
+    ids = concurrently(lambda worker, i: create(worker, "Inbox" if i % 2 else "INBOX"), 8)
+
+    assert sum(project_id is not None for project_id in ids) == 1
+    assert_projects(session, 1)
+
+def test_delete_gives_the_slot_back(session):
+    ids = [create(session, f"project {i}") for i in range(MAX_PROJECTS)]
+    with unit_of_work(session):
+        repo = ProjectRepository(session)
+        repo.delete(repo.get_by_id(ids[0]))
+
+    assert create(session, "replacement") is not None
+    assert_projects(session, MAX_PROJECTS)
+
+def test_rename_onto_a_taken_name_leaves_the_unit_of_work_usable(session):
+    create(session, "First")
+    second = create(session, "Second")
+
+    with unit_of_work(session):
+        repo = ProjectRepository(session)
+        assert repo.update(second, new_name="FIRST") is None
+        # Only the rename's savepoint was rolled back
+        assert repo.update(second, new_description="changed") is not None
+
+    session.expire_all()
+    project = session.get(Project, second)
+    assert (project.name, project.description) == ("Second", "changed")
+
+def test_rename_frees_the_old_name(session):
+    project_id = create(session, "Old")
+    with unit_of_work(session):
+        assert ProjectRepository(session).update(project_id, new_name="New") is not None
+
+    assert create(session, "old") is not None
+    assert create(session, "NEW") is None
@@ -0,0 +1,52 @@
+# tests/test_projections.py
+def schema_of(openapi, ref):
+    return openapi["components"]["schemas"][ref["$ref"].rsplit("/", 1)[-1]]
+
+def response_schema(client, path):
+    openapi = client.get("/openapi.json").json()
+    content = openapi["paths"][path]["get"]["responses"]["200"]["content"]["application/json"]
+    return openapi, content["schema"]
+
+def test_task_reads_return_only_the_requested_fields(client, new_project, new_task):
+    project_id = new_project()
+    task = new_task(project_id, "Read me", deadline="2099-01-01")
+
+    response = client.get(f"/api/tasks/{task['id']}", params={"fields": ["title", "status"]})
+    assert response.json() == {"title": "Read me", "status": "todo"}
+
+    # The sort column is read for the cursor but not sent
+    page = client.get(
+        f"/api/projects/{project_id}/tasks", params={"fields": "title", "sort": "deadline"}
+    ).json()
+    assert page["items"] == [{"title": "Read me"}]
+
+def test_project_list_projections_combine_with_include(client, new_project, new_task):
+    project_id = new_project("Inbox")
+    new_task(project_id)
+
+    page = client.get("/api/projects/", params={"fields": "name"}).json()
+    assert page["items"] == [{"name": "Inbox"}]
+
+    page = client.get("/api/projects/", params={"fields": "name", "include": "counts"}).json()
+    assert page["items"] == [
+        {"name": "Inbox", "task_counts": {"total": 1, "todo": 1, "doing": 0, "done": 0, "overdue": 0}}
+    ]
+
+def test_unknown_fields_are_422(client, new_project):
+    project_id = new_project()
+
+    assert client.get("/api/projects/", params={"fields": "secret"}).status_code == 422
+    assert client.get(f"/api/projects/{project_id}/tasks", params={"fields": "secret"}).status_code == 422
+
+def test_projection_schemas_require_no_field(client):
+    openapi, schema = response_schema(client, "/api/tasks/{task_id}")
+    assert "required" not in schema_of(openapi, schema)
+
+    for path in ["/api/projects/{project_id}/tasks", "/api/projects/"]:
+        openapi, page = response_schema(client, path)
+        items = schema_of(openapi, page)["properties"]["items"]["items"]
+        assert "required" not in schema_of(openapi, items), path
+
+    openapi, page = response_schema(client, "/api/tasks/search")
+    items = schema_of(openapi, page)["properties"]["items"]["items"]
+    assert schema_of(openapi, items)["required"] == ["rank"]
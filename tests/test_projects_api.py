@@ -0,0 +1,53 @@
+# tests/test_projects_api.py
+from datetime import datetime, timezone
+
+from sqlalchemy import update
+
+from app.db.unit_of_work import unit_of_work
+from app.models import Task
+
+def test_project_lifecycle(client, new_project):
+    project_id = new_project("Inbox")
+
+    assert client.get(f"/api/projects/{project_id}").json() == {
+        "id": project_id, "name": "Inbox", "description": "description",
+    }
+    response = client.put(f"/api/projects/{project_id}", json={"description": "changed"})
+    assert response.json() == {"id": project_id, "name": "Inbox", "description": "changed"}
+
+    assert client.delete(f"/api/projects/{project_id}").status_code == 204
+    assert client.get(f"/api/projects/{project_id}").status_code == 404
+
+def test_create_project_rejects_a_duplicate_name(client, new_project):
+    new_project("Inbox")
+
+    response = client.post("/api/projects/", json={"name": "Inbox", "description": "again"})
+    assert response.status_code == 400
+
+def test_missing_project_is_404(client):
+    assert client.get("/api/projects/1").status_code == 404
+    assert client.put("/api/projects/1", json={"name": "x"}).status_code == 404
+    assert client.delete("/api/projects/1").status_code == 404
+
+def test_summary_counts_tasks_by_status_and_overdue(client, new_project, new_task, session):
+    project_id = new_project()
+    ids = [new_task(project_id, f"task {i}")["id"] for i in range(4)]
+    client.post("/api/tasks/bulk/status", json={"ids": ids[:1], "status": "doing"})
+    client.post("/api/tasks/bulk/status", json={"ids": ids[1:2], "status": "done"})
+    # The API refuses past deadlines, so one is set behind its back
+    with unit_of_work(session):
+        session.execute(
+            update(Task).where(Task.id == ids[3]).values(deadline=datetime(2000, 1, 1, tzinfo=timezone.utc))
+        )
+
+    counts = {"total": 4, "todo": 2, "doing": 1, "done": 1, "overdue": 1}
+    assert client.get(f"/api/projects/{project_id}/summary").json() == counts
+    response = client.get(f"/api/projects/{project_id}", params={"include": "counts"})
+    assert response.json()["task_counts"] == counts
+    assert "tasks" not in response.json()
+
+    client.delete(f"/api/tasks/{ids[0]}")
+    assert client.get(f"/api/projects/{project_id}/summary").json()["doing"] == 0
+
+def test_summary_of_a_missing_project_is_404(client):
+    assert client.get("/api/projects/1/summary").status_code == 404
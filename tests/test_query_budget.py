@@ -0,0 +1,108 @@
+# tests/test_query_budget.py
+import importlib
+import logging
+
+import pytest
+from sqlalchemy import select
+
+from app.api.controllers import projects_controller
+from app.db.session import engine as app_engine
+from app.exceptions.base import QueryBudgetExceededError
+from app.metrics import registry, track_queries
+from app.metrics.query_budget import QUERY_REPEAT_THRESHOLD
+from app.models import Project
+from app.repositories import ProjectRepository
+
+# The module, which app.metrics shadows with its query_budget decorator
+budget_module = importlib.import_module("app.metrics.query_budget")
+
+BUDGETED = [
+    ("/api/projects/", {}),
+    ("/api/projects/", {"include": ["counts", "tasks"]}),
+    ("/api/projects/lookup", {"prefix": "proj", "fuzzy": "false"}),
+    ("/api/projects/{project_id}", {"include": ["counts", "tasks"]}),
+    ("/api/projects/{project_id}/summary", {}),
+    ("/api/projects/{project_id}/tasks", {"status": "todo", "sort": "deadline"}),
+    ("/api/tasks/export", {"project_id": "{project_id}"}),
+    ("/api/tasks/search", {"q": "task"}),
+    ("/api/tasks/{task_id}", {}),
+]
+
+def statements_run(route: str) -> float:
+    """SQL statements run by every GET `route` request so far."""
+    labels = {"method": "GET", "route": route}
+    return registry.get_sample_value("http_request_db_statements_sum", labels) or 0.0
+
+def endpoint_of(client, route: str):
+    return next(r.endpoint for r in client.app.routes if getattr(r, "path", None) == route)
+
+@pytest.fixture
+def ids(new_project, new_task):
+    """Projects and tasks enough for any N+1 to show."""
+    project_ids = [new_project(f"project {i}") for i in range(3)]
+    task_ids = [new_task(project_id, f"task {i}")["id"] for project_id in project_ids for i in range(3)]
+    return {"project_id": project_ids[0], "task_id": task_ids[0]}
+
+def assert_within_budget(client, ids, route, params):
+    url = route.format(**ids)
+    params = {key: value.format(**ids) if isinstance(value, str) else value for key, value in params.items()}
+    before = statements_run(route)
+
+    # Raise mode turns any statement past the budget into an error
+    response = client.get(url, params=params)
+
+    assert response.status_code == 200, response.text
+    assert 0 < statements_run(route) - before <= endpoint_of(client, route).query_budget
+
+@pytest.mark.parametrize("route, params", BUDGETED)
+def test_endpoints_stay_within_their_budget(client, ids, route, params):
+    assert_within_budget(client, ids, route, params)
+
+def test_fuzzy_lookup_stays_within_its_budget(client, ids, pg_trgm):
+    assert_within_budget(client, ids, "/api/projects/lookup", {"prefix": "projetc"})
+
+def test_an_endpoint_over_its_budget_fails(client, ids, monkeypatch):
+    monkeypatch.setattr(projects_controller.get_project, "query_budget", 0)
+
+    with pytest.raises(QueryBudgetExceededError, match="more than 0 SQL statements"):
+        client.get(f"/api/projects/{ids['project_id']}")
+
+def test_repeated_statements_in_a_request_are_flagged(client, ids, monkeypatch):
+    # A regression reading each listed project again, one query per row
+    get_project_rows = ProjectRepository.get_project_rows
+
+    def n_plus_one(self, *args, **kwargs):
+        rows = get_project_rows(self, *args, **kwargs)
+        for row in rows:
+            self.session.get(Project, row.id, populate_existing=True)
+        return rows
+
+    monkeypatch.setattr(ProjectRepository, "get_project_rows", n_plus_one)
+    monkeypatch.setattr(projects_controller.get_all_projects, "query_budget", 100)
+    for i in range(3, QUERY_REPEAT_THRESHOLD):
+        client.post("/api/projects/", json={"name": f"project {i}", "description": "d"})
+
+    with pytest.raises(QueryBudgetExceededError, match=r"same SQL statement .* \(N\+1\?\)"):
+        client.get("/api/projects/")
+
+def test_repeats_are_counted_regardless_of_parameters():
+    with track_queries("test", budget=None) as stats:
+        with app_engine.connect() as connection:
+            for i in range(QUERY_REPEAT_THRESHOLD - 1):
+                connection.execute(select(Project.name).where(Project.id == i))
+            with pytest.raises(QueryBudgetExceededError):
+                connection.execute(select(Project.name).where(Project.id == -1))
+
+    assert list(stats.fingerprints.values()) == [QUERY_REPEAT_THRESHOLD]
+
+def test_log_mode_warns_instead(monkeypatch, caplog):
+    monkeypatch.setattr(budget_module, "QUERY_BUDGET_MODE", "log")
+
+    with caplog.at_level(logging.WARNING, logger=budget_module.__name__):
+        with track_queries("test", budget=1) as stats:
+            with app_engine.connect() as connection:
+                for _ in range(3):
+                    connection.execute(select(1))
+
+    assert stats.statements == 3
+    assert [record.getMessage() for record in caplog.records] == ["'test' ran more than 1 SQL statements."]
@@ -0,0 +1,107 @@
+# tests/test_replicas.py
+import asyncio
+import math
+import os
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.requests import Request
+
+from app.api.stickiness import READ_AFTER_COOKIE, READ_AFTER_HEADER, read_after_lsn
+from app.db.replicas import Replica, ReplicaSet, format_lsn, parse_lsn
+
+# A streaming replica of the test database, for the tests measuring real lag
+TEST_REPLICA_DATABASE_URL = os.getenv("TEST_REPLICA_DATABASE_URL")
+
+def async_engine(url) -> AsyncEngine:
+    # NullPool: every asyncio.run() has its own event loop
+    return create_async_engine(make_url(url).set(drivername="postgresql+asyncpg"), poolclass=NullPool)
+
+def replica(name: str, lag_seconds: float = 0.0, replay_lsn: int = 0, engine=None) -> Replica:
+    replica = Replica(name, engine, session_factory=None)
+    replica.lag_seconds = lag_seconds
+    replica.replay_lsn = replay_lsn
+    return replica
+
+def request_with(headers: dict) -> Request:
+    raw = [(key.lower().encode(), value.encode()) for key, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+def test_lsn_round_trip():
+    assert parse_lsn("16/B374D848") == (0x16 << 32) | 0xB374D848
+    assert format_lsn(parse_lsn("16/B374D848")) == "16/B374D848"
+    assert parse_lsn("0/10") < parse_lsn("1/0")
+    with pytest.raises(ValueError):
+        parse_lsn("16B374D848")
+
+def test_reads_take_turns_among_replicas_within_the_lag_limit():
+    replicas = [replica("a"), replica("b", lag_seconds=5), replica("c", lag_seconds=1)]
+    replica_set = ReplicaSet(None, replicas, max_lag_seconds=2, check_seconds=1)
+
+    assert [replica_set.pick().name for _ in range(4)] == ["a", "c", "a", "c"]
+
+def test_reads_fall_back_to_the_primary():
+    replica_set = ReplicaSet(None, [replica("a", lag_seconds=math.inf)], max_lag_seconds=2, check_seconds=1)
+
+    assert replica_set.pick() is None
+
+def test_reads_after_a_write_only_go_to_replicas_past_it():
+    replicas = [replica("a", replay_lsn=parse_lsn("0/100")), replica("b", replay_lsn=parse_lsn("0/200"))]
+    replica_set = ReplicaSet(None, replicas, max_lag_seconds=2, check_seconds=1)
+
+    assert replica_set.pick(after_lsn=parse_lsn("0/180")).name == "b"
+    assert replica_set.pick(after_lsn=parse_lsn("0/300")) is None
+
+def test_read_after_lsn_comes_from_the_header_or_the_cookie():
+    assert read_after_lsn(request_with({READ_AFTER_HEADER: "0/200"})) == 0x200
+    assert read_after_lsn(request_with({"Cookie": f"{READ_AFTER_COOKIE}=0/300"})) == 0x300
+    assert read_after_lsn(request_with({READ_AFTER_HEADER: "garbage"})) is None
+    assert read_after_lsn(request_with({})) is None
+
+def test_unusable_replicas_get_no_reads(engine):
+    # The test database is a primary, and nothing listens on port 1
+    not_a_replica = replica("primary", engine=async_engine(engine.url))
+    unreachable = replica("gone", engine=async_engine("postgresql://postgres@127.0.0.1:1/todo"))
+
+    async def check():
+        primary = async_engine(engine.url)
+        replica_set = ReplicaSet(primary, [not_a_replica, unreachable], max_lag_seconds=2, check_seconds=1)
+        await replica_set.start()
+        await replica_set.stop()
+        return replica_set
+
+    replica_set = asyncio.run(check())
+
+    assert "not a streaming replica" in not_a_replica.error
+    assert unreachable.error.startswith("unreachable")
+    assert replica_set.lags() == {"primary": math.inf, "gone": math.inf}
+    assert replica_set.pick() is None
+
+@pytest.mark.skipif(TEST_REPLICA_DATABASE_URL is None, reason="TEST_REPLICA_DATABASE_URL is not set.")
+def test_a_replica_that_keeps_up_gets_reads(engine):
+    streaming = replica("replica", lag_seconds=math.inf, engine=async_engine(TEST_REPLICA_DATABASE_URL))
+
+    async def check():
+        primary = async_engine(engine.url)
+        replica_set = ReplicaSet(primary, [streaming], max_lag_seconds=2, check_seconds=1)
+        async with primary.begin() as connection:
+            await connection.execute(text("UPDATE counters SET value = value"))
+        # Replay is asynchronous: the write reaches the replica shortly
+        stop_at = time.monotonic() + 10
+        while streaming.lag_seconds > 0 and time.monotonic() < stop_at:
+            await replica_set.check()
+            await asyncio.sleep(0.1)
+        async with primary.connect() as connection:
+            primary_lsn = parse_lsn(await connection.scalar(text("SELECT pg_current_wal_lsn()::text")))
+        return replica_set, primary_lsn
+
+    replica_set, primary_lsn = asyncio.run(check())
+
+    assert streaming.error is None
+    assert streaming.lag_seconds == 0.0
+    assert streaming.replay_lsn <= primary_lsn
+    assert replica_set.pick() is streaming
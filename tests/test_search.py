@@ -0,0 +1,65 @@
+# tests/test_search.py
+def search(client, q, **params):
+    response = client.get("/api/tasks/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def titles(page):
+    return [task["title"] for task in page["items"]]
+
+def test_title_matches_rank_above_description_matches(client, new_project, new_task):
+    project_id = new_project()
+    new_task(project_id, "Groceries", description="buy milk")
+    new_task(project_id, "Milk the cow")
+    new_task(project_id, "Unrelated")
+
+    page = search(client, "milk")
+
+    assert titles(page) == ["Milk the cow", "Groceries"]
+    assert page["items"][0]["rank"] > page["items"][1]["rank"]
+
+def test_supports_phrases_or_and_exclusions(client, new_project, new_task):
+    project_id = new_project()
+    for title in ["paint the fence", "fence the paint", "paint the wall", "fix the roof"]:
+        new_task(project_id, title)
+
+    assert titles(search(client, '"paint the fence"')) == ["paint the fence"]
+    assert sorted(titles(search(client, "paint -fence"))) == ["paint the wall"]
+    assert sorted(titles(search(client, "wall or roof"))) == ["fix the roof", "paint the wall"]
+
+def test_is_scoped_by_project_and_status(client, new_project, new_task):
+    project_id = new_project()
+    kept = new_task(project_id, "report")
+    done = new_task(project_id, "report")
+    new_task(new_project("Other"), "report")
+    client.post("/api/tasks/bulk/status", json={"ids": [done["id"]], "status": "done"})
+
+    page = search(client, "report", project_id=project_id, status="todo")
+
+    assert [task["id"] for task in page["items"]] == [kept["id"]]
+    assert client.get("/api/tasks/search", params={"q": "report", "project_id": 999}).status_code == 404
+
+def test_results_are_paged_by_rank(client, new_project, new_task):
+    project_id = new_project()
+    for i in range(5):
+        new_task(project_id, "plan" if i % 2 else f"task {i}", description="plan the week")
+
+    first = search(client, "plan", limit=2)
+    second = search(client, "plan", limit=2, after=first["next_cursor"])
+    third = search(client, "plan", limit=2, after=second["next_cursor"])
+
+    items = first["items"] + second["items"] + third["items"]
+    assert len({task["id"] for task in items}) == 5
+    assert [task["rank"] for task in items] == sorted((task["rank"] for task in items), reverse=True)
+    assert third["next_cursor"] is None
+
+def test_projections_keep_the_rank(client, new_project, new_task):
+    new_task(new_project(), "alpha")
+
+    assert search(client, "alpha", fields="title")["items"] == [
+        {"title": "alpha", "rank": search(client, "alpha")["items"][0]["rank"]}
+    ]
+
+def test_bad_queries_and_cursors_are_rejected(client):
+    assert client.get("/api/tasks/search", params={"q": ""}).status_code == 422
+    assert client.get("/api/tasks/search", params={"q": "a", "after": "bad"}).status_code == 400
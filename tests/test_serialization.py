@@ -0,0 +1,56 @@
+# tests/test_serialization.py
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.api import serialization
+from app.api.schemas.responses import ProjectResponse, TaskResponse
+from app.api.serialization import dumps, record_encoder
+from app.models import Task
+
+DEADLINES = [
+    None,
+    datetime(2099, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+    datetime(2099, 6, 1, 8, 30, tzinfo=timezone(timedelta(hours=2))),
+]
+
+@pytest.fixture(params=["orjson", "pydantic"])
+def encoder(request, monkeypatch):
+    """Runs the test with orjson and with the fallback without it."""
+    if request.param == "pydantic":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed.")
+
+def test_records_encode_like_pydantic(encoder):
+    # Any object with the fields as attributes, like an ORM entity or a row
+    task = SimpleNamespace(
+        id=1, project_id=2, title="Café ☕", description='"quoted"\n', status="todo",
+        deadline=DEADLINES[2], created_at=DEADLINES[1], closed_at=None,
+    )
+
+    expected = TaskResponse.model_validate(task).model_dump_json().encode()
+    assert dumps(record_encoder(TaskResponse)(task)) == expected
+
+def test_list_responses_match_the_validated_models(client, new_project, new_task, session, encoder):
+    project_id = new_project()
+    for i, deadline in enumerate(DEADLINES):
+        task = new_task(project_id, f"tâche {i}")
+        if deadline is not None:
+            client.patch(f"/api/tasks/{task['id']}", json={"deadline": deadline.date().isoformat()})
+    client.post("/api/tasks/bulk/status", json={"filter": {"project_id": project_id}, "status": "done"})
+
+    tasks = session.scalars(select(Task).order_by(Task.id)).all()
+    expected = [TaskResponse.model_validate(task).model_dump(mode="json") for task in tasks]
+    assert client.get(f"/api/projects/{project_id}/tasks").json()["items"] == expected
+    assert client.get("/api/projects/").json()["items"] == [
+        ProjectResponse(id=project_id, name="Project", description="description").model_dump(mode="json")
+    ]
+
+def test_record_encoder_reads_only_the_requested_fields():
+    task = SimpleNamespace(id=1, title="title", status="doing")
+
+    assert record_encoder(TaskResponse, ["status", "id"])(task) == {"id": 1, "status": "doing"}
+    assert record_encoder(TaskResponse, ["title"])(task) == {"title": "title"}
@@ -0,0 +1,79 @@
+# tests/test_task_list.py
+import pytest
+
+from app.api.pagination import decode_sort_cursor, encode_cursor
+from app.exceptions.base import ValidationError
+
+DEADLINES = ["2099-03-01", None, "2099-01-01", None, "2099-02-01"]
+
+@pytest.fixture
+def tasks(client, new_project, new_task):
+    """A project's tasks, some without a deadline, in creation order."""
+    project_id = new_project()
+    created = [
+        new_task(project_id, f"task {i}", **({"deadline": deadline} if deadline else {}))
+        for i, deadline in enumerate(DEADLINES)
+    ]
+    return project_id, [task["id"] for task in created]
+
+def list_ids(client, project_id, **params):
+    """IDs of every task listed with `params`, read two to a page."""
+    url = f"/api/projects/{project_id}/tasks"
+    page = client.get(url, params={**params, "limit": 2}).json()
+    ids = [task["id"] for task in page["items"]]
+    while page["next_cursor"] is not None:
+        page = client.get(url, params={**params, "limit": 2, "after": page["next_cursor"]}).json()
+        ids += [task["id"] for task in page["items"]]
+    return ids
+
+def test_sorts_by_deadline_with_missing_deadlines_last(client, tasks):
+    project_id, ids = tasks
+
+    assert list_ids(client, project_id, sort="deadline") == [ids[2], ids[4], ids[0], ids[1], ids[3]]
+    assert list_ids(client, project_id, sort="deadline", order="desc") == [
+        ids[3], ids[1], ids[0], ids[4], ids[2]
+    ]
+
+def test_sorts_by_creation_newest_first(client, tasks):
+    project_id, ids = tasks
+
+    assert list_ids(client, project_id, sort="created_at", order="desc") == ids[::-1]
+
+def test_filters_by_status(client, tasks):
+    project_id, ids = tasks
+    client.post("/api/tasks/bulk/status", json={"ids": ids[:2], "status": "doing"})
+    client.post("/api/tasks/bulk/status", json={"ids": [ids[2]], "status": "done"})
+
+    assert list_ids(client, project_id, status="doing") == ids[:2]
+    assert list_ids(client, project_id, status=["todo", "done"]) == ids[2:]
+    assert client.get(f"/api/projects/{project_id}/tasks", params={"status": "later"}).status_code == 422
+
+def test_filters_by_deadline_range(client, tasks):
+    project_id, ids = tasks
+
+    params = {"deadline_after": "2099-01-15T00:00:00Z", "deadline_before": "2099-03-15T00:00:00Z"}
+    assert list_ids(client, project_id, sort="deadline", **params) == [ids[4], ids[0]]
+
+def test_filters_by_closed(client, tasks):
+    project_id, ids = tasks
+    client.post("/api/tasks/bulk/status", json={"ids": [ids[1]], "status": "done"})
+
+    assert list_ids(client, project_id, closed=True) == [ids[1]]
+    assert list_ids(client, project_id, closed=False) == [ids[0], *ids[2:]]
+
+def test_a_cursor_of_another_sort_order_is_400(client, tasks):
+    project_id, _ = tasks
+    cursor = client.get(
+        f"/api/projects/{project_id}/tasks", params={"sort": "deadline", "limit": 1}
+    ).json()["next_cursor"]
+
+    response = client.get(f"/api/projects/{project_id}/tasks", params={"sort": "created_at", "after": cursor})
+    assert response.status_code == 400
+
+def test_sort_cursor_restores_datetimes():
+    cursor = encode_cursor({"sort": "deadline", "value": "2099-01-01T00:00:00+00:00", "id": 3})
+
+    value, after_id = decode_sort_cursor(cursor, "deadline")
+    assert (value.isoformat(), after_id) == ("2099-01-01T00:00:00+00:00", 3)
+    with pytest.raises(ValidationError):
+        decode_sort_cursor(encode_cursor({"sort": "deadline", "value": "soon", "id": 3}), "deadline")
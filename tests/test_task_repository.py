@@ -0,0 +1,77 @@
+# tests/test_task_repository.py
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db.unit_of_work import unit_of_work
+from app.models import Project, Task
+from app.repositories import ProjectRepository, TaskRepository
+
+MAX_TASKS = 4
+
+@pytest.fixture
+def project_id(session: Session) -> int:
+    with unit_of_work(session):
+        return ProjectRepository(session).create("Project", "description", 10).id
+
+def create(session: Session, project_id: int, title: str = "task"):
+    with unit_of_work(session):
+        task = TaskRepository(session).create(project_id, title, "description", MAX_TASKS)
+        return None if task is None else task.id
+
+def test_create_stops_at_the_limit(session, project_id, assert_counters_match):
+    ids = [create(session, project_id, f"task {i}") for i in range(MAX_TASKS + 2)]
+
+    assert all(ids[:MAX_TASKS])
+    assert ids[MAX_TASKS:] == [None, None]
+    assert_counters_match(project_id)
+
+def test_create_in_a_missing_project_returns_none(session, project_id):
+    assert create(session, project_id + 1) is None
+
+def test_concurrent_creates_never_exceed_the_limit(session, project_id, concurrently, assert_counters_match):
+    ids = concurrently(lambda worker, i: create(worker, project_id, f"task {i}"), 10)
+
+    assert sum(task_id is not None for task_id in ids) == MAX_TASKS
+    assert_counters_match(project_id)
+    assert session.get(Project, project_id).task_count == MAX_TASKS
+
+def test_create_many_is_all_or_nothing(session, project_id, assert_counters_match):
+    create(session, project_id)
+    tasks = [(f"task {i}", "description", None) for i in range(MAX_TASKS)]
+
+    with unit_of_work(session):
+        assert TaskRepository(session).create_many(project_id, tasks, MAX_TASKS) is None
+    with unit_of_work(session):
+        created = TaskRepository(session).create_many(project_id, tasks[:MAX_TASKS - 1], MAX_TASKS)
+
+    assert [task.title for task in created] == [title for title, _, _ in tasks[:MAX_TASKS - 1]]
+    assert_counters_match(project_id)
+
+def test_status_changes_and_deletes_move_the_counters(session, project_id, assert_counters_match):
+    ids = [create(session, project_id, f"task {i}") for i in range(3)]
+
+    with unit_of_work(session):
+        repo = TaskRepository(session)
+        assert repo.update_status_many("done", task_ids=ids[:2]) == ids[:2]
+    assert_counters_match(project_id)
+
+    with unit_of_work(session):
+        repo = TaskRepository(session)
+        repo.delete(session.get(Task, ids[0]))
+        repo.delete_many(task_ids=[ids[2]])
+    assert_counters_match(project_id)
+
+    # The freed slots can be used again
+    assert create(session, project_id) is not None
+
+def test_rebuild_task_counters_corrects_drifted_counters(session, project_id, assert_counters_match):
+    create(session, project_id)
+    with unit_of_work(session):
+        session.execute(update(Project).where(Project.id == project_id).values(task_count=7, todo_count=0))
+
+    with unit_of_work(session):
+        assert TaskRepository(session).rebuild_task_counters() == 1
+    assert_counters_match(project_id)
+    with unit_of_work(session):
+        assert TaskRepository(session).rebuild_task_counters() == 0
@@ -0,0 +1,91 @@
+# tests/test_tasks_api.py
+
+def test_task_lifecycle(client, new_project, new_task):
+    project_id = new_project()
+    task = new_task(project_id, "Write tests", deadline="2099-01-01")
+
+    assert task["status"] == "todo"
+    assert task["project_id"] == project_id
+    assert client.get(f"/api/tasks/{task['id']}").json() == task
+
+    response = client.patch(f"/api/tasks/{task['id']}", json={"status": "doing", "title": "Tested"})
+    assert response.json() == {**task, "status": "doing", "title": "Tested"}
+
+    assert client.delete(f"/api/tasks/{task['id']}").status_code == 204
+    assert client.get(f"/api/tasks/{task['id']}").status_code == 404
+
+def test_create_task_in_a_missing_project_is_404(client):
+    response = client.post("/api/projects/1/tasks", json={"title": "t", "description": "d"})
+    assert response.status_code == 404
+
+def test_create_task_rejects_a_past_deadline(client, new_project):
+    project_id = new_project()
+
+    response = client.post(
+        f"/api/projects/{project_id}/tasks",
+        json={"title": "t", "description": "d", "deadline": "2000-01-01"},
+    )
+    assert response.status_code == 400
+
+def test_bulk_create_reports_invalid_items_and_creates_the_rest(client, new_project):
+    project_id = new_project()
+    items = [
+        {"title": "first", "description": "d"},
+        {"title": "late", "description": "d", "deadline": "2000-01-01"},
+        {"title": "third", "description": "d", "deadline": "2099-01-01"},
+    ]
+
+    response = client.post(f"/api/projects/{project_id}/tasks/bulk", json=items)
+
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert [result["index"] for result in body["results"]] == [0, 1, 2]
+    assert body["results"][1]["task"] is None and body["results"][1]["error"]
+    assert [body["results"][i]["task"]["title"] for i in (0, 2)] == ["first", "third"]
+
+def test_bulk_create_over_the_limit_creates_nothing(client, new_project, monkeypatch):
+    monkeypatch.setenv("MAX_TASKS_PER_PROJECT", "2")
+    project_id = new_project()
+    items = [{"title": f"task {i}", "description": "d"} for i in range(3)]
+
+    response = client.post(f"/api/projects/{project_id}/tasks/bulk", json=items)
+
+    assert response.status_code == 400
+    assert client.get(f"/api/projects/{project_id}/tasks").json()["items"] == []
+
+def test_bulk_status_change_by_ids_and_filter(client, new_project, new_task, assert_counters_match):
+    project_id = new_project()
+    other_id = new_project("Other")
+    ids = [new_task(project_id, f"task {i}")["id"] for i in range(3)]
+    other = new_task(other_id)
+
+    response = client.post("/api/tasks/bulk/status", json={"ids": ids[:2], "status": "doing"})
+    assert response.json() == {"count": 2, "ids": ids[:2]}
+
+    # Only tasks not already done change, and only in the filtered project
+    response = client.post(
+        "/api/tasks/bulk/status", json={"filter": {"project_id": project_id}, "status": "done"}
+    )
+    assert sorted(response.json()["ids"]) == ids
+    assert client.post("/api/tasks/bulk/status", json={"ids": ids, "status": "done"}).json()["count"] == 0
+
+    assert all(client.get(f"/api/tasks/{task_id}").json()["closed_at"] for task_id in ids)
+    assert client.get(f"/api/tasks/{other['id']}").json()["status"] == "todo"
+    assert_counters_match(project_id)
+
+def test_bulk_delete_by_filter(client, new_project, new_task, assert_counters_match):
+    project_id = new_project()
+    ids = [new_task(project_id, f"task {i}")["id"] for i in range(3)]
+    client.post("/api/tasks/bulk/status", json={"ids": [ids[0]], "status": "doing"})
+
+    response = client.post(
+        "/api/tasks/bulk/delete", json={"filter": {"project_id": project_id, "status": ["todo"]}}
+    )
+
+    assert sorted(response.json()["ids"]) == ids[1:]
+    assert [task["id"] for task in client.get(f"/api/projects/{project_id}/tasks").json()["items"]] == [ids[0]]
+    assert_counters_match(project_id)
+
+def test_bulk_changes_without_a_selection_are_refused(client):
+    assert client.post("/api/tasks/bulk/status", json={"status": "done"}).status_code == 400
+    assert client.post("/api/tasks/bulk/delete", json={}).status_code == 400
@@ -0,0 +1,73 @@
+# tests/test_updates.py
+from app.db.unit_of_work import unit_of_work
+from app.metrics import registry
+from app.models import Project
+from app.repositories import TaskRepository
+
+def statements_run(method: str, route: str) -> float:
+    labels = {"method": method, "route": route}
+    return registry.get_sample_value("http_request_db_statements_sum", labels) or 0.0
+
+def test_task_patch_is_one_statement(client, new_project, new_task, assert_counters_match):
+    project_id = new_project()
+    task = new_task(project_id)
+    before = statements_run("PATCH", "/api/tasks/{task_id}")
+
+    response = client.patch(f"/api/tasks/{task['id']}", json={"status": "doing", "deadline": "2099-02-01"})
+
+    assert statements_run("PATCH", "/api/tasks/{task_id}") - before == 1
+    assert (response.json()["status"], response.json()["deadline"][:10]) == ("doing", "2099-02-01")
+    assert client.get(f"/api/tasks/{task['id']}").json() == response.json()
+    assert_counters_match(project_id)
+
+def test_project_put_is_one_update(client, new_project):
+    project_id = new_project("Inbox")
+    before = statements_run("PUT", "/api/projects/{project_id}")
+
+    response = client.put(f"/api/projects/{project_id}", json={"description": "new"})
+
+    # The UPDATE ... RETURNING and the NOTIFY invalidating other processes' caches
+    assert statements_run("PUT", "/api/projects/{project_id}") - before == 2
+    assert response.json() == {"id": project_id, "name": "Inbox", "description": "new"}
+
+    response = client.put(f"/api/projects/{project_id}", json={"name": "Renamed"})
+    assert response.json() == {"id": project_id, "name": "Renamed", "description": "new"}
+    assert client.get(f"/api/projects/{project_id}").json() == response.json()
+
+def test_updates_of_missing_rows_are_404(client):
+    assert client.patch("/api/tasks/1", json={"title": "x"}).status_code == 404
+    assert client.put("/api/projects/1", json={"name": "x"}).status_code == 404
+
+def test_rename_onto_a_taken_name_is_400(client, new_project):
+    new_project("Inbox")
+    project_id = new_project("Work")
+
+    response = client.put(f"/api/projects/{project_id}", json={"name": "INBOX", "description": "new"})
+
+    assert response.status_code == 400
+    assert client.get(f"/api/projects/{project_id}").json()["description"] == "description"
+
+def test_task_update_moves_the_project_version(session, new_project, new_task):
+    project_id = new_project()
+    task = new_task(project_id)
+    version = session.get(Project, project_id).version
+
+    with unit_of_work(session):
+        updated = TaskRepository(session).update(task["id"], new_status="done")
+
+    assert updated.status == "done"
+    session.expire_all()
+    project = session.get(Project, project_id)
+    assert project.version == version + 1
+    assert (project.todo_count, project.done_count) == (0, 1)
+
+def test_task_update_without_changes_writes_nothing(session, new_project, new_task):
+    project_id = new_project()
+    task = new_task(project_id)
+    version = session.get(Project, project_id).version
+
+    with unit_of_work(session):
+        assert TaskRepository(session).update(task["id"]).title == task["title"]
+
+    session.expire_all()
+    assert session.get(Project, project_id).version == version